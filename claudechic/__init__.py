@@ -1,10 +1,19 @@
 """Claude Chic - A stylish terminal UI for Claude Code."""
 
-from importlib.metadata import version
+from __future__ import annotations
 
-from claudechic.app import ChatApp
-from claudechic.theme import CHIC_THEME
-from claudechic.protocols import AgentManagerObserver, AgentObserver, PermissionHandler
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from claudechic.app import ChatApp
+    from claudechic.protocols import (
+        AgentManagerObserver,
+        AgentObserver,
+        PermissionHandler,
+    )
+    from claudechic.theme import CHIC_THEME
+
+    __version__: str
 
 __all__ = [
     "ChatApp",
@@ -13,4 +22,30 @@ __all__ = [
     "AgentObserver",
     "PermissionHandler",
 ]
-__version__ = version("claudechic")
+
+# Public names resolved on first access, so `claudechic --version` and the
+# CLI's argument parsing don't pay for importing Textual and the SDK
+# (__version__ likewise defers reading package metadata)
+_LAZY_EXPORTS = {
+    "ChatApp": "claudechic.app",
+    "CHIC_THEME": "claudechic.theme",
+    "AgentManagerObserver": "claudechic.protocols",
+    "AgentObserver": "claudechic.protocols",
+    "PermissionHandler": "claudechic.protocols",
+}
+
+
+def __getattr__(name: str):
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value = globals()[name] = version("claudechic")
+        return value
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
@@ -1,24 +1,32 @@
 """Entry point for claudechic CLI."""
 
 import argparse
+import functools
 import os
 import sys
-from importlib.metadata import version
 
-from claudechic.app import ChatApp
-from claudechic.errors import setup_logging
 
-# Set up file logging to ~/claudechic.log
-setup_logging()
+class _VersionAction(argparse.Action):
+    """--version that only reads package metadata when actually requested."""
 
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, **kwargs):
+        super().__init__(option_strings, dest, nargs=0, **kwargs)
 
-def main():
+    def __call__(self, parser, namespace, values, option_string=None):
+        from importlib.metadata import version
+
+        parser.exit(message=f"claudechic {version('claudechic')}\n")
+
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; in-process callers reuse it."""
     parser = argparse.ArgumentParser(description="Claude Chic")
     parser.add_argument(
         "--version",
         "-V",
-        action="version",
-        version=f"claudechic {version('claudechic')}",
+        action=_VersionAction,
+        help="show program's version number and exit",
     )
     parser.add_argument(
         "--resume", "-r", action="store_true", help="Resume the most recent session"
@@ -47,7 +55,18 @@ def main():
         help="Auto-approve all tool uses without prompting (use in sandboxed environments)",
     )
     parser.add_argument("prompt", nargs="*", help="Initial prompt to send")
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    args = _build_parser().parse_args()
+
+    # Heavy imports (Textual, the SDK) wait until we know the TUI will run,
+    # so --version/--help and argument errors return immediately
+    from claudechic.errors import setup_logging
+
+    # Set up file logging to ~/claudechic.log
+    setup_logging()
 
     initial_prompt = " ".join(args.prompt) if args.prompt else None
 
@@ -72,12 +91,17 @@ def main():
                 print(f"  {name}")
             sys.exit(1)
 
-    # Set terminal window title (before Textual takes over stdout)
     from pathlib import Path
-    from rich.console import Console
-    from rich.control import Control
 
-    Console().control(Control.title(f"Claude Chic · {Path.cwd().name}"))
+    # Set terminal window title (before Textual takes over stdout); skip
+    # Rich's terminal probing when there's no terminal to title
+    if sys.stdout.isatty() and os.environ.get("TERM") != "dumb":
+        from rich.console import Console
+        from rich.control import Control
+
+        Console().control(Control.title(f"Claude Chic · {Path.cwd().name}"))
+
+    from claudechic.app import ChatApp
 
     try:
         app = ChatApp(
@@ -94,11 +118,12 @@ def main():
         import tempfile
         import traceback
 
+        # Format once; the same text goes to the crash log and to stderr
+        tb = traceback.format_exc()
         crash_log = Path(tempfile.gettempdir()) / "claudechic-crash.log"
-        with open(crash_log, "w", encoding="utf-8") as f:
-            traceback.print_exc(file=f)
+        crash_log.write_text(tb, encoding="utf-8")
         # Print standard traceback (not rich's fancy one) and exit
-        traceback.print_exc()
+        sys.stderr.write(tb)
         sys.exit(1)
     finally:
         # Windows: suppress stderr during interpreter shutdown to silence asyncio
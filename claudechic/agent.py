@@ -50,7 +50,7 @@ log = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageAttachment:
     """An image attached to a message."""
 
@@ -60,7 +60,7 @@ class ImageAttachment:
     base64_data: str
 
 
-@dataclass
+@dataclass(slots=True)
 class UserContent:
     """A user message in chat history."""
 
@@ -68,7 +68,7 @@ class UserContent:
     images: list[ImageAttachment] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolUse:
     """A tool use within an assistant turn."""
 
@@ -80,25 +80,33 @@ class ToolUse:
     is_error: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TextBlock:
     """A text block within an assistant turn."""
 
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AssistantContent:
     """An assistant message in chat history.
 
     Contains an ordered list of blocks (TextBlock or ToolUse) to preserve
     the original interleaving of text and tool uses.
+
+    tool_use_count is kept in step with blocks by whoever appends a ToolUse,
+    so checkpoint building doesn't have to rescan every block.
     """
 
     blocks: list[TextBlock | ToolUse] = field(default_factory=list)
+    tool_use_count: int = 0
+
+    def __post_init__(self) -> None:
+        if self.blocks and not self.tool_use_count:
+            self.tool_use_count = sum(type(b) is ToolUse for b in self.blocks)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatItem:
     """A single item in chat history."""
 
@@ -342,6 +350,7 @@ class Agent:
                         input=m.get("input", {}),
                     )
                 )
+                current_assistant.tool_use_count += 1
 
         # Flush final assistant content
         if current_assistant is not None:
@@ -694,6 +703,7 @@ Key Rules:
                 ChatItem(role="assistant", content=self._current_assistant)
             )
         self._current_assistant.blocks.append(tool)
+        self._current_assistant.tool_use_count += 1
         if self.observer:
             self.observer.on_message_updated(self)
             self.observer.on_tool_use(self, tool)
@@ -858,10 +868,9 @@ Key Rules:
         if result == PermissionChoice.DENY:
             return PermissionResultDeny(message="User cancelled questions")
 
-        # Result should be the answers dict (stored in request._result by UI)
-        answers = getattr(request, "_answers", {})
+        # Answers dict is stored on the request by the UI
         return PermissionResultAllow(
-            updated_input={"questions": questions, "answers": answers}
+            updated_input={"questions": questions, "answers": request._answers}
         )
 
     # -----------------------------------------------------------------------
@@ -951,7 +960,6 @@ Key Rules:
         # Enrich with output files if we have them
         for proc in processes:
             if proc.command in self._background_outputs:
-                # Create new instance with output_file set
                 proc.output_file = self._background_outputs[proc.command]
 
         return processes
@@ -41,6 +41,8 @@ class AgentManager:
         """
         self.agents: dict[str, Agent] = {}
         self.active_id: str | None = None
+        # worktree branch -> first agent opened in it (kept in step with agents)
+        self._by_worktree: dict[str, Agent] = {}
         self._options_factory = options_factory
 
         # Protocol-based observers (set by ChatApp)
@@ -68,6 +70,22 @@ class AgentManager:
                 return agent
         return None
 
+    def find_by_worktree(self, worktree: str) -> Agent | None:
+        """Find the agent running in a worktree branch."""
+        return self._by_worktree.get(worktree)
+
+    def find_main(self) -> Agent | None:
+        """Find the first agent not running in a worktree."""
+        for agent in self.agents.values():
+            if agent.worktree is None:
+                return agent
+        return None
+
+    def _register(self, agent: Agent) -> None:
+        self.agents[agent.id] = agent
+        if agent.worktree:
+            self._by_worktree.setdefault(agent.worktree, agent)
+
     def create_unconnected(
         self,
         name: str,
@@ -96,7 +114,7 @@ class AgentManager:
         self._wire_agent_callbacks(agent)
 
         # Register agent
-        self.agents[agent.id] = agent
+        self._register(agent)
         log.info(f"Created agent '{name}' (id={agent.id}, cwd={cwd})")
 
         if self.manager_observer:
@@ -144,7 +162,7 @@ class AgentManager:
         await agent.connect(options, resume=resume)
 
         # Register agent
-        self.agents[agent.id] = agent
+        self._register(agent)
         log.info(f"Created agent '{name}' (id={agent.id}, cwd={cwd})")
 
         if self.manager_observer:
@@ -218,6 +236,13 @@ class AgentManager:
         if not agent:
             log.warning(f"Cannot close unknown agent: {agent_id}")
             return
+        if agent.worktree and self._by_worktree.get(agent.worktree) is agent:
+            del self._by_worktree[agent.worktree]
+            # Hand the worktree to any other agent still open in it
+            for other in self.agents.values():
+                if other.worktree == agent.worktree:
+                    self._by_worktree[agent.worktree] = other
+                    break
 
         name = agent.name
         was_active = agent_id == self.active_id
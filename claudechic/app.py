@@ -50,13 +50,15 @@ from claudechic.sessions import (
 )
 from claudechic.features.diff import EditFileRequested
 from claudechic.features.worktree import list_worktrees
-from claudechic.commands import BARE_WORDS, handle_command
+from claudechic.commands import handle_command
 from claudechic.features.worktree.commands import on_response_complete_finish
 from claudechic.permissions import PermissionRequest, PermissionResponse
+from claudechic.processes import ProcessWatcher
 from claudechic.agent import Agent, ImageAttachment, ToolUse
 from claudechic.agent_manager import AgentManager
 from claudechic.analytics import capture
-from claudechic.config import CONFIG, NEW_INSTALL, save as save_config
+from claudechic import config
+from claudechic.config import save as save_config
 from claudechic.enums import AgentStatus, PermissionChoice, ToolName
 from claudechic.mcp import set_app, create_chic_server
 from claudechic.file_index import FileIndex
@@ -194,6 +196,11 @@ class ChatApp(App):
         self._input_container: Vertical | None = None
         self._chat_input: ChatInput | None = None
         self._status_footer: StatusFooter | None = None
+        # Last Ctrl+C press (monotonic), for double-tap to quit
+        self._last_quit_time = 0.0
+        # Background process polling, with backoff while nothing changes
+        self._process_watcher = ProcessWatcher()
+        self._process_poll_timer: Timer | None = None
         # Track running shell command for Ctrl+C cancellation
         self._shell_process: asyncio.subprocess.Process | None = None
         # Pending shell cancel handlers (widget_id -> callback)
@@ -615,6 +622,11 @@ class ChatApp(App):
 
         Note: can_use_tool is set by Agent.connect() to its own handler,
         which routes to permission_ui_callback set by AgentManager.
+
+        system_prompt and tools are deliberately left to the CLI: it places
+        the prompt-cache breakpoints on its own system/tool prefix, and
+        resumed sessions get byte-identical options so that prefix stays
+        cache-hot across resumes.
         """
         # Override ANTHROPIC_API_KEY to prefer subscription auth,
         # unless ANTHROPIC_BASE_URL is set (SSO proxy needs the key)
@@ -645,7 +657,7 @@ class ChatApp(App):
     async def on_mount(self) -> None:
         # Track app start (and install if new user)
         self._app_start_time = time.time()
-        if NEW_INSTALL:
+        if config.NEW_INSTALL:
             self.run_worker(capture("app_installed"))
         self.run_worker(capture("app_started", resumed=bool(self._resume_on_start)))
 
@@ -658,7 +670,9 @@ class ChatApp(App):
         start_sampler()
 
         # Start background process polling
-        self.set_interval(2.0, self._poll_background_processes)
+        self._process_poll_timer = self.set_timer(
+            self._process_watcher.interval, self._poll_background_processes
+        )
 
         # Register app for MCP tools
         set_app(self)
@@ -674,7 +688,7 @@ class ChatApp(App):
         self.register_theme(CHIC_LIGHT_THEME)
         for theme in load_custom_themes():
             self.register_theme(theme)
-        self.theme = self._theme_override or CONFIG.get("theme") or "chic"
+        self.theme = self._theme_override or config.CONFIG.get("theme") or "chic"
 
         # Warn if running in YOLO mode
         if self._skip_permissions:
@@ -704,7 +718,7 @@ class ChatApp(App):
         self.chat_input.focus()
 
         # Initialize vi mode if enabled in config
-        if CONFIG.get("vi-mode"):
+        if config.CONFIG.get("vi-mode"):
             self._update_vi_mode(True)
 
         # Refresh roborev reviews for initial agent
@@ -719,8 +733,8 @@ class ChatApp(App):
         """Save theme preference when changed (skip if overridden by CLI flag)."""
         if self._theme_override:
             return
-        if theme != CONFIG.get("theme"):
-            CONFIG["theme"] = theme
+        if theme != config.CONFIG.get("theme"):
+            config.CONFIG["theme"] = theme
             save_config()
 
     @work(exclusive=True, group="connect")
@@ -856,13 +870,24 @@ class ChatApp(App):
 
     def _poll_background_processes(self) -> None:
         """Poll for background processes and update the panel and footer."""
-        agent = self._agent
-        if not agent:
-            return
-        processes = agent.get_background_processes()
-        self.process_panel.update_processes(processes)
-        self.status_footer.update_processes(processes)
-        self._position_right_sidebar()
+        processes = []
+        if agent := self._agent:
+            processes = agent.get_background_processes()
+            self.process_panel.update_processes(processes)
+            self.status_footer.update_processes(processes)
+            self._position_right_sidebar()
+        self._process_poll_timer = self.set_timer(
+            self._process_watcher.next_delay(processes),
+            self._poll_background_processes,
+        )
+
+    def _wake_process_poll(self) -> None:
+        """Poll processes at the base interval again after an idle backoff."""
+        if self._process_watcher.reset() and self._process_poll_timer:
+            self._process_poll_timer.stop()
+            self._process_poll_timer = self.set_timer(
+                self._process_watcher.interval, self._poll_background_processes
+            )
 
     _review_poll_timer: Timer | None = None
     _review_poll_agent_id: str | None = None  # agent that owns the poll timer
@@ -958,7 +983,7 @@ class ChatApp(App):
 
     def on_chat_input_vi_mode_changed(self, event: ChatInput.ViModeChanged) -> None:
         """Update footer when vi mode changes."""
-        enabled = CONFIG.get("vi-mode", False)
+        enabled = config.CONFIG.get("vi-mode", False)
         self.status_footer.update_vi_mode(event.mode if enabled else None, enabled)
 
     def _handle_prompt(self, prompt: str) -> None:
@@ -973,12 +998,7 @@ class ChatApp(App):
             append_to_history(prompt, agent.cwd, agent.session_id or agent.id)
 
         # Try slash commands, bang commands, and special keywords first
-        stripped = prompt.strip()
-        if (
-            stripped.startswith("/")
-            or stripped.startswith("!")
-            or stripped in BARE_WORDS
-        ) and handle_command(self, prompt):
+        if handle_command(self, prompt):
             return
 
         # Track message sent
@@ -1206,8 +1226,8 @@ class ChatApp(App):
         compact = height < self.COMPACT_HEIGHT
         try:
             for widget in [
-                self.query_one("StatusFooter"),
-                self.query_one("#input-container"),
+                self.status_footer,
+                self.input_container,
                 *self.query(".chat-view"),
             ]:
                 # set_class is a no-op if state already matches
@@ -1337,8 +1357,7 @@ class ChatApp(App):
             widget = ContextReport(event.content)
         else:
             # Fallback to system message for other command output
-            widget = ChatMessage(event.content)
-            widget.add_class("system-message")
+            widget = ChatMessage(event.content, classes="system-message")
 
         chat_view.mount(widget)
         chat_view.scroll_if_tailing()
@@ -1461,8 +1480,8 @@ class ChatApp(App):
                 chat_input.text = ""
                 return
 
-        now = time.time()
-        if hasattr(self, "_last_quit_time") and now - self._last_quit_time < 1.0:
+        now = time.monotonic()
+        if now - self._last_quit_time < 1.0:
             self.run_worker(self._cleanup_and_exit())
         else:
             self._last_quit_time = now
@@ -2268,6 +2287,7 @@ class ChatApp(App):
     def on_agent_switched(self, new_agent: Agent, old_agent: Agent | None) -> None:
         """Handle agent switch from AgentManager."""
         log.info(f"Switched to agent: {new_agent.name}")
+        self._wake_process_poll()
 
         # Use update=False to defer CSS recalculation, refresh_css at end
         if old_agent:
@@ -2495,6 +2515,8 @@ class ChatApp(App):
         # Clear pending slash command if Skill tool was invoked (valid command)
         if tool.name == ToolName.SKILL:
             self._pending_slash_commands.pop(agent.id, None)
+        # Tools may spawn shells; don't leave them unseen behind a backoff
+        self._wake_process_poll()
 
         block = ToolUseBlock(id=tool.id, name=tool.name, input=tool.input)
         self.post_message(
@@ -2600,7 +2622,7 @@ class ChatApp(App):
                 return PermissionResponse(PermissionChoice.DENY)
 
             # Store answers on request for Agent to retrieve
-            request._answers = answers  # type: ignore[attr-defined]
+            request._answers = answers
             return PermissionResponse(PermissionChoice.ALLOW)
 
         # Special handling for ExitPlanMode - custom options
@@ -6,14 +6,18 @@ conversation and/or file state.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from claudechic.agent import Agent, AssistantContent, UserContent
 
+# Runs of non-whitespace, as str.split() would produce them
+_WORD_RE = re.compile(r"\S+")
 
-@dataclass
+
+@dataclass(slots=True)
 class Checkpoint:
     """A checkpoint representing state at a user message.
 
@@ -46,6 +50,7 @@ def get_checkpoints(agent: "Agent") -> list[Checkpoint]:
     """
     checkpoints: list[Checkpoint] = []
     user_msg_index = 0
+    checkpoint_uuids = agent.checkpoint_uuids
 
     # Track tool uses between user messages
     tool_count = 0
@@ -64,8 +69,8 @@ def get_checkpoints(agent: "Agent") -> list[Checkpoint]:
 
             # Get UUID if available
             uuid = None
-            if user_msg_index < len(agent.checkpoint_uuids):
-                uuid = agent.checkpoint_uuids[user_msg_index]
+            if user_msg_index < len(checkpoint_uuids):
+                uuid = checkpoint_uuids[user_msg_index]
 
             checkpoint = Checkpoint(
                 index=user_msg_index,
@@ -79,12 +84,8 @@ def get_checkpoints(agent: "Agent") -> list[Checkpoint]:
 
         elif item.role == "assistant":
             # Count tool uses in assistant response
-            from claudechic.agent import ToolUse
-
             assistant_content: "AssistantContent" = item.content  # type: ignore
-            for block in assistant_content.blocks:
-                if isinstance(block, ToolUse):
-                    tool_count += 1
+            tool_count += assistant_content.tool_use_count
 
     # Finalize last checkpoint's tool count
     if pending_checkpoint is not None:
@@ -95,8 +96,16 @@ def get_checkpoints(agent: "Agent") -> list[Checkpoint]:
 
 def _get_preview(text: str, max_length: int = 50) -> str:
     """Get preview of text for display, truncating if needed."""
-    # Remove leading/trailing whitespace and collapse internal whitespace
-    preview = " ".join(text.split())
+    # Collapse whitespace word by word and stop once past max_length, so a
+    # pasted file isn't split in full just to show its first few words
+    words: list[str] = []
+    length = -1
+    for match in _WORD_RE.finditer(text):
+        words.append(match.group())
+        length += len(words[-1]) + 1
+        if length > max_length:
+            break
+    preview = " ".join(words)
     if len(preview) > max_length:
         return preview[: max_length - 1] + "\u2026"  # Unicode ellipsis
     return preview
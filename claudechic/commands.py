@@ -9,18 +9,23 @@ It's used by autocomplete (app.py) and help (help_data.py).
 
 from __future__ import annotations
 
+import asyncio
 import os
 import subprocess
+import sys
 import time
 import uuid
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 from claudechic.analytics import capture
 
 if TYPE_CHECKING:
     from claudechic.app import ChatApp
 
+# Home directory, for shortening displayed paths to ~
+_HOME_STR = str(Path.home())
+
 # Commands that should always run in interactive mode (TUI editors, pagers, etc.)
 INTERACTIVE_COMMANDS = frozenset(
     {
@@ -61,6 +66,15 @@ INTERACTIVE_COMMANDS = frozenset(
     }
 )
 
+# Env overrides forcing color output from shell commands (Unix)
+_SHELL_COLOR_ENV = {
+    "FORCE_COLOR": "1",
+    "CLICOLOR_FORCE": "1",
+    "TERM": "xterm-256color",
+}
+# Env overrides disabling pagers for captured (non-interactive) output
+_SHELL_NO_PAGER_ENV = {"BAT_PAGER": "", "PAGER": ""}
+
 # Two-word commands that use a pager by default
 INTERACTIVE_SUBCOMMANDS = frozenset(
     {
@@ -163,130 +177,142 @@ def _track_command(app: "ChatApp", command: str) -> None:
     )
 
 
-def handle_command(app: "ChatApp", prompt: str) -> bool:
-    """Route slash commands. Returns True if handled, False to send to Claude."""
-    cmd = prompt.strip()
+def _cmd_clear(app: "ChatApp", cmd: str) -> bool:
+    app._start_new_session()
+    return True
 
-    # Map bare words to their slash command equivalents
-    cmd = BARE_WORDS.get(cmd, cmd)
 
-    # Handle ! prefix for inline shell commands
-    if cmd.startswith("!"):
-        _track_command(app, "shell")
-        return _handle_bang(app, cmd[1:].strip())
+def _cmd_worktree(app: "ChatApp", cmd: str) -> bool:
+    from claudechic.features.worktree import handle_worktree_command
 
-    if cmd == "/clear":
-        _track_command(app, "clear")
-        app._start_new_session()
-        return True
+    handle_worktree_command(app, cmd)
+    return True
 
-    if cmd.startswith("/resume"):
-        _track_command(app, "resume")
-        return _handle_resume(app, cmd)
 
-    if cmd.startswith("/worktree"):
-        from claudechic.features.worktree import handle_worktree_command
+def _cmd_theme(app: "ChatApp", cmd: str) -> bool:
+    app.search_themes()
+    return True
 
-        # worktree_action event is tracked separately with more detail
-        handle_worktree_command(app, cmd)
-        return True
 
-    if cmd.startswith("/agent"):
-        _track_command(app, "agent")
-        return _handle_agent(app, cmd)
+def _cmd_usage(app: "ChatApp", cmd: str) -> bool:
+    app._handle_usage_command()
+    return True
 
-    if cmd.startswith("/shell"):
-        _track_command(app, "shell")
-        return _handle_shell(app, cmd)
 
-    if cmd == "/theme":
-        _track_command(app, "theme")
-        app.search_themes()
-        return True
+def _cmd_model(app: "ChatApp", cmd: str) -> bool:
+    parts = cmd.split(maxsplit=1)
+    if len(parts) == 1:
+        # No argument - show prompt
+        app._handle_model_prompt()
+    else:
+        # Direct model selection: /model sonnet
+        model = parts[1].lower()
+        valid_models = {"opus", "sonnet", "haiku"}
+        if model not in valid_models:
+            app.notify(
+                f"Invalid model '{model}'. Use: opus, sonnet, haiku",
+                severity="error",
+            )
+        else:
+            app._set_agent_model(model)
+    return True
 
-    if cmd.startswith("/compactish"):
-        _track_command(app, "compactish")
-        return _handle_compactish(app, cmd)
 
-    if cmd == "/usage":
-        _track_command(app, "usage")
-        app._handle_usage_command()
-        return True
+def _cmd_exit(app: "ChatApp", cmd: str) -> bool:
+    app.exit()
+    return True
 
-    if cmd == "/model" or cmd.startswith("/model "):
-        _track_command(app, "model")
-        parts = cmd.split(maxsplit=1)
-        if len(parts) == 1:
-            # No argument - show prompt
-            app._handle_model_prompt()
-        else:
-            # Direct model selection: /model sonnet
-            model = parts[1].lower()
-            valid_models = {"opus", "sonnet", "haiku"}
-            if model not in valid_models:
-                app.notify(
-                    f"Invalid model '{model}'. Use: opus, sonnet, haiku",
-                    severity="error",
-                )
-            else:
-                app._set_agent_model(model)
-        return True
 
-    if cmd == "/exit":
-        _track_command(app, "exit")
-        app.exit()
-        return True
+def _cmd_reviewer(app: "ChatApp", cmd: str) -> bool:
+    parts = cmd.split(maxsplit=1)
+    return _handle_review(app, parts[1] if len(parts) > 1 else None)
 
-    if cmd == "/vim":
-        _track_command(app, "vim")
-        return _handle_vim(app)
 
-    if cmd == "/welcome":
-        _track_command(app, "welcome")
-        return _handle_welcome(app)
+def _cmd_help(app: "ChatApp", cmd: str) -> bool:
+    app.run_worker(_handle_help(app))
+    return True
 
-    if cmd == "/reviewer" or cmd.startswith("/reviewer "):
-        _track_command(app, "reviewer")
-        context = cmd.split(maxsplit=1)[1] if cmd.startswith("/reviewer ") else None
-        return _handle_review(app, context)
 
-    if cmd == "/plan-swarm":
-        _track_command(app, "plan-swarm")
-        return _handle_plan_swarm(app)
+def _cmd_reviews(app: "ChatApp", cmd: str) -> bool:
+    parts = cmd.split(maxsplit=1)
+    _handle_reviews(app, parts[1] if len(parts) > 1 else None)
+    return True
 
-    if cmd == "/help":
-        _track_command(app, "help")
-        app.run_worker(_handle_help(app))
-        return True
 
-    if cmd == "/reviews" or cmd.startswith("/reviews "):
-        _track_command(app, "reviews")
-        parts = cmd.split(maxsplit=1)
-        job_id = parts[1] if len(parts) > 1 else None
-        _handle_reviews(app, job_id)
-        return True
+def _cmd_processes(app: "ChatApp", cmd: str) -> bool:
+    _handle_processes(app)
+    return True
 
-    if cmd == "/processes":
-        _track_command(app, "processes")
-        _handle_processes(app)
-        return True
 
-    if cmd.startswith("/analytics"):
-        _track_command(app, "analytics")
-        return _handle_analytics(app, cmd)
+def _cmd_diff(app: "ChatApp", cmd: str) -> bool:
+    parts = cmd.split(maxsplit=1)
+    app._toggle_diff_mode(parts[1] if len(parts) > 1 else None)
+    return True
 
-    if cmd == "/diff" or cmd == "/d" or cmd.startswith("/diff "):
-        _track_command(app, "diff")
-        target = cmd.split(maxsplit=1)[1] if cmd.startswith("/diff ") else None
-        app._toggle_diff_mode(target)
-        return True
 
-    if cmd == "/rewind" or cmd.startswith("/rewind "):
-        _track_command(app, "rewind")
-        return _handle_rewind(app, cmd)
+# Slash command dispatch, keyed by the command's first word:
+# name -> (analytics name or None if tracked elsewhere, handler, takes_args).
+# Commands that don't take arguments only match when typed on their own;
+# "/clear now" falls through to Claude like any other unknown command.
+_COMMAND_HANDLERS: dict[
+    str, tuple[str | None, Callable[["ChatApp", str], bool], bool]
+] = {
+    "/clear": ("clear", _cmd_clear, False),
+    "/resume": ("resume", lambda app, cmd: _handle_resume(app, cmd), True),
+    # worktree_action event is tracked separately with more detail
+    "/worktree": (None, _cmd_worktree, True),
+    "/agent": ("agent", lambda app, cmd: _handle_agent(app, cmd), True),
+    "/shell": ("shell", lambda app, cmd: _handle_shell(app, cmd), True),
+    "/theme": ("theme", _cmd_theme, False),
+    "/compactish": (
+        "compactish",
+        lambda app, cmd: _handle_compactish(app, cmd),
+        True,
+    ),
+    "/usage": ("usage", _cmd_usage, False),
+    "/model": ("model", _cmd_model, True),
+    "/exit": ("exit", _cmd_exit, False),
+    "/vim": ("vim", lambda app, cmd: _handle_vim(app), False),
+    "/welcome": ("welcome", lambda app, cmd: _handle_welcome(app), False),
+    "/reviewer": ("reviewer", _cmd_reviewer, True),
+    "/plan-swarm": ("plan-swarm", lambda app, cmd: _handle_plan_swarm(app), False),
+    "/help": ("help", _cmd_help, False),
+    "/reviews": ("reviews", _cmd_reviews, True),
+    "/processes": ("processes", _cmd_processes, False),
+    "/analytics": ("analytics", lambda app, cmd: _handle_analytics(app, cmd), True),
+    "/diff": ("diff", _cmd_diff, True),
+    "/d": ("diff", _cmd_diff, False),
+    "/rewind": ("rewind", lambda app, cmd: _handle_rewind(app, cmd), True),
+}
+
+
+def handle_command(app: "ChatApp", prompt: str) -> bool:
+    """Route slash commands. Returns True if handled, False to send to Claude."""
+    cmd = prompt.strip()
+
+    # Map bare words to their slash command equivalents
+    cmd = BARE_WORDS.get(cmd, cmd)
+
+    # Fast path: ordinary chat text goes straight to Claude
+    if cmd[:1] not in ("/", "!"):
+        return False
+
+    # Handle ! prefix for inline shell commands
+    if cmd.startswith("!"):
+        _track_command(app, "shell")
+        return _handle_bang(app, cmd[1:].strip())
+
+    parts = cmd.split(maxsplit=1)
+    cmd_name = parts[0] if parts else ""
+    entry = _COMMAND_HANDLERS.get(cmd_name)
+    if entry is not None:
+        track, handler, takes_args = entry
+        if takes_args or len(parts) == 1:
+            if track:
+                _track_command(app, track)
+            return handler(app, cmd)
 
     # Unknown slash command - pass through to Claude (may be SDK command or skill)
-    cmd_name = cmd.split()[0]
     if cmd_name in CLAUDE_CLI_COMMANDS:
         app.notify(
             f"'{cmd_name}' is not available in claudechic.\nUse 'claude' CLI instead.",
@@ -432,16 +458,16 @@ def _handle_agent(app: "ChatApp", command: str) -> bool:
             "| # | Agent | Status | Directory |",
             "|---|-------|--------|-----------|",
         ]
+        active_id = app.active_agent_id
         for i, (aid, agent) in enumerate(app.agents.items(), 1):
-            marker = "▸" if aid == app.active_agent_id else " "
+            marker = "▸" if aid == active_id else " "
             # Shorten home directory
-            path = str(agent.cwd).replace(str(Path.home()), "~")
+            path = str(agent.cwd).replace(_HOME_STR, "~", 1)
             lines.append(f"| {marker}{i} | {agent.name} | {agent.status} | {path} |")
 
         chat_view = app._chat_view
         if chat_view:
-            msg = ChatMessage("\n".join(lines))
-            msg.add_class("system-message")
+            msg = ChatMessage("\n".join(lines), classes="system-message")
             chat_view.mount(msg)
             chat_view.scroll_if_tailing()
         return True
@@ -492,8 +518,6 @@ def _handle_shell(app: "ChatApp", command: str) -> bool:
 
     NOTE: On Windows, only interactive mode is supported (no PTY capture).
     """
-    import sys
-
     parts = command.split(maxsplit=1)
     cmd = parts[1] if len(parts) > 1 else None
 
@@ -525,7 +549,8 @@ def _handle_shell(app: "ChatApp", command: str) -> bool:
 
     agent = app._agent
     cwd = str(agent.cwd) if agent else None
-    env = {k: v for k, v in os.environ.items() if k != "VIRTUAL_ENV"}
+    env = os.environ.copy()
+    env.pop("VIRTUAL_ENV", None)
 
     # Platform-specific shell and args
     if is_windows:
@@ -538,16 +563,10 @@ def _handle_shell(app: "ChatApp", command: str) -> bool:
     else:
         # Unix: use SHELL env var or fallback to /bin/sh
         # Force color output
-        env.update(
-            {
-                "FORCE_COLOR": "1",
-                "CLICOLOR_FORCE": "1",
-                "TERM": "xterm-256color",
-            }
-        )
+        env.update(_SHELL_COLOR_ENV)
         # Disable pagers only for captured (non-interactive) output
         if not interactive:
-            env.update({"BAT_PAGER": "", "PAGER": ""})
+            env.update(_SHELL_NO_PAGER_ENV)
         shell = os.environ.get("SHELL", "/bin/sh")
         if cmd:
             args = [shell, "-lc", cmd] if not interactive else [shell, "-c", cmd]
@@ -578,8 +597,6 @@ def _handle_shell(app: "ChatApp", command: str) -> bool:
 
 def _wait_for_keypress() -> None:
     """Wait for a keypress. Cross-platform (Unix uses termios, Windows uses input)."""
-    import sys
-
     if sys.platform == "win32":
         input("\nPress Enter to continue...")
     else:
@@ -694,8 +711,7 @@ def _handle_compactish(app: "ChatApp", command: str) -> bool:
     summary_md = format_compact_summary(result, dry_run=dry_run)
     chat_view = app._chat_view
     if chat_view:
-        summary_msg = ChatMessage(summary_md)
-        summary_msg.add_class("system-message")
+        summary_msg = ChatMessage(summary_md, classes="system-message")
         chat_view.mount(summary_msg)
         chat_view.scroll_if_tailing()
 
@@ -720,8 +736,7 @@ async def _handle_help(app: "ChatApp") -> None:
 
     chat_view = app._chat_view
     if chat_view:
-        msg = ChatMessage(help_text)
-        msg.add_class("system-message")
+        msg = ChatMessage(help_text, classes="system-message")
         chat_view.mount(msg)
         chat_view.scroll_if_tailing()
 
@@ -764,8 +779,6 @@ def _format_verdict(verdict: object) -> str:
 
 async def _list_reviews_in_chat(app: "ChatApp") -> None:
     """List reviews as a markdown table in the chat."""
-    import asyncio
-
     from claudechic.features.roborev import get_current_branch, list_reviews
     from claudechic.widgets import ChatMessage
 
@@ -785,9 +798,9 @@ async def _list_reviews_in_chat(app: "ChatApp") -> None:
         msg = ChatMessage(
             "No roborev reviews found"
             + (f" for branch `{branch}`" if branch else "")
-            + "."
+            + ".",
+            classes="system-message",
         )
-        msg.add_class("system-message")
         chat_view.mount(msg)
         chat_view.scroll_if_tailing()
         return
@@ -812,16 +825,13 @@ async def _list_reviews_in_chat(app: "ChatApp") -> None:
         )
     lines.append("\nUse `/reviews <job_id>` to see detail.")
 
-    msg = ChatMessage("\n".join(lines))
-    msg.add_class("system-message")
+    msg = ChatMessage("\n".join(lines), classes="system-message")
     chat_view.mount(msg)
     chat_view.scroll_if_tailing()
 
 
 async def _show_review_detail(app: "ChatApp", job_id: str) -> None:
     """Show detail for a specific review job."""
-    import asyncio
-
     from claudechic.features.roborev import show_review
     from claudechic.widgets import ChatMessage
 
@@ -836,8 +846,7 @@ async def _show_review_detail(app: "ChatApp", job_id: str) -> None:
         return
 
     if not detail:
-        msg = ChatMessage(f"Review `{job_id}` not found.")
-        msg.add_class("system-message")
+        msg = ChatMessage(f"Review `{job_id}` not found.", classes="system-message")
         chat_view.mount(msg)
         chat_view.scroll_if_tailing()
         return
@@ -859,8 +868,7 @@ async def _show_review_detail(app: "ChatApp", job_id: str) -> None:
     if detail.output:
         lines.extend(["", "---", "", detail.output])
 
-    msg = ChatMessage("\n".join(lines))
-    msg.add_class("system-message")
+    msg = ChatMessage("\n".join(lines), classes="system-message")
     chat_view.mount(msg)
     chat_view.scroll_if_tailing()
 
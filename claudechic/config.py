@@ -5,8 +5,6 @@ import tempfile
 import uuid
 from pathlib import Path
 
-import yaml
-
 CONFIG_PATH = Path.home() / ".claude" / ".claudechic.yaml"
 _OLD_CONFIG_PATH = Path.home() / ".claude" / "claudechic.yaml"
 
@@ -16,6 +14,14 @@ def _load() -> tuple[dict, bool]:
 
     Returns (config_dict, is_new_install).
     """
+    import yaml
+
+    # libyaml-backed loader when PyYAML was built with it
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader  # type: ignore[assignment]
+
     new_install = False
 
     # Migrate from old config path if it exists and new doesn't
@@ -26,7 +32,7 @@ def _load() -> tuple[dict, bool]:
 
     if CONFIG_PATH.exists():
         with open(CONFIG_PATH, encoding="utf-8") as f:
-            config = yaml.safe_load(f) or {}
+            config = yaml.load(f, Loader=Loader) or {}
         # Provide defaults for missing keys (don't save - preserve user's file)
         config.setdefault("analytics", {})
         config["analytics"].setdefault("id", "anonymous")
@@ -50,11 +56,18 @@ def _load() -> tuple[dict, bool]:
 
 def _save(config: dict) -> None:
     """Write config to disk atomically."""
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeDumper as Dumper  # type: ignore[assignment]
+
     CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp_path = tempfile.mkstemp(dir=CONFIG_PATH.parent, suffix=".yaml")
     try:
         with os.fdopen(fd, "w", encoding="utf-8") as f:
-            yaml.dump(config, f, default_flow_style=False)
+            yaml.dump(config, f, Dumper=Dumper, default_flow_style=False)
         os.replace(tmp_path, CONFIG_PATH)
     except Exception:
         try:
@@ -64,10 +77,26 @@ def _save(config: dict) -> None:
         raise
 
 
-# Load config once at import time
-CONFIG, NEW_INSTALL = _load()
+# Loaded from disk on first access (see __getattr__), not at import time
+CONFIG: dict
+NEW_INSTALL: bool
+
+
+def _ensure_loaded() -> dict:
+    """Load config once and bind CONFIG/NEW_INSTALL as plain module globals."""
+    global CONFIG, NEW_INSTALL
+    if "CONFIG" not in globals():
+        CONFIG, NEW_INSTALL = _load()
+    return CONFIG
+
+
+def __getattr__(name: str):
+    if name in ("CONFIG", "NEW_INSTALL"):
+        _ensure_loaded()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def save() -> None:
     """Save current CONFIG to disk."""
-    _save(CONFIG)
+    _save(_ensure_loaded())
@@ -12,7 +12,7 @@ import traceback
 from pathlib import Path
 from typing import Callable, Literal
 
-from claudechic.config import CONFIG
+from claudechic import config
 
 # Configure module logger
 log = logging.getLogger("claudechic")
@@ -85,7 +85,7 @@ def setup_logging(level: int = logging.DEBUG) -> None:
     log.propagate = False  # Avoid duplicates if root logger is configured
 
     # File handler (if configured)
-    log_file = CONFIG.get("logging", {}).get(
+    log_file = config.CONFIG.get("logging", {}).get(
         "file", str(Path.home() / "claudechic.log")
     )
     if log_file:
@@ -103,7 +103,7 @@ def setup_logging(level: int = logging.DEBUG) -> None:
             log_file = None
 
     # Notification handler (if configured)
-    notify_level_str = CONFIG.get("logging", {}).get("notify-level", "warning")
+    notify_level_str = config.CONFIG.get("logging", {}).get("notify-level", "warning")
     if notify_level_str:
         notify_level = getattr(logging, notify_level_str.upper(), logging.WARNING)
         notify_handler = NotifyHandler()
@@ -1,13 +1,20 @@
 """Git diff parsing - pure functions for extracting file changes."""
 
 import asyncio
+import codecs
 import difflib
 import re
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from pathlib import Path
 
+# A C-style quoted path, as git writes paths with non-ASCII or special chars
+_QUOTED_PATH_RE = re.compile(r'"(?:[^"\\]|\\.)*"')
+# @@ -old_start,old_count +new_start,new_count @@ (counts default to 1)
+_HUNK_HEADER_RE = re.compile(r"@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
 
-@dataclass
+
+@dataclass(slots=True)
 class Hunk:
     """A single hunk (@@-delimited section) from a diff."""
 
@@ -65,7 +72,7 @@ def format_hunk_comments(comments: list[HunkComment]) -> str:
     return "\n\n---\n\n".join(file_parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class FileChange:
     """A single file's changes from git diff."""
 
@@ -160,42 +167,29 @@ async def get_file_stats(cwd: str, target: str = "HEAD") -> list[FileStat]:
 
 async def get_changes(cwd: str, target: str = "HEAD") -> list[FileChange]:
     """Get all changes vs target (default HEAD) via git diff."""
-    # Get list of changed files with status
+    # Single git diff call - paths and statuses come from the section headers.
+    # Use --no-ext-diff to ensure we get unified diff format (not difft, delta, etc.)
     proc = await asyncio.create_subprocess_exec(
         "git",
         "diff",
         target,
-        "--name-status",
+        "--no-ext-diff",
         cwd=cwd,
         stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
     )
-    stdout, _ = await proc.communicate()
-    if proc.returncode != 0:
+    # Parse while reading so memory tracks the parsed result, not the raw diff
+    assert proc.stdout is not None
+    parser = _DiffParser()
+    async for line in _iter_lines(proc.stdout):
+        parser.feed(line)
+    if await proc.wait() != 0:
         return []
 
-    files = _parse_name_status(stdout.decode())
+    files = parser.files
     if not files:
         return []
 
-    # Get full diff content for parsing
-    # Use --no-ext-diff to ensure we get unified diff format (not difft, delta, etc.)
-    proc = await asyncio.create_subprocess_exec(
-        "git",
-        "diff",
-        target,
-        "--no-ext-diff",
-        cwd=cwd,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-    )
-    stdout, _ = await proc.communicate()
-    if proc.returncode != 0:
-        return files  # Return files without hunks
-
-    diff_content = stdout.decode()
-    files = _merge_diff_content(files, diff_content)
-
     # Add untracked files as synthetic diffs
     proc = await asyncio.create_subprocess_exec(
         "git",
@@ -247,110 +241,197 @@ async def get_changes(cwd: str, target: str = "HEAD") -> list[FileChange]:
     return files
 
 
-def _parse_name_status(output: str) -> list[FileChange]:
-    """Parse git diff --name-status output."""
-    changes = []
-    for line in output.strip().split("\n"):
-        if not line:
-            continue
-        parts = line.split("\t")
-        if len(parts) < 2:
-            continue
-
-        status_code = parts[0][0]  # First char (M, A, D, R, etc.)
-        path = parts[-1]  # Last part is the (new) path
-
-        status = {
-            "M": "modified",
-            "A": "added",
-            "D": "deleted",
-            "R": "renamed",
-            "C": "copied",
-        }.get(status_code, "modified")
-
-        changes.append(FileChange(path=path, status=status, hunks=[]))
-
-    return changes
-
-
-def _merge_diff_content(files: list[FileChange], diff_text: str) -> list[FileChange]:
-    """Parse unified diff and merge hunks into FileChange objects."""
-    # Split by file headers
-    file_diffs = re.split(r"^diff --git ", diff_text, flags=re.MULTILINE)
-
-    path_to_diff: dict[str, str] = {}
-    for file_diff in file_diffs[1:]:  # Skip empty first split
-        # Extract path from "a/path b/path" line
-        first_line = file_diff.split("\n")[0]
-        match = re.search(r"b/(.+)$", first_line)
-        if match:
-            path = match.group(1)
-            path_to_diff[path] = file_diff
-
-    # Merge hunks into FileChange objects
-    result = []
-    for fc in files:
-        if fc.path in path_to_diff:
-            hunks = _parse_hunks(path_to_diff[fc.path])
-            result.append(FileChange(path=fc.path, status=fc.status, hunks=hunks))
+# Extended header line prefixes that set a section's status (and new path)
+_SECTION_STATUS_PREFIXES = (
+    ("new file mode", "added"),
+    ("deleted file mode", "deleted"),
+    ("rename to ", "renamed"),
+    ("copy to ", "copied"),
+)
+
+
+# Single-character escapes in git's quoted paths
+_PATH_ESCAPES = {
+    "a": 7,
+    "b": 8,
+    "t": 9,
+    "n": 10,
+    "v": 11,
+    "f": 12,
+    "r": 13,
+    '"': 34,
+    "\\": 92,
+}
+
+
+def _unquote_path(path: str) -> str:
+    """Undo git's C-style path quoting ("caf\\303\\251.txt" -> café.txt).
+
+    Unquoted paths are returned unchanged. Octal escapes are raw bytes of
+    the UTF-8 encoded name.
+    """
+    if len(path) < 2 or path[0] != '"' or path[-1] != '"':
+        return path
+    out = bytearray()
+    i, end = 1, len(path) - 1
+    while i < end:
+        char = path[i]
+        if char == "\\" and i + 1 < end:
+            nxt = path[i + 1]
+            if nxt in "01234567":
+                out.append(int(path[i + 1 : i + 4], 8) & 0xFF)
+                i += 4
+            else:
+                out.append(_PATH_ESCAPES.get(nxt, ord(nxt)))
+                i += 2
+        else:
+            out += char.encode()
+            i += 1
+    return out.decode("utf-8", errors="replace")
+
+
+def _header_path(header: str) -> str:
+    """New-side path from the "a/<old> b/<new>" part of a diff --git line.
+
+    Old and new paths are equal unless the file was renamed or copied, so
+    split the header in half rather than searching for "b/", which can also
+    occur inside a path (lib/, web/). Renames and copies get their real path
+    from the later "rename to"/"copy to" line. Paths git quoted are unquoted;
+    a header that can't be split is kept whole rather than dropped.
+    """
+    if header.endswith('"'):
+        if header.startswith('"') and (match := _QUOTED_PATH_RE.match(header)):
+            new = header[match.end() + 1 :]
         else:
-            result.append(fc)
+            new = header[header.rfind(' "') + 1 :]
+        new = _unquote_path(new)
+        return new[2:] if new.startswith("b/") else new
+    half = len(header) // 2
+    old, new = header[:half], header[half + 1 :]
+    if old.startswith("a/") and new.startswith("b/") and old[2:] == new[2:]:
+        return new[2:]
+    _, sep, new_path = header.rpartition(" b/")
+    return new_path if sep else header
+
+
+class _DiffParser:
+    """Incremental unified diff parser, fed one line at a time."""
+
+    def __init__(self) -> None:
+        self.files: list[FileChange] = []
+        self._file: FileChange | None = None  # Section currently being parsed
+        self._hunk: Hunk | None = None  # Hunk currently being filled
+        self._in_hunks = False  # Past the section's extended header lines
+
+    def start_file(self, path: str) -> FileChange:
+        """Begin a new file section."""
+        self._file = FileChange(path=path, status="modified")
+        self._hunk = None
+        self._in_hunks = False
+        self.files.append(self._file)
+        return self._file
+
+    def feed(self, line: str) -> None:
+        """Consume one line of diff output (without its newline)."""
+        if line.startswith("diff --git "):
+            self.start_file(_header_path(line[11:]))
+            return
+        fc = self._file
+        if fc is None:
+            return
 
-    return result
+        if line.startswith("@@"):
+            self._in_hunks = True
+            # Cheap prefix check first - only real headers reach the regex
+            match = _HUNK_HEADER_RE.match(line) if line.startswith("@@ -") else None
+            if not match:
+                self._hunk = None  # Malformed header - drop its lines
+                return
+            self._hunk = Hunk(
+                old_start=int(match.group(1)),
+                old_count=int(match.group(2) or 1),
+                new_start=int(match.group(3)),
+                new_count=int(match.group(4) or 1),
+                old_lines=[],
+                new_lines=[],
+            )
+            fc.hunks.append(self._hunk)
+            return
+
+        if not self._in_hunks:
+            # The ---/+++ lines name the file exactly; git appends a tab
+            # when the path contains a space. "--- a/" is kept if +++ is
+            # /dev/null (deleted file)
+            if line.startswith(("+++ ", "--- ")):
+                path = _unquote_path(line[4:].removesuffix("\t"))
+                if path.startswith("b/" if line[0] == "+" else "a/"):
+                    fc.path = path[2:]
+                return
+            # Extended header lines carry the status (and new path on rename)
+            for prefix, status in _SECTION_STATUS_PREFIXES:
+                if line.startswith(prefix):
+                    fc.status = status
+                    if status in ("renamed", "copied"):
+                        fc.path = _unquote_path(line[len(prefix) :])
+                    break
+            return
+
+        hunk = self._hunk
+        if hunk is None:
+            return
+        if line.startswith("-"):
+            hunk.old_lines.append(line[1:])
+        elif line.startswith("+"):
+            hunk.new_lines.append(line[1:])
+        elif line.startswith(" "):
+            # Context line - present in both, sharing one stripped string
+            text = line[1:]
+            hunk.old_lines.append(text)
+            hunk.new_lines.append(text)
+        # "\ No newline at end of file" and anything else is skipped
+
+
+# Bytes read from git's stdout per chunk while streaming a diff
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+async def _iter_lines(stream: asyncio.StreamReader) -> AsyncIterator[str]:
+    """Yield decoded lines from a stream as they arrive.
+
+    Reads fixed-size chunks rather than readline() so arbitrarily long
+    lines don't hit the StreamReader buffer limit.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    partial: list[str] = []  # Pieces of a line not yet terminated
+    while chunk := await stream.read(_READ_CHUNK_SIZE):
+        *lines, tail = decoder.decode(chunk).split("\n")
+        if lines:
+            if partial:
+                lines[0] = "".join(partial) + lines[0]
+                partial.clear()
+            for line in lines:
+                yield line
+        if tail:
+            partial.append(tail)
+    yield "".join(partial) + decoder.decode(b"", final=True)
+
+
+def _parse_diff(diff_text: str) -> list[FileChange]:
+    """Parse full unified diff output into FileChange objects with hunks.
+
+    Path and status are read from each section's header lines, so no
+    separate --name-status call is needed.
+    """
+    parser = _DiffParser()
+    for line in diff_text.split("\n"):
+        parser.feed(line)
+    return parser.files
 
 
 def _parse_hunks(diff_section: str) -> list[Hunk]:
     """Parse a file's diff section into individual hunks."""
-    hunks = []
-    lines = diff_section.split("\n")
-
-    # Find all hunk headers
-    hunk_starts = []
-    for i, line in enumerate(lines):
-        if line.startswith("@@"):
-            hunk_starts.append(i)
-
-    # Parse each hunk
-    for idx, start in enumerate(hunk_starts):
-        # Determine end of this hunk
-        end = hunk_starts[idx + 1] if idx + 1 < len(hunk_starts) else len(lines)
-
-        header = lines[start]
-        # Parse @@ -old_start,old_count +new_start,new_count @@
-        match = re.match(r"@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@", header)
-        if not match:
-            continue
-
-        old_start = int(match.group(1))
-        old_count = int(match.group(2) or 1)
-        new_start = int(match.group(3))
-        new_count = int(match.group(4) or 1)
-
-        old_lines = []
-        new_lines = []
-
-        for line in lines[start + 1 : end]:
-            if line.startswith("-"):
-                old_lines.append(line[1:])
-            elif line.startswith("+"):
-                new_lines.append(line[1:])
-            elif line.startswith(" "):
-                # Context line - present in both
-                old_lines.append(line[1:])
-                new_lines.append(line[1:])
-            elif line.startswith("\\"):
-                # "\ No newline at end of file" - skip
-                continue
-
-        hunks.append(
-            Hunk(
-                old_start=old_start,
-                old_count=old_count,
-                new_start=new_start,
-                new_count=new_count,
-                old_lines=old_lines,
-                new_lines=new_lines,
-            )
-        )
-
-    return hunks
+    parser = _DiffParser()
+    fc = parser.start_file("")
+    for line in diff_section.split("\n"):
+        parser.feed(line)
+    return fc.hunks
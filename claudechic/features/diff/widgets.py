@@ -1,7 +1,6 @@
 """Diff view widgets - sidebar, main view, and file panels."""
 
-import difflib
-
+from functools import lru_cache
 from pathlib import Path
 
 from textual.app import ComposeResult
@@ -10,6 +9,7 @@ from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.message import Message
 from textual.widgets import Label, Static, TextArea
 
+from claudechic.formatting import SequenceMatcher
 from claudechic.widgets.content.diff import DiffWidget
 
 from .git import FileChange, Hunk, HunkComment
@@ -27,7 +27,7 @@ def _split_large_hunk(hunk: Hunk, context: int = 1) -> list[Hunk]:
     if max_lines <= LARGE_HUNK_THRESHOLD:
         return [hunk]
 
-    sm = difflib.SequenceMatcher(None, hunk.old_lines, hunk.new_lines)
+    sm = SequenceMatcher(None, hunk.old_lines, hunk.new_lines)
     groups = list(sm.get_grouped_opcodes(context))
 
     if len(groups) <= 1:
@@ -169,28 +169,27 @@ class DiffSidebar(Vertical):
         super().__init__(**kwargs)
         self.changes = changes
         self._active_path: str | None = None
+        # Path -> sidebar item, so highlighting skips DOM queries
+        self._items: dict[str, DiffFileItem] = {}
 
     def compose(self) -> ComposeResult:
         yield Label("Changed Files", classes="section-header")
         for change in self.changes:
-            yield DiffFileItem(
+            item = DiffFileItem(
                 change.path,
                 change.status,
                 len(change.hunks),
                 id=f"sidebar-{_sanitize_id(change.path)}",
             )
+            self._items[change.path] = item
+            yield item
 
     def set_active(self, path: str) -> None:
         """Highlight the active file in the sidebar."""
-        if self._active_path:
-            if old_item := self.query_one_optional(
-                f"#sidebar-{_sanitize_id(self._active_path)}", DiffFileItem
-            ):
-                old_item.remove_class("active")
+        if self._active_path and (old_item := self._items.get(self._active_path)):
+            old_item.remove_class("active")
         self._active_path = path
-        if new_item := self.query_one_optional(
-            f"#sidebar-{_sanitize_id(path)}", DiffFileItem
-        ):
+        if new_item := self._items.get(path):
             new_item.add_class("active")
 
 
@@ -450,12 +449,18 @@ class DiffView(VerticalScroll):
         # Build flat list of (file_idx, widget_idx) for navigation
         # Must account for large hunks being split into sub-hunks
         self._hunk_list: list[tuple[int, int]] = []
+        # Reverse index: hunk widget ID -> position in _hunk_list
+        self._id_to_idx: dict[str, int] = {}
         for file_idx, change in enumerate(changes):
             if change.hunks:
                 widget_idx = 0
+                sanitized = _sanitize_id(change.path)
                 for hunk in change.hunks:
                     sub_hunk_count = len(_split_large_hunk(hunk))
                     for _ in range(sub_hunk_count):
+                        self._id_to_idx.setdefault(
+                            f"hunk-{sanitized}-{widget_idx}", len(self._hunk_list)
+                        )
                         self._hunk_list.append((file_idx, widget_idx))
                         widget_idx += 1
             else:
@@ -479,13 +484,11 @@ class DiffView(VerticalScroll):
         """Sync _current_idx when a hunk is focused (by click or programmatically)."""
         widget = event.widget
         if isinstance(widget, HunkWidget) and widget.id:
-            for i, (file_idx, hunk_idx) in enumerate(self._hunk_list):
-                if hunk_idx >= 0:
-                    path = self.changes[file_idx].path
-                    if f"hunk-{_sanitize_id(path)}-{hunk_idx}" == widget.id:
-                        self._current_idx = i
-                        self.post_message(DiffFileItem.Selected(path))
-                        return
+            idx = self._id_to_idx.get(widget.id)
+            if idx is not None:
+                self._current_idx = idx
+                file_idx, _ = self._hunk_list[idx]
+                self.post_message(DiffFileItem.Selected(self.changes[file_idx].path))
 
     def scroll_to_file(self, path: str) -> None:
         """Scroll to bring the specified file's panel into view."""
@@ -552,6 +555,7 @@ class DiffView(VerticalScroll):
         return False
 
 
+@lru_cache(maxsize=4096)
 def _sanitize_id(path: str) -> str:
     """Convert a file path to a valid CSS ID."""
     return path.replace("/", "-").replace(".", "-").replace(" ", "-")
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 from textual.containers import Center
 from textual import work
@@ -46,6 +46,15 @@ if TYPE_CHECKING:
 MAX_CLEANUP_ATTEMPTS = 3
 
 
+# /worktree subcommands: name -> handler(app, rest of command line).
+# Anything else is a branch name to switch to or create.
+_SUBCOMMANDS: dict[str, Callable[["ChatApp", str], object]] = {
+    "finish": lambda app, rest: _handle_finish(app),
+    "cleanup": lambda app, rest: _handle_cleanup(app, rest.split() or None),
+    "discard": lambda app, rest: _handle_discard(app),
+}
+
+
 def handle_worktree_command(app: "ChatApp", command: str) -> None:
     """Handle /worktree commands.
 
@@ -57,28 +66,22 @@ def handle_worktree_command(app: "ChatApp", command: str) -> None:
         app.notify("Not in a git repository", severity="error")
         return
 
-    parts = command.split(maxsplit=2)
+    _, _, args = command.strip().partition(" ")
+    subcommand, _, rest = args.strip().partition(" ")
 
-    if len(parts) == 1:
+    if not subcommand:
         _show_worktree_modal(app)
         return
 
     agent = app._agent
     agent_id = agent.analytics_id if agent else "unknown"
 
-    subcommand = parts[1]
-    if subcommand == "finish":
-        app.run_worker(capture("worktree_action", action="finish", agent_id=agent_id))
-        _handle_finish(app)
-    elif subcommand == "cleanup":
-        app.run_worker(capture("worktree_action", action="cleanup", agent_id=agent_id))
-        branches = parts[2].split() if len(parts) > 2 else None
-        _handle_cleanup(app, branches)
-    elif subcommand == "discard":
-        app.run_worker(capture("worktree_action", action="discard", agent_id=agent_id))
-        _handle_discard(app)
+    handler = _SUBCOMMANDS.get(subcommand)
+    action = subcommand if handler else "create"
+    app.run_worker(capture("worktree_action", action=action, agent_id=agent_id))
+    if handler:
+        handler(app, rest)
     else:
-        app.run_worker(capture("worktree_action", action="create", agent_id=agent_id))
         _switch_or_create_worktree(app, subcommand)
 
 
@@ -160,13 +163,15 @@ async def _run_resolution(app: "ChatApp", agent: "Agent") -> None:
         if action == ResolutionAction.CLEAN_GITIGNORED:
             # Auto-clean gitignored files (safe)
             app.notify("Cleaning gitignored files...")
-            success, error = clean_gitignored_files(state.info.worktree_dir)
+            success, error = await asyncio.to_thread(
+                clean_gitignored_files, state.info.worktree_dir
+            )
             if not success:
                 app.notify(f"Failed to clean: {error}", severity="error")
                 agent.finish_state = None
                 return
             # Re-diagnose and loop
-            state.status = diagnose_worktree(state.info)
+            state.status = await asyncio.to_thread(diagnose_worktree, state.info)
             continue
 
         if action == ResolutionAction.PROMPT_UNCOMMITTED:
@@ -189,13 +194,15 @@ async def _run_resolution(app: "ChatApp", agent: "Agent") -> None:
 
             if choice == "discard":
                 app.notify("Discarding all changes...")
-                success, error = discard_all_changes(state.info.worktree_dir)
+                success, error = await asyncio.to_thread(
+                    discard_all_changes, state.info.worktree_dir
+                )
                 if not success:
                     app.notify(f"Failed to discard: {error}", severity="error")
                     agent.finish_state = None
                     return
                 # Re-diagnose and loop
-                state.status = diagnose_worktree(state.info)
+                state.status = await asyncio.to_thread(diagnose_worktree, state.info)
                 continue
 
             if choice == "commit":
@@ -209,7 +216,7 @@ async def _run_resolution(app: "ChatApp", agent: "Agent") -> None:
 
         if action == ResolutionAction.FAST_FORWARD:
             app.notify("Fast-forward merge...")
-            success, error = fast_forward_merge(state.info)
+            success, error = await asyncio.to_thread(fast_forward_merge, state.info)
             if success:
                 state.phase = FinishPhase.CLEANUP
                 _run_cleanup(app, agent)
@@ -315,18 +322,18 @@ async def on_response_complete_finish(app: "ChatApp", agent: "Agent") -> None:
         _run_cleanup(app, agent)
 
 
-def _switch_or_create_worktree(app: "ChatApp", feature_name: str) -> None:
+@work(group="worktree_switch", exclusive=True, exit_on_error=False)
+async def _switch_or_create_worktree(app: "ChatApp", feature_name: str) -> None:
     """Switch to existing worktree agent or create new one."""
     # Check if we already have an agent for this worktree
-    for agent in app.agents.values():
-        if agent.worktree == feature_name:
-            if app.agent_mgr:
-                app.agent_mgr.switch(agent.id)
-            app.notify(f"Switched to {feature_name}")
-            return
+    if app.agent_mgr and (agent := app.agent_mgr.find_by_worktree(feature_name)):
+        app.agent_mgr.switch(agent.id)
+        app.notify(f"Switched to {feature_name}")
+        return
 
     # Check if worktree exists on disk
-    existing = [wt for wt in list_worktrees() if wt.branch == feature_name]
+    worktrees = await asyncio.to_thread(list_worktrees)
+    existing = [wt for wt in worktrees if wt.branch == feature_name]
     if existing:
         wt = existing[0]
         app._create_new_agent(
@@ -334,7 +341,9 @@ def _switch_or_create_worktree(app: "ChatApp", feature_name: str) -> None:
         )
     else:
         # Create new worktree
-        success, message, new_cwd = start_worktree(feature_name)
+        success, message, new_cwd = await asyncio.to_thread(
+            start_worktree, feature_name
+        )
         if success and new_cwd:
             app._create_new_agent(
                 feature_name, new_cwd, worktree=feature_name, auto_resume=False
@@ -345,26 +354,28 @@ def _switch_or_create_worktree(app: "ChatApp", feature_name: str) -> None:
 
 def _close_agents_for_branches(app: "ChatApp", branches: list[str]) -> None:
     """Close agents associated with removed worktree branches."""
+    agent_mgr = app.agent_mgr
+    if not agent_mgr:
+        return
     for branch in branches:
-        agent = next((a for a in app.agents.values() if a.worktree == branch), None)
-        if agent and len(app.agents) > 1:
-            if app.active_agent_id == agent.id:
-                main = next(
-                    (a for a in app.agents.values() if a.worktree is None), None
-                )
-                if main and app.agent_mgr:
-                    app.agent_mgr.switch(main.id)
+        agent = agent_mgr.find_by_worktree(branch)
+        if agent and len(agent_mgr) > 1:
+            if agent_mgr.active_id == agent.id:
+                main = agent_mgr.find_main()
+                if main:
+                    agent_mgr.switch(main.id)
             app._do_close_agent(agent.id)
 
 
-def _handle_discard(app: "ChatApp") -> None:
+@work(group="discard", exclusive=True, exit_on_error=False)
+async def _handle_discard(app: "ChatApp") -> None:
     """Handle /worktree discard command - discard current worktree entirely."""
-    success, message, info = get_finish_info(app.sdk_cwd)
+    success, message, info = await asyncio.to_thread(get_finish_info, app.sdk_cwd)
     if not success or info is None:
         app.notify(message, severity="error")
         return
 
-    status = diagnose_worktree(info)
+    status = await asyncio.to_thread(diagnose_worktree, info)
 
     # Check if there's anything to warn about
     has_commits = status.commits_ahead > 0 and not status.is_merged
@@ -373,13 +384,13 @@ def _handle_discard(app: "ChatApp") -> None:
     if has_commits or has_changes:
         _run_discard_prompt(app, info, status)
     else:
-        _do_discard(app, info)
+        await _do_discard(app, info)
 
 
-def _do_discard(app: "ChatApp", info: FinishInfo) -> None:
+async def _do_discard(app: "ChatApp", info: FinishInfo) -> None:
     """Force remove worktree and branch."""
     wt = WorktreeInfo(path=info.worktree_dir, branch=info.branch_name, is_main=False)
-    success, msg = remove_worktree(wt, force=True)
+    success, msg = await asyncio.to_thread(remove_worktree, wt, force=True)
     if success:
         app.notify(f"Discarded {info.branch_name}")
         _close_agents_for_branches(app, [info.branch_name])
@@ -417,25 +428,31 @@ async def _run_discard_prompt(
     app.query_one("#input", ChatInput).focus()
 
     if selected == "discard":
-        _do_discard(app, info)
+        await _do_discard(app, info)
     else:
         app.notify("Discard cancelled")
 
 
-def _handle_cleanup(app: "ChatApp", branches: list[str] | None) -> None:
+@work(group="cleanup_start", exclusive=True, exit_on_error=False)
+async def _handle_cleanup(app: "ChatApp", branches: list[str] | None) -> None:
     """Handle /worktree cleanup command."""
-    results = cleanup_worktrees(branches)
+    results = await asyncio.to_thread(cleanup_worktrees, branches)
 
     if not results:
         app.notify("No worktrees to clean up")
         return
 
-    # Check if any need confirmation
-    needs_confirm = [(b, msg) for b, _, msg, confirm in results if confirm]
-    removed = [b for b, success, _, _ in results if success]
-    failed = [
-        (b, msg) for b, success, msg, confirm in results if not success and not confirm
-    ]
+    # Partition into removed / failed / needing confirmation (dirty or unmerged)
+    needs_confirm: list[tuple[str, str]] = []
+    removed: list[str] = []
+    failed: list[tuple[str, str]] = []
+    for branch, success, msg, confirm in results:
+        if confirm:
+            needs_confirm.append((branch, msg))
+        elif success:
+            removed.append(branch)
+        else:
+            failed.append((branch, msg))
 
     # Close agents for successfully removed worktrees
     _close_agents_for_branches(app, removed)
@@ -475,12 +492,12 @@ async def _run_cleanup_prompt(
 
     if selected and selected != "cancel":
         to_remove = branches_to_confirm if selected == "all" else [selected]
-        worktrees = list_worktrees()
+        worktrees = await asyncio.to_thread(list_worktrees)
         removed = []
         for branch in to_remove:
             wt = next((w for w in worktrees if w.branch == branch), None)
             if wt:
-                success, msg = remove_worktree(wt, force=True)
+                success, msg = await asyncio.to_thread(remove_worktree, wt, force=True)
                 if success:
                     removed.append(branch)
                 app.notify(
@@ -497,18 +514,26 @@ async def _run_cleanup_prompt(
     app.query_one("#input", ChatInput).focus()
 
 
-def _show_worktree_modal(app: "ChatApp") -> None:
+@work(group="worktree_modal", exclusive=True, exit_on_error=False)
+async def _show_worktree_modal(app: "ChatApp") -> None:
     """Show worktree selection modal."""
-    worktrees = [(str(wt.path), wt.branch) for wt in list_worktrees() if not wt.is_main]
+    worktrees = [
+        (str(wt.path), wt.branch)
+        for wt in await asyncio.to_thread(list_worktrees)
+        if not wt.is_main
+    ]
     prompt = WorktreePrompt(worktrees)
     container = Center(prompt, id="worktree-modal")
     app.mount(container)
-    _wait_for_worktree_selection(app, prompt, container)
+    _wait_for_worktree_selection(app, prompt, container, dict(worktrees))
 
 
 @work(group="worktree", exclusive=True, exit_on_error=False)
 async def _wait_for_worktree_selection(
-    app: "ChatApp", prompt: WorktreePrompt, container: Center
+    app: "ChatApp",
+    prompt: WorktreePrompt,
+    container: Center,
+    branches_by_path: dict[str, str],
 ) -> None:
     """Wait for worktree modal selection and act on it."""
     try:
@@ -519,9 +544,8 @@ async def _wait_for_worktree_selection(
 
         action, value = result
         if action == "switch":
-            # value is the path; find the branch name from worktrees
-            worktrees = {str(wt.path): wt.branch for wt in list_worktrees()}
-            branch = worktrees.get(value, Path(value).name)
+            # value is the path; find the branch name from the listed worktrees
+            branch = branches_by_path.get(value, Path(value).name)
             _switch_or_create_worktree(app, branch)
         elif action == "new":
             _switch_or_create_worktree(app, value)
@@ -632,17 +632,22 @@ def cleanup_worktrees(
         List of (branch_name, success, message, needs_confirmation).
         needs_confirmation=True means the branch has changes or is unmerged.
     """
+    # One `git worktree list` serves both the main-worktree and branch lookups
     worktrees = list_worktrees()
-    main_wt = get_main_worktree()
-    main_dir = main_wt[0] if main_wt else None
-    main_branch = main_wt[1] if main_wt else "main"
+    main_wt = next((wt for wt in worktrees if wt.is_main), None)
+    main_dir = main_wt.path if main_wt else None
+    main_branch = main_wt.branch if main_wt else "main"
 
     if branches is None:
         branches = [wt.branch for wt in worktrees if not wt.is_main]
 
+    by_branch: dict[str, WorktreeInfo] = {}
+    for wt in worktrees:
+        by_branch.setdefault(wt.branch, wt)
+
     results = []
     for branch in branches:
-        wt = next((w for w in worktrees if w.branch == branch), None)
+        wt = by_branch.get(branch)
         if wt is None:
             results.append((branch, False, f"No worktree for branch '{branch}'", False))
             continue
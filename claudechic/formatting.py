@@ -1,18 +1,31 @@
 """Tool formatting and diff rendering utilities."""
 
-import difflib
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable
 
+from rich.style import Style
 from rich.text import Text
 
 from claudechic.enums import ToolName
 
+if TYPE_CHECKING:
+    # cdifflib's stubs type a/b as str; callers also diff lists of lines
+    from difflib import SequenceMatcher
+else:
+    try:
+        # C implementation of difflib.SequenceMatcher (the "speedups" extra)
+        from cdifflib import CSequenceMatcher as SequenceMatcher
+    except ImportError:
+        from difflib import SequenceMatcher
+
 
 # Constants
 MAX_CONTEXT_TOKENS = 200_000  # Claude's context window
 MAX_HEADER_WIDTH = 70  # Max width for tool headers
+MAX_WORD_DIFF_TOKENS = 200  # Longer lines fall back to whole-line diffs
 
 # Inter-agent message patterns
 # Matches ask_agent: [Question from agent 'X' - please respond...]
@@ -24,6 +37,44 @@ _AGENT_MESSAGE_RE = re.compile(r"^\[Message from agent '([^']+)'\]\n\n")
 # Matches spawn_agent/spawn_worktree: [Spawned by agent 'X']
 _AGENT_SPAWNED_RE = re.compile(r"^\[Spawned by agent '([^']+)'\]\n\n")
 
+# Word-diff tokens: words, single punctuation chars, whitespace runs
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]|\s+")
+
+# Diff styles, parsed once rather than per appended span
+_STYLE_CONTEXT = Style.parse("dim")
+_STYLE_DEL = Style.parse("red")
+_STYLE_DEL_DIM = Style.parse("red dim")
+_STYLE_DEL_WORD = Style.parse("red bold")
+_STYLE_INS = Style.parse("green")
+_STYLE_INS_DIM = Style.parse("green dim")
+_STYLE_INS_WORD = Style.parse("green bold")
+
+# File extension -> syntax highlighting language
+_EXT_TO_LANG = {
+    ".py": "python",
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".jsx": "jsx",
+    ".tsx": "tsx",
+    ".rs": "rust",
+    ".go": "go",
+    ".rb": "ruby",
+    ".java": "java",
+    ".c": "c",
+    ".cpp": "cpp",
+    ".h": "c",
+    ".hpp": "cpp",
+    ".css": "css",
+    ".html": "html",
+    ".json": "json",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".toml": "toml",
+    ".md": "markdown",
+    ".sh": "bash",
+    ".bash": "bash",
+}
+
 
 def format_agent_prompt(prompt: str) -> tuple[str, bool]:
     """Format inter-agent prompts for nicer display.
@@ -91,7 +142,7 @@ def count_diff_changes(old: str, new: str) -> tuple[int, int]:
     """
     old_lines = old.splitlines() if old else []
     new_lines = new.splitlines() if new else []
-    sm = difflib.SequenceMatcher(None, old_lines, new_lines)
+    sm = SequenceMatcher(None, old_lines, new_lines)
 
     additions = 0
     deletions = 0
@@ -149,122 +200,125 @@ def format_result_summary(name: str, content: str, is_error: bool = False) -> st
     return ""
 
 
+def _edit_header(input: dict, cwd: Path | None) -> str:
+    old = input.get("old_string", "")
+    new = input.get("new_string", "")
+    additions, deletions = count_diff_changes(old, new)
+    # Leave room for path + change counts
+    stats = f" (+{additions}, -{deletions})"
+    path = make_relative(input.get("file_path", "?"), cwd)
+    path = truncate_path(path, MAX_HEADER_WIDTH - 6 - len(stats))
+    return f"Edit: {path}{stats}"
+
+
+def _write_header(input: dict, cwd: Path | None) -> str:
+    path = make_relative(input.get("file_path", "?"), cwd)
+    path = truncate_path(path, MAX_HEADER_WIDTH - 7)
+    return f"Write: {path}"
+
+
+def _read_header(input: dict, cwd: Path | None) -> str:
+    path = make_relative(input.get("file_path", "?"), cwd)
+    path = truncate_path(path, MAX_HEADER_WIDTH - 6)
+    return f"Read: {path}"
+
+
+def _bash_header(input: dict, cwd: Path | None) -> str:
+    cmd = input.get("command", "?")
+    desc = input.get("description", "")
+    if desc:
+        return f"Bash: {desc}"
+    return f"Bash: {cmd[:50]}{'...' if len(cmd) > 50 else ''}"
+
+
+def _task_header(input: dict, cwd: Path | None) -> str:
+    desc = input.get("description", "")
+    agent = input.get("subagent_type", "")
+    if desc:
+        return f"Task: {desc}" + (f" ({agent})" if agent else "")
+    return "Task" + (f" ({agent})" if agent else "")
+
+
+def _ask_user_question_header(input: dict, cwd: Path | None) -> str:
+    questions = input.get("questions", [])
+    if questions and questions[0].get("question"):
+        q = questions[0]["question"][:40]
+        return f"AskUserQuestion: {q}..."
+    return "AskUserQuestion"
+
+
+# Tool name -> header formatter(input, cwd)
+_HEADER_FORMATTERS: dict[str, Callable[[dict, Path | None], str]] = {
+    ToolName.EDIT: _edit_header,
+    ToolName.WRITE: _write_header,
+    ToolName.READ: _read_header,
+    ToolName.BASH: _bash_header,
+    ToolName.GLOB: lambda input, cwd: f"Glob: {input.get('pattern', '?')}",
+    ToolName.GREP: lambda input, cwd: f"Grep: {input.get('pattern', '?')}",
+    ToolName.WEB_SEARCH: lambda input, cwd: f"WebSearch: {input.get('query', '?')}",
+    ToolName.WEB_FETCH: lambda input, cwd: f"WebFetch: {input.get('url', '?')[:50]}",
+    ToolName.TASK: _task_header,
+    ToolName.TODO_WRITE: lambda input, cwd: (
+        f"TodoWrite: {len(input.get('todos', []))} items"
+    ),
+    ToolName.ASK_USER_QUESTION: _ask_user_question_header,
+    ToolName.SKILL: lambda input, cwd: f"Skill: {input.get('skill', '?')}",
+    ToolName.ENTER_PLAN_MODE: lambda input, cwd: "EnterPlanMode",
+    ToolName.EXIT_PLAN_MODE: lambda input, cwd: "ExitPlanMode",
+}
+
+
 def format_tool_header(name: str, input: dict, cwd: Path | None = None) -> str:
     """Format a one-line header for a tool use."""
-    if name == ToolName.EDIT:
-        old = input.get("old_string", "")
-        new = input.get("new_string", "")
-        additions, deletions = count_diff_changes(old, new)
-        # Leave room for path + change counts
-        stats = f" (+{additions}, -{deletions})"
-        path = make_relative(input.get("file_path", "?"), cwd)
-        path = truncate_path(path, MAX_HEADER_WIDTH - 6 - len(stats))
-        return f"Edit: {path}{stats}"
-    elif name == ToolName.WRITE:
-        path = make_relative(input.get("file_path", "?"), cwd)
-        path = truncate_path(path, MAX_HEADER_WIDTH - 7)
-        return f"Write: {path}"
-    elif name == ToolName.READ:
-        path = make_relative(input.get("file_path", "?"), cwd)
-        path = truncate_path(path, MAX_HEADER_WIDTH - 6)
-        return f"Read: {path}"
-    elif name == ToolName.BASH:
-        cmd = input.get("command", "?")
-        desc = input.get("description", "")
-        if desc:
-            return f"Bash: {desc}"
-        return f"Bash: {cmd[:50]}{'...' if len(cmd) > 50 else ''}"
-    elif name == ToolName.GLOB:
-        return f"Glob: {input.get('pattern', '?')}"
-    elif name == ToolName.GREP:
-        return f"Grep: {input.get('pattern', '?')}"
-    elif name == ToolName.WEB_SEARCH:
-        return f"WebSearch: {input.get('query', '?')}"
-    elif name == ToolName.WEB_FETCH:
-        return f"WebFetch: {input.get('url', '?')[:50]}"
-    elif name == ToolName.TASK:
-        desc = input.get("description", "")
-        agent = input.get("subagent_type", "")
-        if desc:
-            return f"Task: {desc}" + (f" ({agent})" if agent else "")
-        return "Task" + (f" ({agent})" if agent else "")
-    elif name == ToolName.TODO_WRITE:
-        todos = input.get("todos", [])
-        return f"TodoWrite: {len(todos)} items"
-    elif name == ToolName.ASK_USER_QUESTION:
-        questions = input.get("questions", [])
-        if questions and questions[0].get("question"):
-            q = questions[0]["question"][:40]
-            return f"AskUserQuestion: {q}..."
-        return "AskUserQuestion"
-    elif name == ToolName.SKILL:
-        return f"Skill: {input.get('skill', '?')}"
-    elif name == ToolName.ENTER_PLAN_MODE:
-        return "EnterPlanMode"
-    elif name == ToolName.EXIT_PLAN_MODE:
-        return "ExitPlanMode"
-    else:
+    formatter = _HEADER_FORMATTERS.get(name)
+    if formatter is None:
         return f"{name}"
+    return formatter(input, cwd)
 
 
+@lru_cache(maxsize=1024)
 def get_lang_from_path(path: str) -> str:
     """Guess language from file extension for syntax highlighting."""
-    ext = Path(path).suffix.lower()
-    return {
-        ".py": "python",
-        ".js": "javascript",
-        ".ts": "typescript",
-        ".jsx": "jsx",
-        ".tsx": "tsx",
-        ".rs": "rust",
-        ".go": "go",
-        ".rb": "ruby",
-        ".java": "java",
-        ".c": "c",
-        ".cpp": "cpp",
-        ".h": "c",
-        ".hpp": "cpp",
-        ".css": "css",
-        ".html": "html",
-        ".json": "json",
-        ".yaml": "yaml",
-        ".yml": "yaml",
-        ".toml": "toml",
-        ".md": "markdown",
-        ".sh": "bash",
-        ".bash": "bash",
-    }.get(ext, "")
+    return _EXT_TO_LANG.get(Path(path).suffix.lower(), "")
 
 
 def _tokenize(s: str) -> list[str]:
     """Split string into words and punctuation for word-level diff."""
-    return re.findall(r"\w+|[^\w\s]|\s+", s)
+    return _TOKEN_RE.findall(s)
 
 
 def _render_word_diff(old_line: str, new_line: str, result: Text) -> None:
     """Render a single line pair with word-level highlighting."""
+    if old_line == new_line:
+        result.append(f"  {old_line}\n", style=_STYLE_CONTEXT)
+        return
     old_tokens = _tokenize(old_line)
     new_tokens = _tokenize(new_line)
-    sm = difflib.SequenceMatcher(None, old_tokens, new_tokens)
+    # Token-level matching is quadratic; skip it for very long lines
+    if max(len(old_tokens), len(new_tokens)) > MAX_WORD_DIFF_TOKENS:
+        result.append(f"- {old_line}\n", style=_STYLE_DEL)
+        result.append(f"+ {new_line}\n", style=_STYLE_INS)
+        return
+    sm = SequenceMatcher(None, old_tokens, new_tokens)
 
     # Build old line - use color only, no background
-    result.append("- ", style="red")
+    result.append("- ", style=_STYLE_DEL)
     for tag, i1, i2, j1, j2 in sm.get_opcodes():
         chunk = "".join(old_tokens[i1:i2])
         if tag == "equal":
-            result.append(chunk, style="red dim")
+            result.append(chunk, style=_STYLE_DEL_DIM)
         elif tag in ("delete", "replace"):
-            result.append(chunk, style="red bold")
+            result.append(chunk, style=_STYLE_DEL_WORD)
     result.append("\n")
 
     # Build new line - use color only, no background
-    result.append("+ ", style="green")
+    result.append("+ ", style=_STYLE_INS)
     for tag, i1, i2, j1, j2 in sm.get_opcodes():
         chunk = "".join(new_tokens[j1:j2])
         if tag == "equal":
-            result.append(chunk, style="green dim")
+            result.append(chunk, style=_STYLE_INS_DIM)
         elif tag in ("insert", "replace"):
-            result.append(chunk, style="green bold")
+            result.append(chunk, style=_STYLE_INS_WORD)
     result.append("\n")
 
 
@@ -273,67 +327,86 @@ def format_diff_text(old: str, new: str, max_len: int = 300) -> Text:
     result = Text()
     old_preview = old[:max_len] + ("..." if len(old) > max_len else "")
     new_preview = new[:max_len] + ("..." if len(new) > max_len else "")
-    old_lines = old_preview.split("\n") if old else []
-    new_lines = new_preview.split("\n") if new else []
-
-    sm = difflib.SequenceMatcher(None, old_lines, new_lines)
+    # Split on "\n" only (splitlines() would also break on \f, \v, U+2028, ...);
+    # a trailing newline doesn't start an extra empty line
+    old_lines = old_preview.removesuffix("\n").split("\n") if old else []
+    new_lines = new_preview.removesuffix("\n").split("\n") if new else []
+
+    # Shared leading lines are context; keep them out of the matcher
+    common = 0
+    for old_line, new_line in zip(old_lines, new_lines):
+        if old_line != new_line:
+            break
+        common += 1
+    for line in old_lines[:common]:
+        result.append(f"  {line}\n", style=_STYLE_CONTEXT)
+    old_lines = old_lines[common:]
+    new_lines = new_lines[common:]
+
+    sm = SequenceMatcher(None, old_lines, new_lines)
     for tag, i1, i2, j1, j2 in sm.get_opcodes():
         if tag == "equal":
             for line in old_lines[i1:i2]:
-                result.append(f"  {line}\n", style="dim")
+                result.append(f"  {line}\n", style=_STYLE_CONTEXT)
         elif tag == "delete":
             for line in old_lines[i1:i2]:
-                result.append(f"- {line}\n", style="red")
+                result.append(f"- {line}\n", style=_STYLE_DEL)
         elif tag == "insert":
             for line in new_lines[j1:j2]:
-                result.append(f"+ {line}\n", style="green")
+                result.append(f"+ {line}\n", style=_STYLE_INS)
         elif tag == "replace":
             # For replaced lines, highlight word-level changes
             for old_line, new_line in zip(old_lines[i1:i2], new_lines[j1:j2]):
                 _render_word_diff(old_line, new_line, result)
             # Handle unequal line counts
             for line in old_lines[i1 + len(new_lines[j1:j2]) : i2]:
-                result.append(f"- {line}\n", style="red")
+                result.append(f"- {line}\n", style=_STYLE_DEL)
             for line in new_lines[j1 + len(old_lines[i1:i2]) : j2]:
-                result.append(f"+ {line}\n", style="green")
+                result.append(f"+ {line}\n", style=_STYLE_INS)
     return result
 
 
+def _read_input(input: dict, cwd: Path | None) -> str:
+    path = make_relative(input.get("file_path", "?"), cwd)
+    offset = input.get("offset")
+    limit = input.get("limit")
+    if isinstance(offset, int) or isinstance(limit, int):
+        start = offset if isinstance(offset, int) else 0
+        end = start + limit if isinstance(limit, int) else "end"
+        return f"{path} (lines {start}-{end})"
+    return path
+
+
+def _search_input(input: dict, cwd: Path | None) -> str:
+    """Glob/Grep: pattern, plus the search path when not the cwd."""
+    pattern = input.get("pattern", "?")
+    path = input.get("path")
+    if path and path != ".":
+        return f"{pattern} in {path}"
+    return pattern
+
+
+def _write_input(input: dict, cwd: Path | None) -> str:
+    content = input.get("content", "")
+    return content[:400] + ("..." if len(content) > 400 else "")
+
+
+# Tool name -> plain-text input formatter(input, cwd)
+_INPUT_FORMATTERS: dict[str, Callable[[dict, Path | None], str]] = {
+    ToolName.WRITE: _write_input,
+    ToolName.READ: _read_input,
+    ToolName.BASH: lambda input, cwd: input.get("command", "?"),
+    ToolName.GLOB: _search_input,
+    ToolName.GREP: _search_input,
+    ToolName.ENTER_PLAN_MODE: lambda input, cwd: "Entering plan mode",
+    ToolName.EXIT_PLAN_MODE: lambda input, cwd: "Exiting plan mode",
+    ToolName.SKILL: lambda input, cwd: input.get("args", "") or "",
+}
+
+
 def format_tool_input(name: str, input: dict, cwd: Path | None = None) -> str:
     """Format plain-text input for a tool use (no markdown)."""
-    if name == ToolName.WRITE:
-        content = input.get("content", "")
-        preview = content[:400] + ("..." if len(content) > 400 else "")
-        return preview
-    elif name == ToolName.READ:
-        path = make_relative(input.get("file_path", "?"), cwd)
-        offset = input.get("offset")
-        limit = input.get("limit")
-        if isinstance(offset, int) or isinstance(limit, int):
-            start = offset if isinstance(offset, int) else 0
-            end = start + limit if isinstance(limit, int) else "end"
-            return f"{path} (lines {start}-{end})"
-        return path
-    elif name == ToolName.BASH:
-        return input.get("command", "?")
-    elif name == ToolName.GLOB:
-        pattern = input.get("pattern", "?")
-        path = input.get("path")
-        if path and path != ".":
-            return f"{pattern} in {path}"
-        return pattern
-    elif name == ToolName.GREP:
-        pattern = input.get("pattern", "?")
-        path = input.get("path")
-        if path and path != ".":
-            return f"{pattern} in {path}"
-        return pattern
-    elif name == ToolName.ENTER_PLAN_MODE:
-        return "Entering plan mode"
-    elif name == ToolName.EXIT_PLAN_MODE:
-        return "Exiting plan mode"
-    elif name == ToolName.SKILL:
-        args = input.get("args", "")
-        return args if args else ""
-    else:
+    formatter = _INPUT_FORMATTERS.get(name)
+    if formatter is None:
         return json.dumps(input, indent=2)
+    return formatter(input, cwd)
@@ -20,7 +20,7 @@ from typing import TYPE_CHECKING, Any
 from claude_agent_sdk import tool, create_sdk_mcp_server
 
 from claudechic.analytics import capture
-from claudechic.config import CONFIG
+from claudechic import config
 from claudechic.features.worktree.git import (
     FinishPhase,
     FinishState,
@@ -506,7 +506,7 @@ def create_chic_server(caller_name: str | None = None):
     ]
 
     # finish_worktree is experimental - enable with experimental.finish_worktree: true
-    if CONFIG.get("experimental", {}).get("finish_worktree", False):
+    if config.CONFIG.get("experimental", {}).get("finish_worktree", False):
         tools.append(finish_worktree)
 
     return create_sdk_mcp_server(
@@ -10,7 +10,7 @@ from claudechic.enums import PermissionChoice
 from claudechic.formatting import format_tool_header
 
 
-@dataclass
+@dataclass(slots=True)
 class PermissionResponse:
     """Response to a permission request.
 
@@ -21,7 +21,11 @@ class PermissionResponse:
     alternative_message: str | None = None
 
 
-@dataclass
+# Fallback when a request is released without a response
+_DENY_DEFAULT = PermissionResponse(PermissionChoice.DENY)
+
+
+@dataclass(slots=True)
 class PermissionRequest:
     """Represents a pending permission request.
 
@@ -32,6 +36,8 @@ class PermissionRequest:
     tool_input: dict[str, Any]
     _event: asyncio.Event = field(default_factory=asyncio.Event)
     _result: PermissionResponse | None = field(default=None)
+    # AskUserQuestion answers, filled in by the UI before allowing
+    _answers: dict[str, str] = field(default_factory=dict)
 
     @property
     def title(self) -> str:
@@ -50,4 +56,4 @@ class PermissionRequest:
             The PermissionResponse with choice and optional alternative message.
         """
         await self._event.wait()
-        return self._result or PermissionResponse(PermissionChoice.DENY)
+        return self._result or _DENY_DEFAULT
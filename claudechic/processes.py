@@ -5,15 +5,56 @@ On Windows, this module returns empty results since shell processes are
 named differently (cmd.exe, powershell.exe).
 """
 
+import functools
+import os
 import re
 import sys
-from dataclasses import dataclass
+import time
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
 
 import psutil
 
-
-@dataclass
+# Claude's eval wrapper: the full "eval '...' \< /dev/null" form is tried first,
+# so quotes inside the command don't end the match early
+_EVAL_RE = re.compile(r"eval ['\"](.+?)['\"] \\< /dev/null|eval ['\"](.+?)['\"]")
+# Output path in a background Bash task result
+_OUTPUT_FILE_RE = re.compile(r"Output is being written to: (.+)$")
+
+# Shell process names we track (where Claude's commands run)
+_SHELL_NAMES = frozenset({"zsh", "bash", "sh"})
+
+# On Linux, shell descendants are read straight from /proc rather than through
+# psutil.Process objects, which open several files per process
+_HAS_PROC = sys.platform.startswith("linux")
+_SHELL_COMMS = frozenset(name.encode() for name in _SHELL_NAMES)
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if _HAS_PROC else 100
+# /proc/<pid>/task/<tid>/children lists a thread's direct children, letting us
+# walk just the agent's subtree instead of scanning every process (needs
+# CONFIG_PROC_CHILDREN, which most distro kernels enable)
+_HAS_PROC_CHILDREN = _HAS_PROC and os.path.exists(
+    f"/proc/self/task/{os.getpid()}/children"
+)
+
+# Reuse one parent->children snapshot across agents refreshing together
+_CHILDREN_MAP_TTL = 0.5  # seconds
+_children_map_cache: tuple[float, dict[int, list[int]]] | None = None
+
+# psutil.Process objects reused across polls on the psutil path: building one
+# reads the process's create time, and name() is memoized on the object.
+# Exited PIDs are dropped whenever the ppid snapshot is refreshed.
+_proc_cache: dict[int, psutil.Process] = {}
+
+# BackgroundProcess objects reused across polls, per claude PID and keyed by
+# child PID with the (create_time, command) they were built from. Reuse keeps
+# steady-state polls allocation-free and preserves identity (and any
+# output_file set on them); each poll keeps only the processes it saw.
+_bgproc_cache: dict[int, dict[int, tuple[float, str, "BackgroundProcess"]]] = {}
+
+
+@dataclass(slots=True)
 class BackgroundProcess:
     """A background process being tracked."""
 
@@ -21,6 +62,14 @@ class BackgroundProcess:
     command: str  # Short description of the command
     start_time: datetime
     output_file: str | None = None  # Path to output file (for background tasks)
+    # Display truncations, computed once; the command never changes
+    short_command: str = field(init=False, repr=False, compare=False)  # sidebar
+    table_command: str = field(init=False, repr=False, compare=False)  # modal
+
+    def __post_init__(self) -> None:
+        cmd = self.command
+        self.short_command = cmd if len(cmd) <= 20 else cmd[:19] + "…"
+        self.table_command = cmd if len(cmd) <= 50 else cmd[:47] + "..."
 
 
 def _extract_command(cmdline: list[str]) -> str | None:
@@ -32,33 +81,214 @@ def _extract_command(cmdline: list[str]) -> str | None:
     We want to extract just 'sleep 30'.
     """
     # Find the argument containing the actual command (after -c and optional -l)
-    cmd_arg = None
-    for i, arg in enumerate(cmdline):
-        if arg == "-c" and i + 1 < len(cmdline):
-            # Next non-flag arg is the command
-            for j in range(i + 1, len(cmdline)):
-                if not cmdline[j].startswith("-"):
-                    cmd_arg = cmdline[j]
-                    break
-            break
+    try:
+        i = cmdline.index("-c")
+    except ValueError:
+        return None
+    # Next non-flag arg is the command
+    cmd_arg = next((arg for arg in cmdline[i + 1 :] if not arg.startswith("-")), None)
 
     if not cmd_arg:
         return None
 
-    # Try to extract from eval '...' pattern
-    match = re.search(r"eval ['\"](.+?)['\"] \\< /dev/null", cmd_arg)
+    # Try to extract from eval '...' pattern (with or without the stdin redirect)
+    match = _EVAL_RE.search(cmd_arg)
     if match:
-        return match.group(1)
-
-    # Try simpler eval pattern
-    match = re.search(r"eval ['\"](.+?)['\"]", cmd_arg)
-    if match:
-        return match.group(1)
+        return match.group(1) or match.group(2)
 
     # Fall back to full command (truncated)
     return cmd_arg[:50] if len(cmd_arg) > 50 else cmd_arg
 
 
+def _ppid_map() -> dict[int, int]:
+    """Get a PID -> parent PID map for every process."""
+    # psutil._ppid_map() reads the table in one pass without building Process
+    # objects, but it's private; fall back to the public API if it's gone
+    ppid_map = getattr(psutil, "_ppid_map", None)
+    if ppid_map is not None:
+        try:
+            return ppid_map()
+        except TypeError:
+            pass
+    return {p.pid: p.info["ppid"] for p in psutil.process_iter(["ppid"])}
+
+
+def _children_map() -> dict[int, list[int]]:
+    """Get a parent PID -> child PIDs map from a single process-table scan."""
+    global _children_map_cache
+    now = time.monotonic()
+    if _children_map_cache and now - _children_map_cache[0] < _CHILDREN_MAP_TTL:
+        return _children_map_cache[1]
+
+    ppid_map = _ppid_map()
+    children_of: dict[int, list[int]] = {}
+    for pid, ppid in ppid_map.items():
+        children_of.setdefault(ppid, []).append(pid)
+    _children_map_cache = (now, children_of)
+
+    # Drop cached Process objects for PIDs that have exited, so a reused PID
+    # never inherits a dead process's object
+    for pid in _proc_cache.keys() - ppid_map.keys():
+        del _proc_cache[pid]
+    return children_of
+
+
+def _descendants(pid: int) -> list[int]:
+    """Get all descendant PIDs of pid, breadth-first."""
+    children_of = _children_map()
+    result: list[int] = []
+    queue = deque(children_of.get(pid, ()))
+    while queue:
+        child = queue.popleft()
+        result.append(child)
+        queue.extend(children_of.get(child, ()))
+    return result
+
+
+@functools.cache
+def _boot_time() -> float:
+    """System boot time (constant for the life of the process)."""
+    return psutil.boot_time()
+
+
+def _read_proc_file(path: str, whole: bool = True) -> bytes:
+    """Read a /proc file with raw os calls.
+
+    Buffered open() adds fstat/ioctl/lseek calls per file; with a read per
+    descendant per poll, those dominate the cost of these tiny files.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, 4096)
+        if not whole:
+            return data
+        chunks = [data]
+        while data:
+            data = os.read(fd, 4096)
+            chunks.append(data)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _proc_descendants(pid: int) -> list[int]:
+    """Get all descendant PIDs of pid, breadth-first, via task children files.
+
+    Usually the agent has no children at all, so this ends after reading one
+    file per thread of the claude process.
+    """
+    result: list[int] = []
+    queue = deque((pid,))
+    while queue:
+        parent = queue.popleft()
+        try:
+            tids = os.listdir(f"/proc/{parent}/task")
+        except OSError:
+            continue
+        # A child is listed under the thread that forked it, so read them all
+        for tid in tids:
+            try:
+                data = _read_proc_file(f"/proc/{parent}/task/{tid}/children")
+            except OSError:
+                continue
+            for child in data.split():
+                child_pid = int(child)
+                result.append(child_pid)
+                queue.append(child_pid)
+    return result
+
+
+def _proc_stat(pid: int) -> tuple[bytes, bytes, int] | None:
+    """Read (comm, state, starttime in clock ticks) from /proc/<pid>/stat."""
+    try:
+        # One read is enough - the stat line is well under a page
+        data = _read_proc_file(f"/proc/{pid}/stat", whole=False)
+    except OSError:
+        return None
+    # comm is parenthesized and may itself contain ")", so split at the last one
+    lparen = data.find(b"(")
+    rparen = data.rfind(b")")
+    fields = data[rparen + 2 :].split()
+    try:
+        return data[lparen + 1 : rparen], fields[0], int(fields[19])
+    except (IndexError, ValueError):
+        return None
+
+
+def _proc_cmdline(pid: int) -> list[str]:
+    """Read a process's argv from /proc/<pid>/cmdline (same splitting as psutil)."""
+    try:
+        data = _read_proc_file(f"/proc/{pid}/cmdline")
+    except OSError:
+        return []
+    if data.endswith(b"\0"):
+        data = data[:-1]
+    args = data.split(b"\0")
+    # Some processes rewrite argv as one space-separated string
+    if len(args) == 1 and b" " in data:
+        args = data.split(b" ")
+    return [os.fsdecode(arg) for arg in args]
+
+
+def _proc_shell_descendants(claude_pid: int) -> Iterator[tuple[int, float, list[str]]]:
+    """Yield (pid, create_time, cmdline) for live shell descendants, via /proc."""
+    claude = _proc_stat(claude_pid)
+    if claude is None:
+        return
+    claude_start = claude[2]
+    descendants = _proc_descendants if _HAS_PROC_CHILDREN else _descendants
+    for pid in descendants(claude_pid):
+        stat = _proc_stat(pid)
+        if stat is None:
+            continue
+        comm, state, start = stat
+        # Only track live shell processes (where commands run); a child
+        # started before its parent means the PID was reused
+        if comm not in _SHELL_COMMS or state == b"Z" or start < claude_start:
+            continue
+        cmdline = _proc_cmdline(pid)
+        if cmdline:
+            yield pid, _boot_time() + start / _CLOCK_TICKS, cmdline
+
+
+def _get_proc(pid: int) -> psutil.Process:
+    """Get a (possibly cached) psutil.Process; raises like psutil.Process()."""
+    proc = _proc_cache.get(pid)
+    if proc is None:
+        proc = _proc_cache[pid] = psutil.Process(pid)
+    return proc
+
+
+def _psutil_shell_descendants(
+    claude_pid: int,
+) -> Iterator[tuple[int, float, list[str]]]:
+    """Yield (pid, create_time, cmdline) for live shell descendants, via psutil."""
+    try:
+        claude_ctime = _get_proc(claude_pid).create_time()
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        _proc_cache.pop(claude_pid, None)
+        return
+    for pid in _descendants(claude_pid):
+        try:
+            child = _get_proc(pid)
+            # oneshot() caches the per-process reads across these accessors
+            with child.oneshot():
+                # Only track shell processes (where commands run)
+                if child.name() not in _SHELL_NAMES:
+                    continue
+                if child.status() == psutil.STATUS_ZOMBIE:
+                    continue
+                # A child older than its parent means the PID was reused
+                create_time = child.create_time()
+                if create_time < claude_ctime:
+                    continue
+                cmdline = child.cmdline()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            _proc_cache.pop(pid, None)
+            continue
+        yield pid, create_time, cmdline
+
+
 def get_child_processes(claude_pid: int) -> list[BackgroundProcess]:
     """Get background processes that are children of a claude process.
 
@@ -73,45 +303,69 @@ def get_child_processes(claude_pid: int) -> list[BackgroundProcess]:
     if sys.platform == "win32":
         return []
 
-    try:
-        claude_proc = psutil.Process(claude_pid)
-    except (psutil.NoSuchProcess, psutil.AccessDenied):
-        return []
-
+    shells = _proc_shell_descendants if _HAS_PROC else _psutil_shell_descendants
+    cache = _bgproc_cache.get(claude_pid, {})
+    seen: dict[int, tuple[float, str, BackgroundProcess]] = {}
     processes = []
-    for child in claude_proc.children(recursive=True):
-        try:
-            name = child.name()
-            # Only track shell processes (where commands run)
-            if name not in ("zsh", "bash", "sh"):
-                continue
+    for pid, create_time, cmdline in shells(claude_pid):
+        # Extract the command being run
+        command = _extract_command(cmdline)
+        if not command:
+            continue
 
-            status = child.status()
-            if status == psutil.STATUS_ZOMBIE:
-                continue
+        # Filter out our own monitoring commands
+        if command.startswith("ps "):
+            continue
 
-            # Extract the command being run
-            cmdline = child.cmdline()
-            command = _extract_command(cmdline)
-            if not command:
-                continue
+        cached = cache.get(pid)
+        if not (cached and cached[0] == create_time and cached[1] == command):
+            proc = BackgroundProcess(
+                pid=pid,
+                command=command,
+                start_time=datetime.fromtimestamp(create_time),
+            )
+            cached = (create_time, command, proc)
+        seen[pid] = cached
+        processes.append(cached[2])
+
+    if seen:
+        _bgproc_cache[claude_pid] = seen
+    else:
+        _bgproc_cache.pop(claude_pid, None)
+    return processes
 
-            # Filter out our own monitoring commands
-            if command.startswith("ps "):
-                continue
 
-            # Get start time
-            create_time = datetime.fromtimestamp(child.create_time())
+class ProcessWatcher:
+    """Adaptive poll interval for background process scans.
 
-            processes.append(
-                BackgroundProcess(
-                    pid=child.pid, command=command, start_time=create_time
-                )
-            )
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            continue
+    While consecutive scans return the same processes the interval grows by
+    `factor` up to `max_interval`; any change drops it back to `interval`.
+    """
 
-    return processes
+    def __init__(
+        self, interval: float = 2.0, max_interval: float = 12.0, factor: float = 1.5
+    ) -> None:
+        self.interval = interval
+        self.max_interval = max_interval
+        self.factor = factor
+        self._delay = interval
+        self._last: frozenset[tuple[int, str]] | None = None
+
+    def next_delay(self, processes: list[BackgroundProcess]) -> float:
+        """Record a scan result and return the delay before the next scan."""
+        signature = frozenset((p.pid, p.command) for p in processes)
+        if signature == self._last:
+            self._delay = min(self._delay * self.factor, self.max_interval)
+        else:
+            self._last = signature
+            self._delay = self.interval
+        return self._delay
+
+    def reset(self) -> bool:
+        """Drop back to the base interval. Returns True if it was backed off."""
+        backed_off = self._delay > self.interval
+        self._delay = self.interval
+        return backed_off
 
 
 def parse_background_task_output(result: str) -> str | None:
@@ -122,7 +376,7 @@ def parse_background_task_output(result: str) -> str | None:
 
     Returns the output file path, or None if not a background task.
     """
-    match = re.search(r"Output is being written to: (.+)$", result)
+    match = _OUTPUT_FILE_RE.search(result)
     return match.group(1) if match else None
 
 
@@ -3,57 +3,74 @@
 import functools
 import inspect
 import os
+import sys
 import time
-from collections import defaultdict
 from contextlib import contextmanager
 
 _enabled = os.environ.get("CHIC_PROFILE", "true").lower() != "false"
-_stats: dict[str, dict] = defaultdict(lambda: {"count": 0, "total": 0.0, "max": 0.0})
+# label -> [count, total_ns, max_ns]; a flat list per label keeps each update
+# to one dict lookup, and integer nanoseconds accumulate exactly
+_stats: dict[str, list] = {}
+_COUNT, _TOTAL, _MAX = 0, 1, 2
 _start_time = time.perf_counter()
 
 
+def _record(label: str, elapsed: int) -> None:
+    """Add one timing sample to a label's stats."""
+    entry = _stats.get(label)
+    if entry is None:
+        _stats[label] = [1, elapsed, elapsed]
+        return
+    entry[_COUNT] += 1
+    entry[_TOTAL] += elapsed
+    if elapsed > entry[_MAX]:
+        entry[_MAX] = elapsed
+
+
 @contextmanager
 def timed(label: str):
     """Context manager to time a block of code."""
     if not _enabled:
         yield
         return
-    start = time.perf_counter()
+    start = time.perf_counter_ns()
     yield
-    elapsed = time.perf_counter() - start
-    _stats[label]["count"] += 1
-    _stats[label]["total"] += elapsed
-    _stats[label]["max"] = max(_stats[label]["max"], elapsed)
+    _record(label, time.perf_counter_ns() - start)
 
 
 def profile(fn):
     """Decorator to track function call count and timing."""
     if not _enabled:
         return fn
-    label = fn.__qualname__
+    # Interned so per-call dict lookups hit the identity fast path
+    label = sys.intern(fn.__qualname__)
+
+    # Bound locally: the wrappers run on hot UI paths, and every global or
+    # attribute lookup here is overhead added to the measurement itself
+    perf_counter_ns = time.perf_counter_ns
+    record = _record
+
+    # Only build the wrapper this function needs
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            start = perf_counter_ns()
+            result = await fn(*args, **kwargs)
+            elapsed = perf_counter_ns() - start
+            record(label, elapsed)
+            return result
+
+        return async_wrapper
 
     @functools.wraps(fn)
     def wrapper(*args, **kwargs):
-        start = time.perf_counter()
+        start = perf_counter_ns()
         result = fn(*args, **kwargs)
-        elapsed = time.perf_counter() - start
-        _stats[label]["count"] += 1
-        _stats[label]["total"] += elapsed
-        _stats[label]["max"] = max(_stats[label]["max"], elapsed)
+        elapsed = perf_counter_ns() - start
+        record(label, elapsed)
         return result
 
-    @functools.wraps(fn)
-    async def async_wrapper(*args, **kwargs):
-        start = time.perf_counter()
-        result = await fn(*args, **kwargs)
-        elapsed = time.perf_counter() - start
-        _stats[label]["count"] += 1
-        _stats[label]["total"] += elapsed
-        _stats[label]["max"] = max(_stats[label]["max"], elapsed)
-        return result
-
-    if inspect.iscoroutinefunction(fn):
-        return async_wrapper
     return wrapper
 
 
@@ -76,18 +93,26 @@ def get_stats_table():
     table.add_column("Avg", justify="right")
     table.add_column("Max", justify="right")
 
-    for name, data in sorted(_stats.items(), key=lambda x: -x[1]["total"]):
-        avg = data["total"] / data["count"] * 1000 if data["count"] else 0
+    for name, count, total_ms, avg_ms, max_ms in _stats_rows():
         table.add_row(
             name,
-            str(data["count"]),
-            f"{data['total'] * 1000:.1f}ms",
-            f"{avg:.2f}ms",
-            f"{data['max'] * 1000:.2f}ms",
+            str(count),
+            f"{total_ms:.1f}ms",
+            f"{avg_ms:.2f}ms",
+            f"{max_ms:.2f}ms",
         )
     return table
 
 
+def _stats_rows() -> list[tuple[str, int, float, float, float]]:
+    """Snapshot stats as (name, count, total_ms, avg_ms, max_ms), slowest first."""
+    items = sorted(_stats.items(), key=lambda x: x[1][_TOTAL], reverse=True)
+    return [
+        (name, count, total / 1e6, total / count / 1e6 if count else 0, max_ / 1e6)
+        for name, (count, total, max_) in items
+    ]
+
+
 def get_session_duration() -> float:
     """Get session duration in seconds."""
     return time.perf_counter() - _start_time
@@ -112,9 +137,8 @@ def get_stats_text() -> str:
         f"{'Function':<45} {'Calls':>8} {'Total':>10} {'Avg':>10} {'Max':>10}",
         "-" * 85,
     ]
-    for name, data in sorted(_stats.items(), key=lambda x: -x[1]["total"]):
-        avg = data["total"] / data["count"] * 1000 if data["count"] else 0
-        lines.append(
-            f"{name:<45} {data['count']:>8} {data['total'] * 1000:>9.1f}ms {avg:>9.2f}ms {data['max'] * 1000:>9.2f}ms"
-        )
+    lines.extend(
+        f"{name:<45} {count:>8} {total_ms:>9.1f}ms {avg_ms:>9.2f}ms {max_ms:>9.2f}ms"
+        for name, count, total_ms, avg_ms, max_ms in _stats_rows()
+    )
     return "\n".join(lines)
@@ -1,5 +1,6 @@
 """Session browser screen."""
 
+import time
 from pathlib import Path
 
 from textual.app import ComposeResult
@@ -10,6 +11,13 @@ from textual.widgets import ListView, Input, Static
 
 from claudechic.widgets.layout.sidebar import SessionItem
 
+# Session rows by (cwd, search), reused briefly so retyping a search or
+# reopening the browser doesn't rescan the session files
+_ROWS_CACHE_TTL = 2.0  # seconds
+_rows_cache: dict[
+    tuple[Path | None, str], tuple[float, list[tuple[str, str, float, int]]]
+] = {}
+
 
 class SessionScreen(Screen[str | None]):
     """Full-screen session browser for resuming sessions.
@@ -106,19 +114,35 @@ class SessionScreen(Screen[str | None]):
     async def _fetch_sessions(self, search: str) -> list[tuple[str, str, float, int]]:
         from claudechic.sessions import get_recent_sessions
 
-        return await get_recent_sessions(search=search, cwd=self._cwd)
+        key = (self._cwd, search)
+        now = time.monotonic()
+        cached = _rows_cache.get(key)
+        if cached and now - cached[0] < _ROWS_CACHE_TTL:
+            return cached[1]
+        sessions = await get_recent_sessions(search=search, cwd=self._cwd)
+        # Drop expired entries so the cache stays bounded to recent searches
+        for stale in [
+            k for k, (t, _) in _rows_cache.items() if now - t >= _ROWS_CACHE_TTL
+        ]:
+            del _rows_cache[stale]
+        _rows_cache[key] = (now, sessions)
+        return sessions
 
     def _update_list(self, search: str) -> None:
-        self.run_worker(self._do_update(search))
+        self.run_worker(self._do_update(search), group="session-list", exclusive=True)
 
     async def _do_update(self, search: str) -> None:
         sessions = await self._fetch_sessions(search)
         list_view = self.query_one("#session-list", ListView)
-        list_view.clear()
-        for session_id, title, mtime, msg_count in sessions:
-            list_view.append(SessionItem(session_id, title, mtime, msg_count))
-        if sessions:
-            list_view.index = 0
+        # Swap the rows in one batch so the list lays out and repaints once
+        with self.app.batch_update():
+            list_view.clear()
+            list_view.extend(
+                SessionItem(session_id, title, mtime, msg_count)
+                for session_id, title, mtime, msg_count in sessions
+            )
+            if sessions:
+                list_view.index = 0
 
     def on_input_changed(self, event: Input.Changed) -> None:
         if event.input.id == "session-search":
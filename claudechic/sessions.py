@@ -1,21 +1,40 @@
 """Session management - loading and listing Claude Code sessions."""
 
+import asyncio
+import heapq
 import json
 import os
-import re
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
+from typing import BinaryIO, Iterator
 
-import aiofiles
+try:
+    # orjson is several times faster on the JSONL session files (the
+    # "speedups" extra); stdlib json also accepts the bytes lines below
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+_UUID_CHARS = frozenset("0123456789abcdefABCDEF-")
+
+# Byte markers for scanning compact JSONL session entries
+_USER_TAG = b'"type":"user"'
+_ASSISTANT_TAG = b'"type":"assistant"'
+_SUMMARY_TAG = b'"type":"summary"'
+_TIMESTAMP_TAG = b'"timestamp":"'
+_USAGE_TAG = b'"usage"'
+_SLUG_TAG = b'"slug"'
 
 
 def is_valid_uuid(s: str) -> bool:
     """Check if string is a valid UUID (not agent-* internal sessions)."""
-    return bool(
-        re.match(
-            r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", s, re.I
-        )
-    )
+    # Structural check (8-4-4-4-12 hex groups) - cheaper than a regex match
+    # and called once per session file when listing
+    if len(s) != 36 or s[8] != "-" or s[13] != "-" or s[18] != "-" or s[23] != "-":
+        return False
+    return s.count("-") == 4 and _UUID_CHARS.issuperset(s)
 
 
 def find_session_by_prefix(prefix: str, cwd: Path | None = None) -> str | None:
@@ -37,10 +56,11 @@ def find_session_by_prefix(prefix: str, cwd: Path | None = None) -> str | None:
         return None
 
     prefix_lower = prefix.lower()
-    matches = []
-    for f in sessions_dir.glob("*.jsonl"):
-        if f.stem.lower().startswith(prefix_lower) and is_valid_uuid(f.stem):
-            matches.append(f.stem)
+    matches = [
+        stem
+        for stem, _ in _iter_session_entries(sessions_dir)
+        if stem.lower().startswith(prefix_lower)
+    ]
 
     return matches[0] if len(matches) == 1 else None
 
@@ -50,7 +70,29 @@ def count_sessions(cwd: Path | None = None) -> int:
     sessions_dir = get_project_sessions_dir(cwd)
     if not sessions_dir:
         return 0
-    return sum(1 for f in sessions_dir.glob("*.jsonl") if is_valid_uuid(f.stem))
+    return sum(1 for _ in _iter_session_entries(sessions_dir))
+
+
+def _iter_session_entries(sessions_dir: Path) -> Iterator[tuple[str, os.DirEntry]]:
+    """Yield (session_id, entry) for each UUID-named .jsonl file.
+
+    Uses os.scandir so names are filtered without building Path objects or
+    touching the files themselves.
+    """
+    with os.scandir(sessions_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            # "<36-char uuid>.jsonl"
+            if len(name) != 42 or not name.endswith(".jsonl"):
+                continue
+            stem = name[:-6]
+            if is_valid_uuid(stem):
+                yield stem, entry
+
+
+# cwd -> project key: path separators and dots become dashes, and the Windows
+# drive colon is dropped (C:\foo -> C-foo); one translate() pass
+_PROJECT_KEY_TABLE = str.maketrans({os.sep: "-", ".": "-", ":": None})
 
 
 def get_project_sessions_dir(cwd: Path | None = None) -> Path | None:
@@ -63,9 +105,7 @@ def get_project_sessions_dir(cwd: Path | None = None) -> Path | None:
         cwd: Project directory. If None, uses current working directory.
     """
     cwd = (cwd or Path.cwd()).absolute()
-    # Replace path separators with dashes (handles both / and \ on Windows)
-    # Also remove Windows drive colon (C:\foo -> C-foo)
-    project_key = str(cwd).replace(os.sep, "-").replace(":", "").replace(".", "-")
+    project_key = str(cwd).translate(_PROJECT_KEY_TABLE)
     sessions_dir = Path.home() / ".claude/projects" / project_key
     return sessions_dir if sessions_dir.exists() else None
 
@@ -84,70 +124,164 @@ def _get_session_file(
     return session_file if session_file.exists() else None
 
 
+def _line_at(buf: bytes, pos: int) -> tuple[int, int]:
+    """Return (start, end) of the line containing byte offset pos."""
+    start = buf.rfind(b"\n", 0, pos) + 1
+    end = buf.find(b"\n", pos)
+    return start, len(buf) if end == -1 else end
+
+
+# Binary mode matters on Windows, where os.open defaults to text mode
+_O_RDONLY_BINARY = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+
+# Session bytes scanned for the plan slug (near the start) and for the last
+# usage block (near the end)
+_SLUG_SCAN_BYTES = 32768
+_USAGE_SCAN_BYTES = 32768
+
+
+def _read_head_and_tail(path: str, size: int) -> tuple[bytes, bytes]:
+    """Read the slug-scan head and usage-scan tail of a file with one open.
+
+    Small files are read once and both views sliced from the same buffer.
+    """
+    fd = os.open(path, _O_RDONLY_BINARY)
+    try:
+        if size <= _SLUG_SCAN_BYTES + _USAGE_SCAN_BYTES:
+            buf = os.read(fd, size)
+            return buf[:_SLUG_SCAN_BYTES], buf[-_USAGE_SCAN_BYTES:]
+        head = os.read(fd, _SLUG_SCAN_BYTES)
+        offset = size - _USAGE_SCAN_BYTES
+        if hasattr(os, "pread"):
+            return head, os.pread(fd, _USAGE_SCAN_BYTES, offset)
+        # No pread on Windows
+        os.lseek(fd, offset, os.SEEK_SET)
+        return head, os.read(fd, _USAGE_SCAN_BYTES)
+    finally:
+        os.close(fd)
+
+
+def _first_message_text(d: dict) -> str:
+    """Extract a title candidate from a user entry, or "" if unsuitable."""
+    content = d.get("message", {}).get("content", "")
+    if isinstance(content, str) and content.strip():
+        if not content.startswith("<command-"):
+            return content.replace("\n", " ")[:100]
+    elif isinstance(content, list) and content:
+        block = content[0]
+        if block.get("type") == "text":
+            txt = block.get("text", "")
+            if txt.strip() and not txt.startswith("<command-"):
+                return txt.replace("\n", " ")[:100]
+    return ""
+
+
 def _extract_session_info(filepath: Path) -> tuple[str, int, float]:
     """Extract title, message count, and timestamp from a session file.
 
     Claude Code uses summary field if available, otherwise first user message.
     Counts non-meta user entries.
 
+    The file is streamed line by line and only lines carrying a user or
+    summary marker are decoded; their top-level fields are then checked,
+    since progress entries embed sub-agent messages with their own "type".
+    The timestamp comes from the last entry, read back from the end.
+
     Returns (title, msg_count, last_timestamp_unix).
     """
     summary = ""
     first_msg = ""
     msg_count = 0
-    last_timestamp: float = 0
 
     try:
-        with open(filepath, encoding="utf-8") as f:
+        with open(filepath, "rb") as f:
             for line in f:
-                if not line.strip():
+                if _USER_TAG not in line and _SUMMARY_TAG not in line:
                     continue
                 try:
-                    d = json.loads(line)
-                    msg_type = d.get("type")
-
-                    # Check for summary (preferred title source)
-                    if msg_type == "summary":
-                        summary = d.get("summary", "")
-
-                    # Count and extract first message
-                    elif msg_type == "user" and not d.get("isMeta"):
-                        msg_count += 1
-                        # Extract first message as fallback title
-                        if not first_msg:
-                            content = d.get("message", {}).get("content", "")
-                            if isinstance(content, str) and content.strip():
-                                if not content.startswith("<command-"):
-                                    first_msg = content.replace("\n", " ")[:100]
-                            elif isinstance(content, list) and content:
-                                block = content[0]
-                                if block.get("type") == "text":
-                                    txt = block.get("text", "")
-                                    if txt.strip() and not txt.startswith("<command-"):
-                                        first_msg = txt.replace("\n", " ")[:100]
-
-                    # Track timestamp from any entry
-                    if ts := d.get("timestamp"):
-                        try:
-                            dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                            last_timestamp = max(last_timestamp, dt.timestamp())
-                        except ValueError:
-                            pass
+                    d = _json_loads(line)
                 except (json.JSONDecodeError, UnicodeDecodeError):
                     continue
+                if not isinstance(d, dict):
+                    continue
+                msg_type = d.get("type")
+                if msg_type == "summary":
+                    summary = d.get("summary", "")
+                elif msg_type == "user" and not d.get("isMeta"):
+                    msg_count += 1
+                    if not first_msg:
+                        first_msg = _first_message_text(d)
+            latest = _read_last_timestamp(f)
     except (IOError, OSError):
-        pass
+        return "", 0, 0
+
+    last_timestamp: float = 0
+    if latest:
+        try:
+            last_timestamp = datetime.fromisoformat(
+                latest.replace("Z", "+00:00")
+            ).timestamp()
+        except ValueError:
+            pass
 
     # Prefer summary over first message
     title = summary or first_msg
     return title, msg_count, last_timestamp
 
 
+# Bytes first read back from the end of a session file for its last timestamp
+_TIMESTAMP_SCAN_BYTES = 16384
+
+
+def _read_last_timestamp(f: BinaryIO) -> str:
+    """Read the newest top-level timestamp from the end of a session file.
+
+    Entries are appended in time order, so it's on the last entry that has
+    one; the window only grows when the tail lines carry none.
+    """
+    size = f.seek(0, os.SEEK_END)
+    window = _TIMESTAMP_SCAN_BYTES
+    while True:
+        offset = max(0, size - window)
+        f.seek(offset)
+        chunk = f.read(size - offset)
+        if offset:
+            chunk = chunk[chunk.find(b"\n") + 1 :]  # Drop the partial first line
+        if (ts := _find_last_timestamp(chunk)) or not offset:
+            return ts
+        window *= 4
+
+
+def _find_last_timestamp(chunk: bytes) -> str:
+    """Top-level timestamp of the last entry in chunk that has one, or ""."""
+    # Nested messages carry timestamps too, so each candidate is decoded
+    pos = chunk.rfind(_TIMESTAMP_TAG)
+    while pos != -1:
+        start, end = _line_at(chunk, pos)
+        pos = chunk.rfind(_TIMESTAMP_TAG, 0, start)
+        try:
+            data = _json_loads(chunk[start:end])
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+        ts = data.get("timestamp") if isinstance(data, dict) else None
+        if isinstance(ts, str):
+            return ts
+    return ""
+
+
+# Max session files read concurrently when listing sessions
+_SESSION_READ_CONCURRENCY = 16
+
+
 async def get_recent_sessions(
     limit: int = 20, search: str = "", cwd: Path | None = None
 ) -> list[tuple[str, str, float, int]]:
     """Get recent sessions from session files (matching Claude Code behavior).
 
+    The directory scan and each file read run in worker threads, with the
+    reads issued concurrently so their I/O overlaps.
+
     Args:
         limit: Maximum number of sessions to return
         search: Optional text to filter sessions by title
@@ -157,52 +291,70 @@ async def get_recent_sessions(
         List of (session_id, title, timestamp, msg_count) tuples,
         sorted by content timestamp descending.
     """
-    sessions_dir = get_project_sessions_dir(cwd)
-    if not sessions_dir:
-        return []
-
-    # Get files sorted by mtime for initial ordering
-    candidates = []
-    for f in sessions_dir.glob("*.jsonl"):
-        if not is_valid_uuid(f.stem):
-            continue
-        try:
-            stat = f.stat()
-            if stat.st_size > 0:
-                candidates.append((f, stat.st_mtime))
-        except OSError:
-            continue
-
-    candidates.sort(key=lambda x: x[1], reverse=True)
-
-    search_lower = search.lower()
-    sessions = []
+    candidates = await asyncio.to_thread(_list_session_candidates, cwd)
 
     # We need to scan more files than limit because file mtime may not match
     # content timestamp. Scan up to 5x limit to catch recent sessions.
-    scan_limit = limit * 5
+    candidates = candidates[: limit * 5]
+
+    sem = asyncio.Semaphore(_SESSION_READ_CONCURRENCY)
 
-    for i, (f, mtime) in enumerate(candidates):
-        if i >= scan_limit:
-            break
+    async def read_info(path: str, mtime: float, size: int) -> tuple[str, int, float]:
+        async with sem:
+            return await asyncio.to_thread(_cached_session_info, path, mtime, size)
 
-        title, msg_count, last_ts = _extract_session_info(f)
+    infos = await asyncio.gather(
+        *(read_info(path, mtime, size) for _, path, mtime, size in candidates)
+    )
 
+    search_lower = search.lower()
+    sessions = []
+    for (stem, _, mtime, _), (title, msg_count, last_ts) in zip(candidates, infos):
         if msg_count == 0:
             continue
 
-        title = title or f.stem[:8]
+        title = title or stem[:8]
         if search and search_lower not in title.lower():
             continue
 
         # Prefer timestamp from file content over file mtime
         effective_time = last_ts or mtime
-        sessions.append((f.stem, title, effective_time, msg_count))
+        sessions.append((stem, title, effective_time, msg_count))
+
+    # Top `limit` by content timestamp (more accurate than file mtime)
+    return heapq.nlargest(limit, sessions, key=itemgetter(2))
+
+
+@lru_cache(maxsize=512)
+def _cached_session_info(path: str, mtime: float, size: int) -> tuple[str, int, float]:
+    """_extract_session_info() keyed by stat, so unchanged files aren't re-read.
+
+    Sessions are append-only, so any change moves mtime and size.
+    """
+    return _extract_session_info(Path(path))
+
+
+def _list_session_candidates(
+    cwd: Path | None,
+) -> list[tuple[str, str, float, int]]:
+    """List (session_id, path, mtime, size) for non-empty session files, newest first."""
+    sessions_dir = get_project_sessions_dir(cwd)
+    if not sessions_dir:
+        return []
 
-    # Sort by content timestamp (more accurate than file mtime)
-    sessions.sort(key=lambda x: x[2], reverse=True)
+    # Get files sorted by mtime for initial ordering; empty files are skipped
+    # on their stat alone, without being opened
+    candidates = []
+    for stem, entry in _iter_session_entries(sessions_dir):
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        if stat.st_size > 0:
+            candidates.append((stem, entry.path, stat.st_mtime, stat.st_size))
 
-    return sessions[:limit]
+    candidates.sort(key=itemgetter(2), reverse=True)
+    return candidates
 
 
 async def load_session_messages(session_id: str, cwd: Path | None = None) -> list[dict]:
@@ -216,13 +368,22 @@ async def load_session_messages(session_id: str, cwd: Path | None = None) -> lis
     session_file = _get_session_file(session_id, cwd)
     if not session_file:
         return []
+    # Read and parse in a worker thread; long sessions take a while to decode
+    return await asyncio.to_thread(_read_session_messages, session_file)
+
 
+def _read_session_messages(session_file: Path) -> list[dict]:
+    """Blocking implementation of load_session_messages()."""
     skip_tags = ("<command-name>/", "<local-command-stdout>", "<local-command-caveat>")
     messages = []
     try:
-        async with aiofiles.open(session_file) as f:
-            async for line in f:
-                d = json.loads(line)
+        with open(session_file, "rb") as f:
+            for line in f:
+                # Most lines are progress/system/tool-result noise; only decode
+                # lines that can be user or assistant entries
+                if _USER_TAG not in line and _ASSISTANT_TAG not in line:
+                    continue
+                d = _json_loads(line)
                 if d.get("type") == "user":
                     content = d.get("message", {}).get("content", "")
                     if isinstance(content, str) and content.strip():
@@ -257,6 +418,70 @@ async def load_session_messages(session_id: str, cwd: Path | None = None) -> lis
     return messages
 
 
+def _find_slug(chunk: bytes) -> str | None:
+    """Find the plan slug in the head of a session file."""
+    # Jump between lines mentioning "slug" instead of splitting the chunk
+    pos = chunk.find(_SLUG_TAG)
+    while pos != -1:
+        start, end = _line_at(chunk, pos)
+        try:
+            data = _json_loads(chunk[start:end])
+            if "slug" in data:
+                return data["slug"]
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            # Skip lines that fail to parse (partial line at chunk boundary)
+            pass
+        pos = chunk.find(_SLUG_TAG, end)
+    return None
+
+
+def _find_context_tokens(chunk: bytes) -> int | None:
+    """Sum input context tokens from the last usage block in a session tail."""
+    # Walk back through lines mentioning usage, newest first; only
+    # assistant entries carry it, so everything else is never parsed
+    pos = chunk.rfind(_USAGE_TAG)
+    while pos != -1:
+        start, end = _line_at(chunk, pos)
+        pos = chunk.rfind(_USAGE_TAG, 0, start)
+        try:
+            data = _json_loads(chunk[start:end])
+            if "message" in data and isinstance(data["message"], dict):
+                usage = data["message"].get("usage")
+                if usage:
+                    return (
+                        usage.get("input_tokens", 0)
+                        + usage.get("cache_creation_input_tokens", 0)
+                        + usage.get("cache_read_input_tokens", 0)
+                    )
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            # Skip lines that fail to parse - expected for partial lines
+            # when reading from middle of file (chunk may split UTF-8 chars)
+            continue
+    return None
+
+
+def _session_summary(session_file: Path) -> tuple[str | None, int | None]:
+    """Get a session's (plan slug, context tokens), re-reading only on change."""
+    st = session_file.stat()
+    return _scan_session_file(str(session_file), st.st_mtime, st.st_size)
+
+
+@lru_cache(maxsize=512)
+def _scan_session_file(
+    path: str, mtime: float, size: int
+) -> tuple[str | None, int | None]:
+    """Read a session file's head and tail once and answer both lookups.
+
+    The plan path and context size are refreshed together for the same
+    session, so one open serves both; sessions are append-only, so any
+    change moves mtime and size.
+    """
+    if size == 0:
+        return None, None
+    head, tail = _read_head_and_tail(path, size)
+    return _find_slug(head), _find_context_tokens(tail)
+
+
 async def get_plan_path_for_session(
     session_id: str, cwd: Path | None = None, must_exist: bool = True
 ) -> Path | None:
@@ -272,23 +497,8 @@ async def get_plan_path_for_session(
     if not session_file:
         return None
 
-    # Find slug in session file (read first 32KB, slug appears early)
-    slug = None
     try:
-        async with aiofiles.open(session_file, mode="rb") as f:
-            chunk = await f.read(32768)
-
-        for line in chunk.split(b"\n"):
-            if b'"slug"' not in line:
-                continue
-            try:
-                data = json.loads(line)
-                if "slug" in data:
-                    slug = data["slug"]
-                    break
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                # Skip lines that fail to parse (partial line at chunk boundary)
-                continue
+        slug, _ = await asyncio.to_thread(_session_summary, session_file)
     except (IOError, OSError):
         return None
 
@@ -312,38 +522,8 @@ async def get_context_from_session(
     if not session_file:
         return None
 
-    # Read from end of file to find last usage entry efficiently
     try:
-        file_size = os.path.getsize(session_file)
-        if file_size == 0:
-            return None
-
-        # Read last chunk (usually enough to find last usage)
-        chunk_size = min(32768, file_size)  # 32KB chunk
-        async with aiofiles.open(session_file, mode="rb") as f:
-            await f.seek(file_size - chunk_size)
-            chunk = await f.read()
-
-        # Split into lines, process in reverse
-        lines = chunk.split(b"\n")
-        for line in reversed(lines):
-            if not line.strip():
-                continue
-            try:
-                data = json.loads(line)
-                if "message" in data and isinstance(data["message"], dict):
-                    usage = data["message"].get("usage")
-                    if usage:
-                        return (
-                            usage.get("input_tokens", 0)
-                            + usage.get("cache_creation_input_tokens", 0)
-                            + usage.get("cache_read_input_tokens", 0)
-                        )
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                # Skip lines that fail to parse - expected for partial lines
-                # when reading from middle of file (chunk may split UTF-8 chars)
-                continue
+        _, tokens = await asyncio.to_thread(_session_summary, session_file)
     except (IOError, OSError):
         return None
-
-    return None
+    return tokens
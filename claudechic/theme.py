@@ -21,7 +21,7 @@ Use /theme to search and switch between available themes.
 
 from textual.theme import BUILTIN_THEMES, Theme
 
-from claudechic.config import CONFIG
+from claudechic import config
 
 # Default Claude Chic theme - orange accent, dark background
 CHIC_THEME = Theme(
@@ -75,7 +75,7 @@ _CHIC_DEFAULTS = {f: getattr(CHIC_THEME, f) for f in _THEME_FIELDS}
 def get_available_theme_names() -> set[str]:
     """Return names of all available themes (Textual built-in + claudechic + custom)."""
     names = set(BUILTIN_THEMES.keys()) | {"chic", "chic-light"}
-    for name, colors in CONFIG.get("themes", {}).items():
+    for name, colors in config.CONFIG.get("themes", {}).items():
         if isinstance(colors, dict):
             names.add(name)
     return names
@@ -87,7 +87,7 @@ def load_custom_themes() -> list[Theme]:
     Returns list of Theme objects defined in ~/.claude/.claudechic.yaml
     Missing values inherit from CHIC_THEME defaults.
     """
-    themes_config = CONFIG.get("themes", {})
+    themes_config = config.CONFIG.get("themes", {})
     custom_themes = []
 
     for name, colors in themes_config.items():
@@ -1,6 +1,5 @@
 """Syntax-highlighted diff widget."""
 
-import difflib
 import re
 from functools import lru_cache
 
@@ -11,7 +10,7 @@ from textual.containers import HorizontalScroll
 from textual.highlight import HighlightTheme
 from textual.widgets import Static
 
-from claudechic.formatting import get_lang_from_path
+from claudechic.formatting import SequenceMatcher, get_lang_from_path
 
 
 # Theme-aware diff styles - dark and light variants
@@ -140,7 +139,7 @@ def _word_diff_spans(
     old_strs = [t[0] for t in old_tokens]
     new_strs = [t[0] for t in new_tokens]
 
-    sm = difflib.SequenceMatcher(None, old_strs, new_strs)
+    sm = SequenceMatcher(None, old_strs, new_strs)
     old_spans = []
     new_spans = []
 
@@ -306,7 +305,7 @@ class DiffWidget(HorizontalScroll):
         old_highlighted = _highlight_lines(self._old, lang)
         new_highlighted = _highlight_lines(self._new, lang)
 
-        sm = difflib.SequenceMatcher(None, old_lines, new_lines)
+        sm = SequenceMatcher(None, old_lines, new_lines)
         grouped = list(sm.get_grouped_opcodes(self._context_lines))
 
         max_old = self._old_start + len(old_lines) - 1 if old_lines else self._old_start
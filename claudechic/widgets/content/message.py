@@ -120,19 +120,23 @@ class ChatMessage(Static):
     _DEBOUNCE_INTERVAL = 0.05  # 50ms - flush accumulated text at most 20x/sec
     _DEBOUNCE_MAX_CHARS = 200  # Flush immediately if buffer exceeds this
 
-    def __init__(self, content: str = "", is_agent: bool = False) -> None:
-        super().__init__()
+    def __init__(
+        self, content: str = "", is_agent: bool = False, classes: str | None = None
+    ) -> None:
+        super().__init__(classes=classes)
         self._initial_content = content.rstrip()  # Content to render in compose()
-        self._content = self._initial_content  # Full accumulated content
+        # Full accumulated content as chunks, joined lazily by get_raw_content()
+        self._chunks: list[str] = [self._initial_content]
         self._is_agent = is_agent
         self._stream = None  # Lazy-initialized MarkdownStream
-        self._pending_text = ""  # Accumulated text waiting to be flushed
+        self._pending: list[str] = []  # Accumulated text waiting to be flushed
+        self._pending_len = 0
         self._flush_timer = None  # Timer for debounced flush
         self._first_flush_done = False  # Track if first stream write has happened
 
     def _is_streaming(self) -> bool:
         """Check if we're actively streaming content."""
-        return bool(self._pending_text) or self._flush_timer is not None
+        return bool(self._pending) or self._flush_timer is not None
 
     def compose(self) -> ComposeResult:
         # Only render initial content - streaming content goes through MarkdownStream
@@ -161,11 +165,12 @@ class ChatMessage(Static):
         This reduces markdown parsing frequency during fast streaming while
         maintaining responsive updates.
         """
-        self._content += text
-        self._pending_text += text
+        self._chunks.append(text)
+        self._pending.append(text)
+        self._pending_len += len(text)
 
         # Flush immediately if we have a lot of pending text
-        if len(self._pending_text) >= self._DEBOUNCE_MAX_CHARS:
+        if self._pending_len >= self._DEBOUNCE_MAX_CHARS:
             self._flush_pending()
             return
 
@@ -182,7 +187,7 @@ class ChatMessage(Static):
             self._flush_timer.stop()
             self._flush_timer = None
 
-        if not self._pending_text:
+        if not self._pending:
             return
 
         stream = self._get_stream()
@@ -197,13 +202,14 @@ class ChatMessage(Static):
         # (handles race where append_content runs before compose)
         if not self._first_flush_done:
             self._first_flush_done = True
-            text_to_write = self._content[len(self._initial_content) :]
+            text_to_write = self.get_raw_content()[len(self._initial_content) :]
         else:
-            text_to_write = self._pending_text
+            text_to_write = "".join(self._pending)
 
         if text_to_write:
             self.call_later(stream.write, text_to_write)
-        self._pending_text = ""
+        self._pending.clear()
+        self._pending_len = 0
 
     def flush(self) -> None:
         """Flush any pending text and stop the stream on completion."""
@@ -216,7 +222,9 @@ class ChatMessage(Static):
 
     def get_raw_content(self) -> str:
         """Get raw content."""
-        return self._content
+        if len(self._chunks) > 1:
+            self._chunks[:] = ["".join(self._chunks)]
+        return self._chunks[0]
 
 
 class ChatAttachment(Button):
@@ -4,6 +4,7 @@ import json
 import logging
 import re
 from pathlib import Path
+from typing import Callable
 
 from rich.text import Text
 
@@ -36,6 +37,30 @@ SYSTEM_REMINDER_PATTERN = re.compile(
 )
 
 
+# Formatted header/input text keyed by (formatter, tool_use_id, cwd). Tool
+# widgets are rebuilt whenever a ChatView re-renders history (agent switch,
+# resume), and a tool use's input never changes for a given id.
+_FORMAT_CACHE: dict[tuple[Callable[..., str], str, Path | None], str] = {}
+_FORMAT_CACHE_MAX = 4096
+
+
+def _format_cached(
+    formatter: Callable[[str, dict, Path | None], str],
+    block: ToolUseBlock,
+    cwd: Path | None,
+) -> str:
+    """Call formatter(name, input, cwd), memoized per tool use id."""
+    if not block.id:
+        return formatter(block.name, block.input, cwd)
+    key = (formatter, block.id, cwd)
+    text = _FORMAT_CACHE.get(key)
+    if text is None:
+        if len(_FORMAT_CACHE) >= _FORMAT_CACHE_MAX:
+            _FORMAT_CACHE.clear()
+        text = _FORMAT_CACHE[key] = formatter(block.name, block.input, cwd)
+    return text
+
+
 def _extract_text_content(content: str | list) -> str:
     """Extract text from ToolResultBlock content (handles both str and MCP list format)."""
     # MCP format: [{"type": "text", "text": "..."}]
@@ -91,7 +116,7 @@ class ToolUseWidget(BaseToolWidget):
         self._initial_collapsed = collapsed
         self._cwd = cwd
         self._plan_path = plan_path  # For ExitPlanMode
-        self._header = format_tool_header(self.block.name, self.block.input, cwd)
+        self._header = _format_cached(format_tool_header, block, cwd)
 
     def set_plan_path(self, plan_path: Path | None) -> None:
         """Update plan path (for ExitPlanMode when path becomes available later)."""
@@ -145,17 +170,34 @@ class ToolUseWidget(BaseToolWidget):
                 with QuietCollapsible(title=self._header, collapsed=False):
                     yield from self._make_diff_content()
             return
-        # Other tools: use normal pattern
+        # Other tools: collapsed history replays (completed, so no set_result
+        # will follow) defer their body until first expanded
+        if self._initial_collapsed and self.result is True:
+            yield QuietCollapsible(
+                title=self._header,
+                collapsed=True,
+                content_factory=self._make_io_content,
+            )
+            return
         with QuietCollapsible(title=self._header, collapsed=self._initial_collapsed):
-            tool_input = format_tool_input(self.block.name, self.block.input, self._cwd)
-            # Bash uses "$ command" format with blank line separator
-            if self.block.name == ToolName.BASH:
-                yield Static(f"$ {tool_input}", id="tool-input", markup=False)
-                yield Static("", id="tool-separator")
-            else:
-                yield Static(tool_input, id="tool-input", markup=False)
-                yield Static("─" * 40, id="tool-separator")
-            yield Static("", id="tool-output", markup=False)
+            yield from self._make_io_content()
+
+    def _make_io_content(self) -> list[Static]:
+        """Factory for the tool input/output body."""
+        tool_input = _format_cached(format_tool_input, self.block, self._cwd)
+        # Bash uses "$ command" format with blank line separator
+        if self.block.name == ToolName.BASH:
+            widgets = [
+                Static(f"$ {tool_input}", id="tool-input", markup=False),
+                Static("", id="tool-separator"),
+            ]
+        else:
+            widgets = [
+                Static(tool_input, id="tool-input", markup=False),
+                Static("─" * 40, id="tool-separator"),
+            ]
+        widgets.append(Static("", id="tool-output", markup=False))
+        return widgets
 
     def stop_spinner(self) -> None:
         """Stop and remove the spinner."""
@@ -313,8 +355,7 @@ class TaskWidget(BaseToolWidget):
         try:
             content = self.query_one("#task-content", Static)
             if new_message or self._current_message is None:
-                self._current_message = ChatMessage("")
-                self._current_message.add_class("assistant-message")
+                self._current_message = ChatMessage("", classes="assistant-message")
                 if new_message:
                     self._current_message.add_class("after-tool")
                 content.mount(self._current_message)
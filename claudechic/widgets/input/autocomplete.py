@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from operator import itemgetter
+from typing import Callable
 
 from textual import on
 from textual.app import ComposeResult
@@ -98,6 +99,10 @@ class TextAreaAutoComplete(Widget):
 
     COMPONENT_CLASSES = {"autocomplete--highlight-match"}
 
+    # Debounce delays (seconds) before running shell / path searches
+    shell_debounce: float = 0.1
+    path_debounce: float = 0.15
+
     def __init__(
         self,
         target: TextArea | str,
@@ -217,12 +222,10 @@ class TextAreaAutoComplete(Widget):
 
         if self._mode == "shell":
             # Shell completion - debounce like path search
-            self._cancel_search_timer()
-            self._search_timer = self.set_timer(0.1, self._do_shell_search)
+            self._schedule_search(self.shell_debounce, self._do_shell_search)
         elif self._mode == "path":
             # Debounce file search - cancel pending timer, start new one
-            self._cancel_search_timer()
-            self._search_timer = self.set_timer(0.15, self._do_path_search)
+            self._schedule_search(self.path_debounce, self._do_path_search)
         elif self._mode == "slash":
             # Slash commands are instant (small list, no file I/O)
             self._cancel_search_timer()
@@ -231,6 +234,17 @@ class TextAreaAutoComplete(Widget):
             self._cancel_search_timer()
             self.action_hide()
 
+    def _schedule_search(self, delay: float, search: Callable[[], None]) -> None:
+        """Run a search after ``delay`` seconds, replacing any pending one.
+
+        A zero delay runs the search immediately rather than via a timer.
+        """
+        self._cancel_search_timer()
+        if delay > 0:
+            self._search_timer = self.set_timer(delay, search)
+        else:
+            search()
+
     def _cancel_search_timer(self) -> None:
         """Cancel any pending search timer."""
         if self._search_timer is not None:
@@ -2,14 +2,30 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import partial
+from operator import methodcaller
 from typing import TYPE_CHECKING, Callable
 
+from textual.widgets.text_area import Selection
+
 if TYPE_CHECKING:
     from textual.widgets import TextArea
 
 
+# Whitespace / non-whitespace boundaries for word-end scanning within a line
+_SPACE_RE = re.compile(r"\s")
+_NON_SPACE_RE = re.compile(r"\S")
+
+# Key sets checked on every NORMAL-mode keypress. ASCII digits only: count
+# digits go through int(), which rejects other Unicode digits.
+_DIGITS = frozenset("0123456789")
+_PENDING_MOTIONS = frozenset("fFtTr")  # f/F/t/T motions and r (replace)
+_OPERATORS = frozenset("dcy")
+
+
 class ViMode(Enum):
     """Vi editor modes."""
 
@@ -18,7 +34,7 @@ class ViMode(Enum):
     VISUAL = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class ViState:
     """State for vi-mode key handling."""
 
@@ -27,7 +43,7 @@ class ViState:
     pending_count: str = ""  # Accumulated count digits (e.g., "12" for 12j)
     pending_motion: str | None = None  # 'f', 't', 'F', 'T' waiting for char
     pending_g: bool = False  # Waiting for second char after 'g'
-    last_change: tuple[str, ...] | None = None  # For '.' repeat
+    last_change: Callable[[], None] | None = None  # Replays the change for '.'
     yank_buffer: str = ""  # Yanked text for p/P
 
     def reset_pending(self) -> None:
@@ -60,6 +76,15 @@ class ViHandler:
         "G": ("doc_end", False),
     }
 
+    # Single-step motions computed with the TextArea's navigator:
+    # motion name -> navigator method
+    _STEP_MOTIONS: dict[str, str] = {
+        "left": "get_location_left",
+        "right": "get_location_right",
+        "down": "get_location_below",
+        "up": "get_location_above",
+    }
+
     def __init__(self, text_area: TextArea) -> None:
         self.text_area = text_area
         self.state = ViState()
@@ -83,18 +108,20 @@ class ViHandler:
     def _do_motion(self, motion: str, count: int = 1) -> None:
         """Execute a motion, moving the cursor."""
         ta = self.text_area
-        if motion == "left":
-            for _ in range(count):
-                ta.action_cursor_left()
-        elif motion == "down":
-            for _ in range(count):
-                ta.action_cursor_down()
-        elif motion == "up":
+        step_name = self._STEP_MOTIONS.get(motion)
+        if step_name:
+            # Walk the navigator location by location and move the cursor
+            # once, rather than running a cursor action (and repaint) per step
+            step = getattr(ta.navigator, step_name)
+            location = ta.cursor_location
             for _ in range(count):
-                ta.action_cursor_up()
-        elif motion == "right":
-            for _ in range(count):
-                ta.action_cursor_right()
+                target = step(location)
+                if target == location:
+                    break  # Hit the edge of the document
+                location = target
+            # Like the cursor actions, only horizontal moves reset the
+            # remembered column
+            ta.move_cursor(location, record_width=motion in ("left", "right"))
         elif motion == "word_right":
             for _ in range(count):
                 ta.action_cursor_word_right()
@@ -115,8 +142,6 @@ class ViHandler:
 
     def _set_selection(self, start: tuple[int, int], end: tuple[int, int]) -> None:
         """Set text area selection using Selection class."""
-        from textual.widgets.text_area import Selection
-
         self.text_area.selection = Selection(start, end)
 
     def handle_key(self, key: str, character: str | None) -> bool:
@@ -186,63 +211,21 @@ class ViHandler:
             return True
 
         # Accumulate count digits
-        if (
-            character
-            and character.isdigit()
-            and (state.pending_count or character != "0")
-        ):
+        if character in _DIGITS and (state.pending_count or character != "0"):
             state.pending_count += character
             return True
 
-        # Mode switching
-        if character == "i":
-            self._set_mode(ViMode.INSERT)
-            state.reset_pending()
-            return True
-        if character == "I":
-            ta.action_cursor_line_start()
-            self._set_mode(ViMode.INSERT)
-            state.reset_pending()
-            return True
-        if character == "a":
-            # Move cursor right before entering insert mode
-            row, col = ta.cursor_location
-            line = ta.document.get_line(row)
-            if col < len(line):
-                ta.move_cursor((row, col + 1))
-            self._set_mode(ViMode.INSERT)
-            state.reset_pending()
-            return True
-        if character == "A":
-            ta.action_cursor_line_end()
-            self._set_mode(ViMode.INSERT)
-            state.reset_pending()
-            return True
-        if character == "o":
-            ta.action_cursor_line_end()
-            ta.insert("\n")
-            self._set_mode(ViMode.INSERT)
-            state.reset_pending()
-            return True
-        if character == "O":
-            ta.action_cursor_line_start()
-            ta.insert("\n")
-            ta.action_cursor_up()
-            self._set_mode(ViMode.INSERT)
-            state.reset_pending()
-            return True
-        if character == "v":
-            self._set_mode(ViMode.VISUAL)
-            # Start selection at current position
-            loc = ta.cursor_location
-            self._set_selection(loc, loc)
+        # Mode switching (takes precedence over a pending operator)
+        command = self._MODE_COMMANDS.get(character) if character else None
+        if command:
+            command(self)
             state.reset_pending()
             return True
 
         # Operators with pending operator (must come before navigation!)
         if state.pending_operator:
             # Allow count after operator (e.g., d3w)
-            if character and character.isdigit():
+            if character in _DIGITS:
                 state.pending_count += character
                 return True
             # 'g' sets pending_g, handled at top of _handle_normal_key
@@ -276,147 +259,31 @@ class ViHandler:
             return True
 
         # Arrow key navigation
-        if key == "left":
-            self._do_motion("left", state.get_count())
-            state.reset_pending()
-            return True
-        if key == "right":
-            self._do_motion("right", state.get_count())
-            state.reset_pending()
-            return True
-        if key == "down":
-            self._do_motion("down", state.get_count())
-            state.reset_pending()
-            return True
-        if key == "up":
-            self._do_motion("up", state.get_count())
-            state.reset_pending()
-            return True
-        if character == "^":
-            # First non-whitespace character
-            ta.action_cursor_line_start()
-            row, _ = ta.cursor_location
-            line = ta.document.get_line(row)
-            for i, ch in enumerate(line):
-                if not ch.isspace():
-                    ta.move_cursor((row, i))
-                    break
+        motion_name = self.ARROW_MOTIONS.get(key)
+        if motion_name:
+            self._do_motion(motion_name, state.get_count())
             state.reset_pending()
             return True
+
+        # Prefixes that wait for another key
         if character == "g":
             state.pending_g = True
             return True
-        if character == "G":
-            ta.move_cursor(ta.document.end)
-            state.reset_pending()
-            return True
-
-        # Character motions
-        if character is not None and character in "fFtT":
+        # Character motions; 'r' reuses pending_motion for its replacement char
+        if character in _PENDING_MOTIONS:
             state.pending_motion = character
             return True
-
         # Operators (d, c, y) - set pending operator
-        if character is not None and character in "dcy":
+        if character in _OPERATORS:
             state.pending_operator = character
             return True
 
-        # Standalone editing commands
-        if character == "x":
-            # Delete character under cursor
-            for _ in range(state.get_count()):
-                ta.action_delete_right()
-            state.last_change = ("x",)
-            state.reset_pending()
-            return True
-        if character == "X":
-            # Delete character before cursor (backspace)
-            for _ in range(state.get_count()):
-                ta.action_delete_left()
-            state.last_change = ("X",)
-            state.reset_pending()
-            return True
-        if character == "D":
-            # Delete to end of line
-            ta.action_delete_to_end_of_line()
-            state.last_change = ("D",)
-            state.reset_pending()
-            return True
-        if character == "C":
-            # Change to end of line
-            ta.action_delete_to_end_of_line()
-            self._set_mode(ViMode.INSERT)
-            state.last_change = ("C",)
-            state.reset_pending()
-            return True
-        if character == "s":
-            # Substitute character (delete and insert)
-            ta.action_delete_right()
-            self._set_mode(ViMode.INSERT)
-            state.last_change = ("s",)
-            state.reset_pending()
-            return True
-        if character == "S":
-            # Substitute line (clear and insert)
-            ta.action_cursor_line_start()
-            ta.action_delete_line()
-            self._set_mode(ViMode.INSERT)
-            state.last_change = ("S",)
-            state.reset_pending()
-            return True
-
-        # Paste
-        if character == "p":
-            if state.yank_buffer:
-                row, col = ta.cursor_location
-                line = ta.document.get_line(row)
-                # Paste after cursor
-                new_col = min(col + 1, len(line))
-                ta.move_cursor((row, new_col))
-                ta.insert(state.yank_buffer)
-            state.reset_pending()
-            return True
-        if character == "P":
-            if state.yank_buffer:
-                ta.insert(state.yank_buffer)
-            state.reset_pending()
-            return True
-
-        # Undo/redo
-        if character == "u":
-            ta.action_undo()
-            state.reset_pending()
-            return True
-        if key == "ctrl+r":
-            ta.action_redo()
-            state.reset_pending()
-            return True
-
-        # Repeat last change
-        if character == ".":
-            if state.last_change:
-                self._replay_change(state.last_change)
-            state.reset_pending()
-            return True
-
-        # Join lines
-        if character == "J":
-            row, _ = ta.cursor_location
-            lines = ta.text.split("\n")
-            if row < len(lines) - 1:
-                # Move to end of current line, delete newline, insert space
-                ta.action_cursor_line_end()
-                ta.action_delete_right()  # Delete the newline
-                # Add space if next line doesn't start with one
-                ta.insert(" ")
-            state.reset_pending()
-            return True
-
-        # Replace single character
-        if character == "r":
-            # Wait for next character to replace with
-            state.pending_motion = "r"  # Reuse pending_motion for this
-            return True
+        # Standalone commands (editing, paste, undo/redo, repeat, join)
+        command = (
+            self._NORMAL_COMMANDS.get(character) if character else None
+        ) or self._NORMAL_KEY_COMMANDS.get(key)
+        if command:
+            command(self)
 
         state.reset_pending()
         return True
@@ -430,36 +297,11 @@ class ViHandler:
         start = ta.selection.start
 
         # Navigation extends selection
-        if character == "h" or key == "left":
-            ta.action_cursor_left()
-            self._set_selection(start, ta.cursor_location)
-            return True
-        if character == "l" or key == "right":
-            ta.action_cursor_right()
-            self._set_selection(start, ta.cursor_location)
-            return True
-        if character == "j" or key == "down":
-            ta.action_cursor_down()
-            self._set_selection(start, ta.cursor_location)
-            return True
-        if character == "k" or key == "up":
-            ta.action_cursor_up()
-            self._set_selection(start, ta.cursor_location)
-            return True
-        if character == "w":
-            ta.action_cursor_word_right()
-            self._set_selection(start, ta.cursor_location)
-            return True
-        if character == "b":
-            ta.action_cursor_word_left()
-            self._set_selection(start, ta.cursor_location)
-            return True
-        if character == "$":
-            ta.action_cursor_line_end()
-            self._set_selection(start, ta.cursor_location)
-            return True
-        if character == "0":
-            ta.action_cursor_line_start()
+        motion = (
+            self._VISUAL_MOTIONS.get(character) if character else None
+        ) or self._VISUAL_MOTIONS.get(key)
+        if motion:
+            motion(ta)
             self._set_selection(start, ta.cursor_location)
             return True
 
@@ -468,18 +310,14 @@ class ViHandler:
 
         # Operators on selection
         if character == "d" or character == "x":
-            # Delete selection
-            selected = ta.selected_text
-            state.yank_buffer = selected
-            ta.delete(start, end)
+            # Delete selection; delete() hands back the removed text
+            state.yank_buffer = ta.delete(start, end).replaced_text
             self._set_mode(ViMode.NORMAL)
             state.reset_pending()
             return True
         if character == "c":
             # Change selection
-            selected = ta.selected_text
-            state.yank_buffer = selected
-            ta.delete(start, end)
+            state.yank_buffer = ta.delete(start, end).replaced_text
             self._set_mode(ViMode.INSERT)
             state.reset_pending()
             return True
@@ -494,34 +332,215 @@ class ViHandler:
 
         return True
 
-    def _move_to_word_end(self) -> None:
-        """Move cursor to end of current/next word."""
+    # Normal-mode commands, dispatched through the tables below. Pending
+    # state is reset by the caller after each one runs.
+
+    def _insert(self) -> None:
+        self._set_mode(ViMode.INSERT)
+
+    def _insert_line_start(self) -> None:
+        self.text_area.action_cursor_line_start()
+        self._set_mode(ViMode.INSERT)
+
+    def _append(self) -> None:
+        # Move cursor right before entering insert mode
         ta = self.text_area
-        text = ta.text
         row, col = ta.cursor_location
+        line = ta.document.get_line(row)
+        if col < len(line):
+            ta.move_cursor((row, col + 1))
+        self._set_mode(ViMode.INSERT)
+
+    def _append_line_end(self) -> None:
+        self.text_area.action_cursor_line_end()
+        self._set_mode(ViMode.INSERT)
+
+    def _open_below(self) -> None:
+        ta = self.text_area
+        ta.action_cursor_line_end()
+        ta.insert("\n")
+        self._set_mode(ViMode.INSERT)
+
+    def _open_above(self) -> None:
+        ta = self.text_area
+        ta.action_cursor_line_start()
+        ta.insert("\n")
+        ta.action_cursor_up()
+        self._set_mode(ViMode.INSERT)
+
+    def _visual(self) -> None:
+        self._set_mode(ViMode.VISUAL)
+        # Start selection at current position
+        loc = self.text_area.cursor_location
+        self._set_selection(loc, loc)
+
+    def _first_non_blank(self) -> None:
+        ta = self.text_area
+        ta.action_cursor_line_start()
+        row, _ = ta.cursor_location
+        line = ta.document.get_line(row)
+        stripped = line.lstrip()
+        # An all-blank line keeps the cursor at the line start
+        if stripped:
+            ta.move_cursor((row, len(line) - len(stripped)))
+
+    def _delete_char(self) -> None:
+        # Delete character under cursor
+        for _ in range(self.state.get_count()):
+            self.text_area.action_delete_right()
+        self.state.last_change = self.text_area.action_delete_right
+
+    def _delete_char_before(self) -> None:
+        # Delete character before cursor (backspace)
+        for _ in range(self.state.get_count()):
+            self.text_area.action_delete_left()
+        self.state.last_change = self.text_area.action_delete_left
+
+    def _delete_to_line_end(self) -> None:
+        self.text_area.action_delete_to_end_of_line()
+        self.state.last_change = self.text_area.action_delete_to_end_of_line
+
+    def _change_to_line_end(self) -> None:
+        self.text_area.action_delete_to_end_of_line()
+        self._set_mode(ViMode.INSERT)
+        self.state.last_change = self._change_to_line_end
+
+    def _substitute_char(self) -> None:
+        self.text_area.action_delete_right()
+        self._set_mode(ViMode.INSERT)
+        self.state.last_change = self._substitute_char
+
+    def _substitute_line(self) -> None:
+        ta = self.text_area
+        ta.action_cursor_line_start()
+        ta.action_delete_line()
+        self._set_mode(ViMode.INSERT)
+        self.state.last_change = self._substitute_line
+
+    def _paste_after(self) -> None:
+        ta = self.text_area
+        if self.state.yank_buffer:
+            row, col = ta.cursor_location
+            line = ta.document.get_line(row)
+            # Paste after cursor
+            new_col = min(col + 1, len(line))
+            ta.move_cursor((row, new_col))
+            ta.insert(self.state.yank_buffer)
+
+    def _paste_before(self) -> None:
+        if self.state.yank_buffer:
+            self.text_area.insert(self.state.yank_buffer)
+
+    def _undo(self) -> None:
+        self.text_area.action_undo()
+
+    def _redo(self) -> None:
+        self.text_area.action_redo()
+
+    def _repeat(self) -> None:
+        if self.state.last_change:
+            self.state.last_change()
+
+    def _join_lines(self) -> None:
+        ta = self.text_area
+        row, _ = ta.cursor_location
+        if row < ta.document.line_count - 1:
+            # Move to end of current line, delete newline, insert space
+            ta.action_cursor_line_end()
+            ta.action_delete_right()  # Delete the newline
+            # Add space if next line doesn't start with one
+            ta.insert(" ")
+
+    # Arrow keys in NORMAL mode: key -> motion name (counted)
+    ARROW_MOTIONS: dict[str, str] = {
+        "left": "left",
+        "right": "right",
+        "down": "down",
+        "up": "up",
+    }
+
+    # Keys switching mode, by character; checked before a pending operator
+    _MODE_COMMANDS: dict[str, Callable[[ViHandler], None]] = {
+        "i": _insert,
+        "I": _insert_line_start,
+        "a": _append,
+        "A": _append_line_end,
+        "o": _open_below,
+        "O": _open_above,
+        "v": _visual,
+    }
+
+    # Remaining NORMAL-mode commands, by character and by key name
+    _NORMAL_COMMANDS: dict[str, Callable[[ViHandler], None]] = {
+        "^": _first_non_blank,
+        "x": _delete_char,
+        "X": _delete_char_before,
+        "D": _delete_to_line_end,
+        "C": _change_to_line_end,
+        "s": _substitute_char,
+        "S": _substitute_line,
+        "p": _paste_after,
+        "P": _paste_before,
+        "u": _undo,
+        ".": _repeat,
+        "J": _join_lines,
+    }
+    _NORMAL_KEY_COMMANDS: dict[str, Callable[[ViHandler], None]] = {
+        "ctrl+r": _redo,
+    }
+
+    # VISUAL-mode selection motions, by character or key name
+    _VISUAL_MOTIONS: dict[str, Callable[[TextArea], None]] = {
+        "h": methodcaller("action_cursor_left"),
+        "left": methodcaller("action_cursor_left"),
+        "l": methodcaller("action_cursor_right"),
+        "right": methodcaller("action_cursor_right"),
+        "j": methodcaller("action_cursor_down"),
+        "down": methodcaller("action_cursor_down"),
+        "k": methodcaller("action_cursor_up"),
+        "up": methodcaller("action_cursor_up"),
+        "w": methodcaller("action_cursor_word_right"),
+        "b": methodcaller("action_cursor_word_left"),
+        "$": methodcaller("action_cursor_line_end"),
+        "0": methodcaller("action_cursor_line_start"),
+    }
+
+    def _move_to_word_end(self) -> None:
+        """Move cursor to end of current/next word.
 
-        # Convert to linear position
-        lines = text.split("\n")
-        pos = sum(len(lines[i]) + 1 for i in range(row)) + col
+        Scans the document line by line from the cursor, so the cost depends
+        on the lines crossed rather than the size of the whole text.
+        """
+        ta = self.text_area
+        document = ta.document
+        last_row = document.line_count - 1
+        row, col = ta.cursor_location
+        line = document.get_line(row)
 
         # Skip current word if on non-whitespace
-        while pos < len(text) and not text[pos].isspace():
-            pos += 1
-        # Skip whitespace
-        while pos < len(text) and text[pos].isspace():
-            pos += 1
+        match = _SPACE_RE.search(line, col)
+        col = match.start() if match else len(line)
+        # Skip whitespace, including line breaks
+        while (match := _NON_SPACE_RE.search(line, col)) is None:
+            if row == last_row:
+                col = len(line)
+                break
+            row += 1
+            line = document.get_line(row)
+            col = 0
+        else:
+            col = match.start()
         # Move to end of word
-        while pos < len(text) and not text[pos].isspace():
-            pos += 1
-        # Back up one to be at last char of word
-        if pos > 0:
-            pos -= 1
-
-        # Convert back to row, col
-        lines = text[:pos].split("\n")
-        new_row = len(lines) - 1
-        new_col = len(lines[-1]) if lines else 0
-        ta.move_cursor((new_row, new_col))
+        match = _SPACE_RE.search(line, col)
+        col = match.start() if match else len(line)
+        # Back up one to be at last char of word (which may be the line
+        # break ending the previous line)
+        if col > 0:
+            col -= 1
+        elif row > 0:
+            row -= 1
+            col = len(document.get_line(row))
+        ta.move_cursor((row, col))
 
     def _execute_char_motion(self, motion: str, char: str) -> None:
         """Execute f/F/t/T motion to character."""
@@ -565,8 +584,7 @@ class ViHandler:
         ta.action_cursor_line_end()
 
         # Include newline if not last line
-        lines = ta.text.split("\n")
-        if row < len(lines) - 1:
+        if row < ta.document.line_count - 1:
             ta.action_cursor_right()  # Include \n
 
         line_end = ta.cursor_location
@@ -580,16 +598,14 @@ class ViHandler:
         elif op == "d":
             # Delete line
             self._set_selection(line_start, line_end)
-            state.yank_buffer = ta.selected_text
-            ta.delete(line_start, line_end)
-            state.last_change = ("dd",)
+            state.yank_buffer = ta.delete(line_start, line_end).replaced_text
+            state.last_change = partial(self._execute_line_operator, "d")
         elif op == "c":
             # Change line (delete and enter insert mode)
             self._set_selection(line_start, line_end)
-            state.yank_buffer = ta.selected_text
-            ta.delete(line_start, line_end)
+            state.yank_buffer = ta.delete(line_start, line_end).replaced_text
             self._set_mode(ViMode.INSERT)
-            state.last_change = ("cc",)
+            state.last_change = partial(self._execute_line_operator, "c")
 
     def _execute_operator_motion(self, op: str, motion: str, count: int = 1) -> None:
         """Execute operator with motion (dw, cw, y$, d3w, etc.)."""
@@ -613,41 +629,10 @@ class ViHandler:
             ta.move_cursor(start)
         elif op == "d":
             self._set_selection(start, end)
-            state.yank_buffer = ta.selected_text
-            ta.delete(start, end)
-            state.last_change = ("d", motion)
+            state.yank_buffer = ta.delete(start, end).replaced_text
+            state.last_change = partial(self._execute_operator_motion, "d", motion)
         elif op == "c":
             self._set_selection(start, end)
-            state.yank_buffer = ta.selected_text
-            ta.delete(start, end)
-            self._set_mode(ViMode.INSERT)
-            state.last_change = ("c", motion)
-
-    def _replay_change(self, change: tuple[str, ...]) -> None:
-        """Replay a recorded change."""
-        ta = self.text_area
-
-        if change == ("x",):
-            ta.action_delete_right()
-        elif change == ("X",):
-            ta.action_delete_left()
-        elif change == ("D",):
-            ta.action_delete_to_end_of_line()
-        elif change == ("C",):
-            ta.action_delete_to_end_of_line()
-            self._set_mode(ViMode.INSERT)
-        elif change == ("s",):
-            ta.action_delete_right()
-            self._set_mode(ViMode.INSERT)
-        elif change == ("S",):
-            ta.action_cursor_line_start()
-            ta.action_delete_line()
+            state.yank_buffer = ta.delete(start, end).replaced_text
             self._set_mode(ViMode.INSERT)
-        elif change == ("dd",):
-            self._execute_line_operator("d")
-        elif change == ("cc",):
-            self._execute_line_operator("c")
-        elif len(change) == 2 and change[0] == "d":
-            self._execute_operator_motion("d", change[1])
-        elif len(change) == 2 and change[0] == "c":
-            self._execute_operator_motion("c", change[1])
+            state.last_change = partial(self._execute_operator_motion, "c", motion)
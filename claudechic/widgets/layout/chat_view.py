@@ -14,7 +14,7 @@ from claudechic.agent import (
     ToolUse,
     TextBlock,
 )
-from claudechic.config import CONFIG
+from claudechic import config
 from claudechic.enums import AgentStatus, ToolName
 from claudechic.formatting import format_agent_prompt
 from claudechic.widgets.content.message import (
@@ -42,12 +42,6 @@ COLLAPSE_BY_DEFAULT = {
     ToolName.SKILL,
 }
 
-# How many recent tools to keep expanded (0 = collapse all)
-RECENT_TOOLS_EXPANDED = CONFIG.get("recent-tools-expanded", 2)
-
-# How many recent turns to render fully (older turns collapsed into single widget)
-RECENT_TURNS_FULL = CONFIG.get("recent-turns-full", 3)
-
 
 class ChatView(AutoHideScroll):
     """A scrollable view that renders chat messages and handles streaming.
@@ -71,6 +65,12 @@ class ChatView(AutoHideScroll):
         super().__init__(*args, **kwargs)
         self._agent: Agent | None = None
 
+        # Read here, not at import, so importing this module doesn't load config.
+        # How many recent tools to keep expanded (0 = collapse all)
+        self._recent_tools_expanded: int = config.CONFIG.get("recent-tools-expanded", 2)
+        # How many recent turns to render fully (older turns collapsed into single widget)
+        self._recent_turns_full: int = config.CONFIG.get("recent-turns-full", 3)
+
         # Widget tracking
         self._current_response: ChatMessage | None = None
         self._pending_tool_widgets: dict[
@@ -128,7 +128,7 @@ class ChatView(AutoHideScroll):
     def _render_full(self) -> None:
         """Fully re-render the chat view from agent.messages.
 
-        Old turns (beyond RECENT_TURNS_FULL) are collapsed into lightweight
+        Old turns (beyond the recent-turns-full setting) are collapsed into lightweight
         CollapsedTurn widgets that lazy-load full content on expand.
 
         Uses mount_all() to batch all widget mounts into a single CSS recalculation.
@@ -159,8 +159,8 @@ class ChatView(AutoHideScroll):
         if current_user is not None:
             turns.append((current_user, None))
 
-        # Determine which turns to collapse (all but last RECENT_TURNS_FULL)
-        collapse_before = max(0, len(turns) - RECENT_TURNS_FULL)
+        # Determine which turns to collapse (all but the last few)
+        collapse_before = max(0, len(turns) - self._recent_turns_full)
 
         # Count tools in recent turns for tool collapse threshold
         recent_tools = sum(
@@ -168,7 +168,7 @@ class ChatView(AutoHideScroll):
             for _, asst in turns[collapse_before:]
             if asst is not None
         )
-        collapse_threshold = recent_tools - RECENT_TOOLS_EXPANDED
+        collapse_threshold = recent_tools - self._recent_tools_expanded
         tool_index = 0
 
         # Build widgets
@@ -226,8 +226,11 @@ class ChatView(AutoHideScroll):
     ) -> list[Widget]:
         """Create widgets for a user message (without mounting)."""
         widgets: list[Widget] = []
-        msg = ChatMessage(text, is_agent=is_agent)
-        msg.add_class("agent-message" if is_agent else "user-message")
+        msg = ChatMessage(
+            text,
+            is_agent=is_agent,
+            classes="agent-message" if is_agent else "user-message",
+        )
         widgets.append(msg)
 
         for i, img in enumerate(images):
@@ -253,8 +256,7 @@ class ChatView(AutoHideScroll):
         pending_tools = self._agent.pending_tools if self._agent else {}
         for block in content.blocks:
             if isinstance(block, TextBlock):
-                msg = ChatMessage(block.text)
-                msg.add_class("assistant-message")
+                msg = ChatMessage(block.text, classes="assistant-message")
                 widgets.append(msg)
             elif isinstance(block, ToolUse):
                 # Route nested tools to their parent TaskWidget
@@ -370,8 +372,7 @@ class ChatView(AutoHideScroll):
 
         # Create new message widget if needed
         if new_message or not self._current_response:
-            self._current_response = ChatMessage("")
-            self._current_response.add_class("assistant-message")
+            self._current_response = ChatMessage("", classes="assistant-message")
             self.mount(self._current_response)
 
         self._current_response.append_content(text)
@@ -401,12 +402,12 @@ class ChatView(AutoHideScroll):
             return
 
         # Auto-collapse old tools
-        while len(self._recent_tools) >= RECENT_TOOLS_EXPANDED > 0:
+        while len(self._recent_tools) >= self._recent_tools_expanded > 0:
             old = self._recent_tools.pop(0)
             old.collapse()
 
         # Create widget based on tool type
-        collapsed = RECENT_TOOLS_EXPANDED == 0 or tool.name in COLLAPSE_BY_DEFAULT
+        collapsed = self._recent_tools_expanded == 0 or tool.name in COLLAPSE_BY_DEFAULT
         cwd = self._agent.cwd if self._agent else None
         if tool.name == ToolName.TASK:
             widget = TaskWidget(block, collapsed=collapsed, cwd=cwd)
@@ -488,8 +489,7 @@ class ChatView(AutoHideScroll):
         self, text: str, images: list[ImageAttachment], is_agent: bool = False
     ) -> None:
         """Mount a user message widget with optional image attachments."""
-        for widget in self._create_user_widgets(text, images, is_agent):
-            self.mount(widget)
+        self.mount_all(self._create_user_widgets(text, images, is_agent))
 
     def _hide_thinking(self) -> None:
         """Remove thinking indicator if present."""
@@ -1,6 +1,9 @@
 """Custom footer widget."""
 
 import asyncio
+import os
+import time
+from pathlib import Path
 
 from textual.app import ComposeResult
 from textual.message import Message
@@ -55,6 +58,9 @@ class ViModeLabel(Static):
 
     def set_mode(self, mode: ViMode | None, enabled: bool = True) -> None:
         """Update the displayed mode."""
+        # Mode notifications repeat often; leave the label alone if unchanged
+        if mode == self._mode and enabled == self._enabled:
+            return
         self._mode = mode
         self._enabled = enabled
 
@@ -75,21 +81,73 @@ class ViModeLabel(Static):
             self.add_class("vi-visual")
 
 
+# Branch lookups are cached per directory; the branch only changes on checkout
+_BRANCH_CACHE_TTL = 2.0  # seconds
+_branch_cache: dict[str, tuple[str, float]] = {}
+
+
+def _read_head_branch(cwd: str) -> str | None:
+    """Read the current branch straight from the repo's HEAD file.
+
+    Handles linked worktrees, where .git is a file pointing at the real git
+    dir. Returns None when the answer needs git itself (no repo found, or an
+    unusual HEAD).
+    """
+    path = Path(cwd).absolute()
+    for directory in (path, *path.parents):
+        dot_git = directory / ".git"
+        try:
+            if dot_git.is_dir():
+                git_dir = dot_git
+            elif dot_git.is_file():
+                # Linked worktree: "gitdir: <path>"
+                content = dot_git.read_text().strip()
+                if not content.startswith("gitdir: "):
+                    return None
+                git_dir = directory / content.removeprefix("gitdir: ")
+            else:
+                continue
+            head = (git_dir / "HEAD").read_text().strip()
+        except OSError:
+            return None
+        if head.startswith("ref: refs/heads/"):
+            branch = head.removeprefix("ref: refs/heads/")
+            # Reftable repos keep a placeholder here; ask git instead
+            return None if branch == ".invalid" else branch
+        # A bare commit hash means a detached HEAD
+        return "detached" if "/" not in head and " " not in head else None
+    return None
+
+
 async def get_git_branch(cwd: str | None = None) -> str:
-    """Get current git branch name (async)."""
-    try:
-        proc = await asyncio.create_subprocess_exec(
-            "git",
-            "branch",
-            "--show-current",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=cwd,
-        )
-        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=1)
-        return stdout.decode().strip() or "detached"
-    except Exception:
-        return ""
+    """Get current git branch name (async).
+
+    Reads .git/HEAD directly when possible and only spawns git as a
+    fallback; results are cached per directory for a couple of seconds.
+    """
+    key = cwd or os.getcwd()
+    now = time.monotonic()
+    cached = _branch_cache.get(key)
+    if cached and now - cached[1] < _BRANCH_CACHE_TTL:
+        return cached[0]
+
+    branch = _read_head_branch(key)
+    if branch is None:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "git",
+                "branch",
+                "--show-current",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=cwd,
+            )
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=1)
+            branch = stdout.decode().strip() or "detached"
+        except Exception:
+            return ""
+    _branch_cache[key] = (branch, now)
+    return branch
 
 
 class StatusFooter(Static):
@@ -100,6 +158,16 @@ class StatusFooter(Static):
     model = reactive("")
     branch = reactive("")
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Subwidgets are kept from compose() so watchers skip the DOM query;
+        # they stay None until then
+        self._vi_mode_label: ViModeLabel | None = None
+        self._model_label: ModelLabel | None = None
+        self._permission_mode_label: PermissionModeLabel | None = None
+        self._process_indicator: ProcessIndicator | None = None
+        self._branch_label: Static | None = None
+
     async def on_mount(self) -> None:
         self.branch = await get_git_branch()
 
@@ -108,34 +176,39 @@ class StatusFooter(Static):
         self.branch = await get_git_branch(cwd)
 
     def compose(self) -> ComposeResult:
+        self._vi_mode_label = ViModeLabel("", id="vi-mode-label", classes="hidden")
+        self._model_label = ModelLabel("", id="model-label", classes="footer-label")
+        self._permission_mode_label = PermissionModeLabel(
+            "Auto-edit: off", id="permission-mode-label", classes="footer-label"
+        )
+        self._process_indicator = ProcessIndicator(
+            id="process-indicator", classes="hidden"
+        )
+        self._branch_label = Static("", id="branch-label", classes="footer-label")
         with Horizontal(id="footer-content"):
-            yield ViModeLabel("", id="vi-mode-label", classes="hidden")
-            yield ModelLabel("", id="model-label", classes="footer-label")
+            yield self._vi_mode_label
+            yield self._model_label
             yield Static("·", classes="footer-sep")
-            yield PermissionModeLabel(
-                "Auto-edit: off", id="permission-mode-label", classes="footer-label"
-            )
+            yield self._permission_mode_label
             yield Static("", id="footer-spacer")
-            yield ProcessIndicator(id="process-indicator", classes="hidden")
+            yield self._process_indicator
             yield ContextBar(id="context-bar")
             yield CPUBar(id="cpu-bar")
-            yield Static("", id="branch-label", classes="footer-label")
+            yield self._branch_label
 
     def watch_branch(self, value: str) -> None:
         """Update branch label when branch changes."""
-        if label := self.query_one_optional("#branch-label", Static):
+        if label := self._branch_label:
             label.update(f"⎇ {value}" if value else "")
 
     def watch_model(self, value: str) -> None:
         """Update model label when model changes."""
-        if label := self.query_one_optional("#model-label", ModelLabel):
+        if label := self._model_label:
             label.update(value if value else "")
 
     def watch_permission_mode(self, value: str) -> None:
         """Update permission mode label when setting changes."""
-        if label := self.query_one_optional(
-            "#permission-mode-label", PermissionModeLabel
-        ):
+        if label := self._permission_mode_label:
             if value == "planSwarm":
                 label.update("Plan swarm")
                 label.set_class(False, "active")
@@ -159,10 +232,10 @@ class StatusFooter(Static):
 
     def update_processes(self, processes: list[BackgroundProcess]) -> None:
         """Update the process indicator."""
-        if indicator := self.query_one_optional("#process-indicator", ProcessIndicator):
+        if indicator := self._process_indicator:
             indicator.update_processes(processes)
 
     def update_vi_mode(self, mode: ViMode | None, enabled: bool = True) -> None:
         """Update the vi-mode indicator."""
-        if label := self.query_one_optional("#vi-mode-label", ViModeLabel):
+        if label := self._vi_mode_label:
             label.set_mode(mode, enabled)
@@ -1,5 +1,10 @@
 """Resource indicator widgets - context bar, CPU monitor, and process indicator."""
 
+import asyncio
+import functools
+import threading
+import time
+
 import psutil
 
 from textual.app import RenderResult
@@ -28,21 +33,62 @@ class IndicatorWidget(Static):
     can_focus = True
 
 
+class _CpuSampler:
+    """One psutil.Process shared by every CPUBar.
+
+    cpu_percent() measures against the previous call on the same object, so
+    independent samplers (or concurrent threads) skew each other's readings.
+    Calls closer together than MIN_INTERVAL return the cached value.
+    """
+
+    MIN_INTERVAL = 1.5  # seconds
+
+    def __init__(self) -> None:
+        self._process = psutil.Process()
+        self._process.cpu_percent()  # Prime the measurement
+        self._lock = threading.Lock()
+        self.last_value = 0.0
+        self.last_ts = time.monotonic()
+
+    def sample(self) -> float:
+        """Return CPU usage percent, re-measuring at most every MIN_INTERVAL."""
+        with self._lock:
+            now = time.monotonic()
+            if now - self.last_ts >= self.MIN_INTERVAL:
+                self.last_value = self._process.cpu_percent()
+                self.last_ts = now
+            return self.last_value
+
+
+@functools.cache
+def _cpu_sampler() -> _CpuSampler:
+    """Process-wide sampler, created on first use."""
+    return _CpuSampler()
+
+
 class CPUBar(IndicatorWidget):
     """Display CPU usage. Click to show profiling stats."""
 
     cpu_pct = reactive(0.0)
 
     def on_mount(self) -> None:
-        self._process = psutil.Process()
-        self._process.cpu_percent()  # Prime the measurement
-        self.set_interval(2.0, self._update_cpu)
+        self._sampler = _cpu_sampler()
+        self._timer = self.set_interval(2.0, self._update_cpu)
+
+    def on_show(self) -> None:
+        self._timer.resume()
+
+    def on_hide(self) -> None:
+        # Nothing to poll for while the bar can't be seen
+        self._timer.pause()
 
     @profile
-    def _update_cpu(self) -> None:
+    async def _update_cpu(self) -> None:
         try:
+            # Sample in a worker thread; reading /proc/<pid>/stat can stall
+            # the event loop on busy systems
             with timed("CPUBar.psutil_call"):
-                pct = self._process.cpu_percent()
+                pct = await asyncio.to_thread(self._sampler.sample)
             # Only update if rounded value changed (avoids unnecessary refresh)
             if round(pct) != round(self.cpu_pct):
                 with timed("CPUBar.reactive_set"):
@@ -67,16 +113,58 @@ class CPUBar(IndicatorWidget):
         self.app.push_screen(ProfileModal())
 
 
+@functools.lru_cache(maxsize=128)
+def _build_context_bar(
+    filled: int, pct_str: str, bar_width: int, colors: tuple[str, str, str, str]
+) -> Text:
+    """Build the context bar; colors is (fill, empty, text, empty_text).
+
+    Pure in its arguments, which take few distinct values, so repaints with
+    unchanged usage and theme reuse the same Text.
+    """
+    fill_color, empty_color, text_color, empty_text = colors
+    start = (bar_width - len(pct_str)) // 2
+    end = start + len(pct_str)
+    # Cells only change style at the fill and text boundaries, so emit one
+    # span per run between them rather than one per cell
+    cuts = sorted({0, start, end, min(filled, bar_width), bar_width})
+    result = Text()
+    for lo, hi in zip(cuts, cuts[1:]):
+        bg = fill_color if lo < filled else empty_color
+        if start <= lo < end:
+            fg = text_color if lo < filled else empty_text
+            result.append(pct_str[lo - start : hi - start], style=f"{fg} on {bg}")
+        else:
+            result.append(" " * (hi - lo), style=f"on {bg}")
+    return result
+
+
 class ContextBar(IndicatorWidget):
     """Display context usage as a progress bar. Click to run /context."""
 
-    tokens = reactive(0)
-    max_tokens = reactive(MAX_CONTEXT_TOKENS)
+    # Token counts change on every streamed update but the bar only shows a
+    # coarse bucket of them, so they don't repaint directly; _bucket does,
+    # and reactives skip the refresh when it's assigned an equal value
+    tokens = reactive(0, repaint=False)
+    max_tokens = reactive(MAX_CONTEXT_TOKENS, repaint=False)
+    _bucket: reactive[tuple[int, int, str]] = reactive((0, 0, "0%"))
 
-    def render(self) -> RenderResult:
+    BAR_WIDTH = 10
+
+    def _visible_state(self) -> tuple[int, int, str]:
+        """(filled cells, color band 0-2, percentage text) for current usage."""
         pct = min(self.tokens / self.max_tokens, 1.0) if self.max_tokens else 0
-        bar_width = 10
-        filled = int(pct * bar_width)
+        band = 0 if pct < 0.5 else 1 if pct < 0.8 else 2
+        return int(pct * self.BAR_WIDTH), band, f"{pct * 100:.0f}%"
+
+    def watch_tokens(self) -> None:
+        self._bucket = self._visible_state()
+
+    def watch_max_tokens(self) -> None:
+        self._bucket = self._visible_state()
+
+    def render(self) -> RenderResult:
+        filled, band, pct_str = self._visible_state()
         # Fill color intensifies as context usage grows
         theme = self.app.current_theme
         warning = theme.warning if isinstance(theme.warning, str) else "#aaaa00"
@@ -86,24 +174,15 @@ class ContextBar(IndicatorWidget):
             low_fill, empty_color, empty_text = "#666666", "#333333", "white"
         else:
             low_fill, empty_color, empty_text = "#999999", "#dddddd", "black"
-        if pct < 0.5:
+        if band == 0:
             fill_color, text_color = low_fill, empty_text
-        elif pct < 0.8:
+        elif band == 1:
             fill_color, text_color = warning, "black"
         else:
             fill_color, text_color = error, "white"
-        # Center percentage text in bar
-        pct_str = f"{pct * 100:.0f}%"
-        start = (bar_width - len(pct_str)) // 2
-        result = Text()
-        for i in range(bar_width):
-            bg = fill_color if i < filled else empty_color
-            if start <= i < start + len(pct_str):
-                fg = text_color if i < filled else empty_text
-                result.append(pct_str[i - start], style=f"{fg} on {bg}")
-            else:
-                result.append(" ", style=f"on {bg}")
-        return result
+        colors = (fill_color, empty_color, text_color, empty_text)
+        # Copy so the cached Text is never mutated downstream
+        return _build_context_bar(filled, pct_str, self.BAR_WIDTH, colors).copy()
 
     def on_click(self, event) -> None:
         """Run /context command on click."""
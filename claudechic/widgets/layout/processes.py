@@ -24,14 +24,17 @@ class ProcessItem(Static):
 
     def __init__(self, process: BackgroundProcess) -> None:
         super().__init__()
+        self.set_process(process)
+
+    def set_process(self, process: BackgroundProcess) -> None:
+        """Point the item at a (possibly new) process and rebuild its text."""
         self.process = process
+        # Assembled once per process; render() is called on every repaint
+        self._text = Text.assemble(("● ", "yellow"), (process.short_command, ""))
+        self.refresh()
 
     def render(self) -> Text:
-        # Show running indicator and truncated command
-        cmd = self.process.command
-        if len(cmd) > 20:
-            cmd = cmd[:19] + "…"
-        return Text.assemble(("● ", "yellow"), (cmd, ""))
+        return self._text
 
     def on_click(self, event) -> None:  # noqa: ARG002
         """Show process detail modal."""
@@ -69,6 +72,7 @@ class ProcessPanel(Widget):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._processes: list[BackgroundProcess] = []
+        self._items: dict[int, ProcessItem] = {}
 
     @property
     def process_count(self) -> int:
@@ -86,12 +90,27 @@ class ProcessPanel(Widget):
             self.add_class("hidden")
 
     def update_processes(self, processes: list[BackgroundProcess]) -> None:
-        """Replace processes with new list. Visibility controlled by set_visible()."""
+        """Replace processes with new list. Visibility controlled by set_visible().
+
+        Items are matched by PID, so a poll that returns the same processes
+        leaves the DOM untouched; only exited processes are removed and new
+        ones mounted.
+        """
         self._processes = processes
-        # Remove old items
-        for item in self.query(ProcessItem):
-            item.remove()
+        live = {proc.pid for proc in processes}
+        for pid in self._items.keys() - live:
+            self._items.pop(pid).remove()
 
-        # Add new items
+        previous: ProcessItem | None = None
         for proc in processes:
-            self.mount(ProcessItem(proc))
+            item = self._items.get(proc.pid)
+            if item is None:
+                item = self._items[proc.pid] = ProcessItem(proc)
+                # Keep list order: new items go after the previous process
+                if previous is None:
+                    self.mount(item, after=self.query_one(".process-title"))
+                else:
+                    self.mount(item, after=previous)
+            elif item.process is not proc:
+                item.set_process(proc)
+            previous = item
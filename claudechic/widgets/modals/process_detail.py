@@ -2,6 +2,7 @@
 
 import os
 import signal
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 
@@ -65,11 +66,10 @@ def _read_output_tail(output_file: str, max_lines: int = 50) -> str | None:
         path = Path(output_file)
         if not path.exists():
             return None
-        text = path.read_text()
-        lines = text.splitlines()
-        if len(lines) > max_lines:
-            lines = lines[-max_lines:]
-        return "\n".join(lines)
+        # Stream through the file keeping only the tail; output can be large
+        with path.open() as f:
+            lines = deque(f, maxlen=max_lines)
+        return "\n".join(line.rstrip("\n") for line in lines)
     except Exception:
         return None
 
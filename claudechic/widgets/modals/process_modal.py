@@ -13,10 +13,12 @@ from textual.widgets import Static, Button
 from claudechic.processes import BackgroundProcess
 
 
-def _format_duration(start_time: datetime) -> str:
-    """Format duration since start_time."""
-    delta = datetime.now() - start_time
-    secs = int(delta.total_seconds())
+def _format_duration(start_time: datetime, now: datetime | None = None) -> str:
+    """Format duration since start_time (until now, defaulting to the clock)."""
+    delta = (now or datetime.now()) - start_time
+    # Whole seconds straight from the timedelta fields; total_seconds() would
+    # go through a float only to be truncated
+    secs = max(0, delta.days * 86400 + delta.seconds)
     if secs < 60:
         return f"{secs}s"
     elif secs < 3600:
@@ -39,11 +41,12 @@ def _get_process_table(processes: list[BackgroundProcess]) -> Table:
     table.add_column("Command")
     table.add_column("Duration", justify="right", style="dim")
 
+    # One clock read for the whole table
+    now = datetime.now()
     for proc in processes:
-        cmd = proc.command
-        if len(cmd) > 50:
-            cmd = cmd[:47] + "..."
-        table.add_row(str(proc.pid), cmd, _format_duration(proc.start_time))
+        table.add_row(
+            str(proc.pid), proc.table_command, _format_duration(proc.start_time, now)
+        )
 
     return table
 
@@ -24,6 +24,7 @@ class AutoHideScroll(VerticalScroll):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._tailing = True
+        self._scroll_pending = False  # A coalesced scroll_end is queued
 
     def _is_near_bottom(self) -> bool:
         """Check if scroll position is near the bottom."""
@@ -80,6 +81,17 @@ class AutoHideScroll(VerticalScroll):
         super()._on_scroll_to(message)
 
     def scroll_if_tailing(self) -> None:
-        """Scroll to end if in tailing mode."""
+        """Scroll to end if in tailing mode.
+
+        Calls are coalesced so a burst of streamed chunks between refreshes
+        produces a single scroll rather than one queued scroll per chunk.
+        """
+        if self._tailing and not self._scroll_pending:
+            self._scroll_pending = True
+            self.call_after_refresh(self._scroll_end_if_tailing)
+
+    def _scroll_end_if_tailing(self) -> None:
+        """Run the coalesced scroll once layout has caught up."""
+        self._scroll_pending = False
         if self._tailing:
-            self.scroll_end(animate=False)
+            self.scroll_end(animate=False, immediate=True)
@@ -5,6 +5,12 @@ from textual.app import ComposeResult
 from textual.widget import Widget
 from textual.widgets import Static
 
+_MODEL_RE = re.compile(r"\*\*Model:\*\*\s*(\S+)")
+_TOKENS_RE = re.compile(r"\*\*Tokens:\*\*\s*([\d.]+)k?\s*/\s*([\d.]+)k")
+_CATEGORY_ROW_RE = re.compile(
+    r"\|\s*([^|]+?)\s*\|\s*([\d.]+)(k?)\s*\|\s*([\d.]+)%\s*\|"
+)
+
 
 def parse_context_markdown(content: str) -> dict:
     """Parse context markdown into structured data."""
@@ -16,12 +22,12 @@ def parse_context_markdown(content: str) -> dict:
     }
 
     # Parse model line: **Model:** claude-opus-4-5-20251101
-    model_match = re.search(r"\*\*Model:\*\*\s*(\S+)", content)
+    model_match = _MODEL_RE.search(content)
     if model_match:
         data["model"] = model_match.group(1)
 
     # Parse tokens line: **Tokens:** 18.4k / 200.0k (9%)
-    tokens_match = re.search(r"\*\*Tokens:\*\*\s*([\d.]+)k?\s*/\s*([\d.]+)k", content)
+    tokens_match = _TOKENS_RE.search(content)
     if tokens_match:
         used_str, total_str = tokens_match.groups()
         data["tokens_used"] = int(float(used_str) * 1000)
@@ -29,9 +35,7 @@ def parse_context_markdown(content: str) -> dict:
 
     # Parse category rows from markdown table
     # | System prompt | 2.9k | 1.5% |
-    for match in re.finditer(
-        r"\|\s*([^|]+?)\s*\|\s*([\d.]+)(k?)\s*\|\s*([\d.]+)%\s*\|", content
-    ):
+    for match in _CATEGORY_ROW_RE.finditer(content):
         name, tokens_raw, suffix, pct_str = match.groups()
         name = name.strip()
         if name in ("Category", "-------"):
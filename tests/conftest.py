@@ -6,7 +6,8 @@ import json
 from typing import Any
 
 import pytest
-from contextlib import ExitStack
+import pytest_asyncio
+from contextlib import ExitStack, contextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from claudechic.features.roborev.models import ReviewJob
@@ -27,26 +28,20 @@ async def wait_for_workers(app):
 async def submit_command(app, pilot, command: str):
     """Submit a command, handling autocomplete properly.
 
-    When setting input text directly, autocomplete may activate.
-    This helper hides it before submitting to ensure the command goes through.
+    When setting input text directly, autocomplete may activate. Submitting
+    before the single pause means the text-change handler that would show
+    it hasn't run yet, so the command goes through.
     """
     from claudechic.widgets import ChatInput
 
     input_widget = app.query_one("#input", ChatInput)
     input_widget.text = command
-    await pilot.pause()
-
-    # Hide autocomplete if it's showing (triggered by / or @)
-    if input_widget._autocomplete and input_widget._autocomplete.display:
-        input_widget._autocomplete.action_hide()
-        await pilot.pause()
-
     input_widget.action_submit()
     await pilot.pause()
 
 
-@pytest.fixture
-def mock_sdk():
+@contextmanager
+def _patched_sdk():
     """Patch SDK to not actually connect.
 
     Patches both app.py and agent.py imports since agents create their own clients.
@@ -74,7 +69,7 @@ def mock_sdk():
     with ExitStack() as stack:
         # Disable analytics to avoid httpx AsyncClient connection leaks
         stack.enter_context(
-            patch.dict("claudechic.analytics.CONFIG", {"analytics": {"enabled": False}})
+            patch.dict("claudechic.config.CONFIG", {"analytics": {"enabled": False}})
         )
         stack.enter_context(
             patch("claudechic.app.ClaudeSDKClient", return_value=mock_client)
@@ -91,6 +86,30 @@ def mock_sdk():
         yield mock_client
 
 
+@pytest.fixture
+def mock_sdk():
+    """Patch SDK to not actually connect (see _patched_sdk)."""
+    with _patched_sdk() as mock_client:
+        yield mock_client
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_app():
+    """One running ChatApp (and its pilot) shared by every test in a module.
+
+    Starting the app dominates the runtime of tests that only drive the
+    input, so those tests reuse this instance and reset the state they touch.
+    Tests using it must run on the module event loop:
+    ``@pytest.mark.asyncio(loop_scope="module")``.
+    """
+    from claudechic import ChatApp
+
+    with _patched_sdk():
+        app = ChatApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            yield app, pilot
+
+
 @pytest.fixture
 def mock_roborev_output():
     """Mock roborev CLI subprocess output.
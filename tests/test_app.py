@@ -28,3 +28,42 @@ def test_image_attachment_message_building():
     assert content[1]["source"]["type"] == "base64"
     assert content[1]["source"]["media_type"] == "image/png"
     assert content[1]["source"]["data"] == test_data
+
+
+async def test_agent_manager_worktree_lookup():
+    """Worktree lookups follow agents being opened and closed."""
+    from claude_agent_sdk import ClaudeAgentOptions
+
+    from claudechic.agent_manager import AgentManager
+
+    mgr = AgentManager(lambda **kw: ClaudeAgentOptions())
+    main = mgr.create_unconnected("main", Path.cwd())
+    first = mgr.create_unconnected("feat", Path.cwd(), worktree="feat")
+    second = mgr.create_unconnected("feat-2", Path.cwd(), worktree="feat")
+
+    assert mgr.find_main() is main
+    assert mgr.find_by_worktree("feat") is first
+    assert mgr.find_by_worktree("other") is None
+
+    await mgr.close(first.id)
+    assert mgr.find_by_worktree("feat") is second
+    await mgr.close(second.id)
+    assert mgr.find_by_worktree("feat") is None
+
+
+def test_process_watcher_backoff():
+    """Process polling backs off while idle and resets on change."""
+    from datetime import datetime
+
+    from claudechic.processes import BackgroundProcess, ProcessWatcher
+
+    watcher = ProcessWatcher(interval=2.0, max_interval=5.0, factor=2.0)
+    assert watcher.next_delay([]) == 2.0
+    assert watcher.next_delay([]) == 4.0
+    assert watcher.next_delay([]) == 5.0
+
+    proc = BackgroundProcess(pid=1, command="sleep 30", start_time=datetime.now())
+    assert watcher.next_delay([proc]) == 2.0
+    assert watcher.next_delay([proc]) == 4.0
+    assert watcher.reset() is True
+    assert watcher.reset() is False
@@ -246,7 +246,7 @@ async def test_double_ctrl_c_quits(mock_sdk):
         # Just verify the mechanism exists
         import time
 
-        assert time.time() - app._last_quit_time < 2.0
+        assert time.monotonic() - app._last_quit_time < 2.0
 
 
 @pytest.mark.asyncio
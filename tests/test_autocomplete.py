@@ -1,136 +1,147 @@
 """Tests for autocomplete widget."""
 
 import pytest
-from pathlib import Path
+import pytest_asyncio
 
-from claudechic import ChatApp
 from claudechic.widgets import ChatInput, TextAreaAutoComplete
 
 
-@pytest.mark.asyncio
-async def test_slash_command_autocomplete(mock_sdk, tmp_path: Path):
+@pytest_asyncio.fixture(loop_scope="module")
+async def chat(shared_app, monkeypatch):
+    """The module's shared app, with input and autocomplete state reset.
+
+    Search debounces are zeroed so a single ``pilot.pause()`` runs them.
+    """
+    app, pilot = shared_app
+    input_widget = app.query_one(ChatInput)
+    autocomplete = app.query_one(TextAreaAutoComplete)
+    monkeypatch.setattr(autocomplete, "shell_debounce", 0.0)
+    monkeypatch.setattr(autocomplete, "path_debounce", 0.0)
+    input_widget._history = []
+    input_widget._history_index = -1
+    app.file_index.files = []
+    autocomplete._suppressed = False
+    input_widget.text = ""
+    autocomplete._cancel_search_timer()
+    autocomplete.action_hide()
+    await pilot.pause()
+    return app, pilot
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_slash_command_autocomplete(chat):
     """Test slash command autocomplete shows and filters correctly."""
-    app = ChatApp()
-    async with app.run_test(size=(80, 24)) as pilot:
-        input_widget = app.query_one(ChatInput)
-        autocomplete = app.query_one(TextAreaAutoComplete)
+    app, pilot = chat
+    input_widget = app.query_one(ChatInput)
+    autocomplete = app.query_one(TextAreaAutoComplete)
 
-        # Initially hidden
-        assert autocomplete.styles.display == "none"
+    # Initially hidden
+    assert autocomplete.styles.display == "none"
 
-        # Type / to trigger autocomplete
-        input_widget.text = "/"
-        await pilot.pause()
+    # Type / to trigger autocomplete
+    input_widget.text = "/"
+    await pilot.pause()
 
-        # Should show commands (includes SDK commands, so count varies)
-        assert autocomplete.styles.display == "block"
-        assert autocomplete.option_list.option_count >= 4  # At least local commands
+    # Should show commands (includes SDK commands, so count varies)
+    assert autocomplete.styles.display == "block"
+    assert autocomplete.option_list.option_count >= 4  # At least local commands
 
-        # Type more to filter - /worktree should narrow it down
-        input_widget.text = "/worktree"
-        await pilot.pause()
+    # Type more to filter - /worktree should narrow it down
+    input_widget.text = "/worktree"
+    await pilot.pause()
 
-        # Should show worktree commands (base, finish, cleanup, plus any worktree branches)
-        assert autocomplete.option_list.option_count >= 3
+    # Should show worktree commands (base, finish, cleanup, plus any worktree branches)
+    assert autocomplete.option_list.option_count >= 3
 
-        # Type even more to narrow to just one
-        # Note: "/worktree f" fuzzy matches "/worktree side-files" too
-        input_widget.text = "/worktree fin"
-        await pilot.pause()
+    # Type even more to narrow to just one
+    # Note: "/worktree f" fuzzy matches "/worktree side-files" too
+    input_widget.text = "/worktree fin"
+    await pilot.pause()
 
-        # Should show just /worktree finish
-        assert autocomplete.option_list.option_count == 1
+    # Should show just /worktree finish
+    assert autocomplete.option_list.option_count == 1
 
-        # Clear input - should hide
-        input_widget.text = ""
-        await pilot.pause()
+    # Clear input - should hide
+    input_widget.text = ""
+    await pilot.pause()
 
-        assert autocomplete.styles.display == "none"
+    assert autocomplete.styles.display == "none"
 
 
-@pytest.mark.asyncio
-async def test_path_autocomplete(mock_sdk, tmp_path: Path):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_path_autocomplete(chat):
     """Test file path autocomplete with @ trigger."""
-    import asyncio
+    app, pilot = chat
+    autocomplete = app.query_one(TextAreaAutoComplete)
+    # Override app's file index to use test files
+    assert app.file_index is not None
+    app.file_index.files = ["file1.txt", "file2.txt", "subdir/other.py"]
 
-    app = ChatApp()
-    async with app.run_test(size=(80, 24)) as pilot:
-        autocomplete = app.query_one(TextAreaAutoComplete)
-        # Override app's file index to use test files
-        assert app.file_index is not None
-        app.file_index.files = ["file1.txt", "file2.txt", "subdir/other.py"]
+    input_widget = app.query_one(ChatInput)
 
-        input_widget = app.query_one(ChatInput)
+    # Type @ to start path completion
+    input_widget.text = "@"
+    await pilot.pause()
 
-        # Type @ to start path completion
-        input_widget.text = "@"
-        # Wait for debounce (150ms) + buffer
-        await asyncio.sleep(0.2)
-        await pilot.pause()
+    # Should show files from index
+    assert autocomplete.styles.display == "block"
+    assert autocomplete.option_list.option_count == 3
 
-        # Should show files from index
-        assert autocomplete.styles.display == "block"
-        assert autocomplete.option_list.option_count == 3
+    # Filter to just .txt files
+    input_widget.text = "@file"
+    await pilot.pause()
 
-        # Filter to just .txt files
-        input_widget.text = "@file"
-        # Wait for debounce
-        await asyncio.sleep(0.2)
-        await pilot.pause()
+    assert autocomplete.option_list.option_count == 2
 
-        assert autocomplete.option_list.option_count == 2
 
-
-@pytest.mark.asyncio
-async def test_tab_completion(mock_sdk):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_tab_completion(chat):
     """Test that Tab completes the selection."""
-    app = ChatApp()
-    async with app.run_test(size=(80, 24)) as pilot:
-        input_widget = app.query_one(ChatInput)
-        autocomplete = app.query_one(TextAreaAutoComplete)
+    app, pilot = chat
+    input_widget = app.query_one(ChatInput)
+    autocomplete = app.query_one(TextAreaAutoComplete)
 
-        # Type enough to filter to a unique match
-        # Note: "/worktree f" fuzzy matches "/worktree side-files" too
-        input_widget.text = "/worktree fin"
-        await pilot.pause()
+    # Type enough to filter to a unique match
+    # Note: "/worktree f" fuzzy matches "/worktree side-files" too
+    input_widget.text = "/worktree fin"
+    await pilot.pause()
 
-        # Should show just /worktree finish
-        assert autocomplete.option_list.option_count == 1
+    # Should show just /worktree finish
+    assert autocomplete.option_list.option_count == 1
 
-        # Press Tab to complete
-        await pilot.press("tab")
-        await pilot.pause()
+    # Press Tab to complete
+    await pilot.press("tab")
+    await pilot.pause()
 
-        # Input should now be /worktree finish
-        assert input_widget.text == "/worktree finish"
-        assert autocomplete.styles.display == "none"
+    # Input should now be /worktree finish
+    assert input_widget.text == "/worktree finish"
+    assert autocomplete.styles.display == "none"
 
 
-@pytest.mark.asyncio
-async def test_suppression_on_history_nav(mock_sdk):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_suppression_on_history_nav(chat):
     """Test that autocomplete is suppressed when navigating history."""
-    app = ChatApp()
-    async with app.run_test(size=(80, 24)) as pilot:
-        input_widget = app.query_one(ChatInput)
-        autocomplete = app.query_one(TextAreaAutoComplete)
-
-        # Add history entry starting with /
-        input_widget._history = ["/agent test"]
-        input_widget._history_index = -1
-
-        # Navigate up to history
-        await pilot.press("up")
-        await pilot.pause()
-
-        # Input should have history content
-        assert input_widget.text == "/agent test"
-        # Autocomplete should be suppressed (hidden despite matching /)
-        assert autocomplete.styles.display == "none"
-        assert autocomplete._suppressed is True
-
-        # Type something to clear suppression
-        await pilot.press("x")
-        await pilot.pause()
-
-        # Suppression should be cleared
-        assert autocomplete._suppressed is False
+    app, pilot = chat
+    input_widget = app.query_one(ChatInput)
+    autocomplete = app.query_one(TextAreaAutoComplete)
+
+    # Add history entry starting with /
+    input_widget._history = ["/agent test"]
+    input_widget._history_index = -1
+
+    # Navigate up to history
+    await pilot.press("up")
+    await pilot.pause()
+
+    # Input should have history content
+    assert input_widget.text == "/agent test"
+    # Autocomplete should be suppressed (hidden despite matching /)
+    assert autocomplete.styles.display == "none"
+    assert autocomplete._suppressed is True
+
+    # Type something to clear suppression
+    await pilot.press("x")
+    await pilot.pause()
+
+    # Suppression should be cleared
+    assert autocomplete._suppressed is False
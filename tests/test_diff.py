@@ -1,43 +1,11 @@
 """Tests for git diff feature."""
 
 from claudechic.features.diff.git import (
-    _parse_name_status,
     _parse_hunks,
-    _merge_diff_content,
-    FileChange,
+    _parse_diff,
 )
 
 
-class TestParseNameStatus:
-    def test_modified_file(self):
-        output = "M\tpath/to/file.py"
-        changes = _parse_name_status(output)
-        assert len(changes) == 1
-        assert changes[0].path == "path/to/file.py"
-        assert changes[0].status == "modified"
-
-    def test_added_file(self):
-        output = "A\tnew_file.py"
-        changes = _parse_name_status(output)
-        assert len(changes) == 1
-        assert changes[0].status == "added"
-
-    def test_deleted_file(self):
-        output = "D\told_file.py"
-        changes = _parse_name_status(output)
-        assert len(changes) == 1
-        assert changes[0].status == "deleted"
-
-    def test_multiple_files(self):
-        output = "M\tfile1.py\nA\tfile2.py\nD\tfile3.py"
-        changes = _parse_name_status(output)
-        assert len(changes) == 3
-
-    def test_empty_output(self):
-        changes = _parse_name_status("")
-        assert len(changes) == 0
-
-
 class TestParseHunks:
     def test_single_hunk(self):
         diff_section = """a/file.py b/file.py
@@ -93,21 +61,113 @@ index abc123..def456 100644
         assert "deleted line" not in hunks[0].new_lines
 
 
-class TestMergeDiffContent:
-    def test_merges_hunks_to_files(self):
-        files = [
-            FileChange(path="file.py", status="modified", hunks=[]),
+class TestParseDiff:
+    def test_status_from_section_headers(self):
+        diff_text = """diff --git a/mod.py b/mod.py
+index abc..def 100644
+--- a/mod.py
++++ b/mod.py
+@@ -1 +1 @@
+-old
++new
+diff --git a/added.py b/added.py
+new file mode 100644
+index 0000000..abc
+--- /dev/null
++++ b/added.py
+@@ -0,0 +1 @@
++hello
+diff --git a/gone.py b/gone.py
+deleted file mode 100644
+index abc..0000000
+--- a/gone.py
++++ /dev/null
+@@ -1 +0,0 @@
+-bye
+diff --git a/old_name.py b/new_name.py
+similarity index 100%
+rename from old_name.py
+rename to new_name.py
+"""
+        files = _parse_diff(diff_text)
+        assert [(f.path, f.status) for f in files] == [
+            ("mod.py", "modified"),
+            ("added.py", "added"),
+            ("gone.py", "deleted"),
+            ("new_name.py", "renamed"),
         ]
-        diff_text = """diff --git a/file.py b/file.py
+        assert files[0].hunks[0].new_lines == ["new"]
+        assert files[3].hunks == []
+
+    def test_nested_paths_containing_b_slash(self):
+        diff_text = """diff --git a/lib/foo.py b/lib/foo.py
 index abc..def 100644
---- a/file.py
-+++ b/file.py
-@@ -1,2 +1,3 @@
- old
+--- a/lib/foo.py
++++ b/lib/foo.py
+@@ -1 +1 @@
+-old
++new
+diff --git a/web/db/x.py b/web/db/x.py
+new file mode 100644
+--- /dev/null
++++ b/web/db/x.py
+@@ -0,0 +1 @@
++hello
+"""
+        files = _parse_diff(diff_text)
+        assert [(f.path, f.status) for f in files] == [
+            ("lib/foo.py", "modified"),
+            ("web/db/x.py", "added"),
+        ]
+
+    def test_path_from_file_lines(self):
+        # The ---/+++ lines win over the diff --git header
+        diff_text = """diff --git a/db/old.py b/db/old.py
+deleted file mode 100644
+--- a/db/old.py
++++ /dev/null
+@@ -1 +0,0 @@
+-bye
+diff --git a/a b/c.py b/a b/c.py
+--- a/a b/c.py\t
++++ b/a b/c.py\t
+@@ -1 +1 @@
+-x
++y
+"""
+        files = _parse_diff(diff_text)
+        assert [(f.path, f.status) for f in files] == [
+            ("db/old.py", "deleted"),
+            ("a b/c.py", "modified"),
+        ]
+
+    def test_quoted_paths(self):
+        # git C-quotes non-ASCII and special-character paths
+        diff_text = r"""diff --git "a/caf\303\251.txt" "b/caf\303\251.txt"
+index abc..def 100644
+--- "a/caf\303\251.txt"
++++ "b/caf\303\251.txt"
+@@ -1 +1 @@
+-old
 +new
- end
+diff --git a/lib/plain.py "b/lib/\303\274n\303\257.py"
+similarity index 100%
+rename from lib/plain.py
+rename to "lib/\303\274n\303\257.py"
+diff --git "a/we\"ird.txt" "b/we\"ird.txt"
+new file mode 100644
+--- /dev/null
++++ "b/we\"ird.txt"
+@@ -0,0 +1 @@
++hi
 """
-        result = _merge_diff_content(files, diff_text)
-        assert len(result) == 1
-        assert len(result[0].hunks) == 1
-        assert "new" in result[0].hunks[0].new_lines
+        files = _parse_diff(diff_text)
+        assert [(f.path, f.status) for f in files] == [
+            ("café.txt", "modified"),
+            ("lib/ünï.py", "renamed"),
+            ('we"ird.txt', "added"),
+        ]
+        assert files[0].hunks[0].new_lines == ["new"]
+
+    def test_empty_output(self):
+        assert _parse_diff("") == []
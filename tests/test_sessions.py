@@ -1,6 +1,8 @@
 """Tests for session management."""
 
+import json
 import os
+from datetime import datetime, timezone
 from pathlib import Path
 
 
@@ -22,3 +24,207 @@ def test_project_key_encoding():
     # Path with multiple dots
     path = Path("/home/user/.config/.hidden")
     assert encode_project_key(path) == "-home-user--config--hidden"
+
+
+def test_is_valid_uuid():
+    """Session stems must be full UUIDs; agent-* and near-misses are rejected."""
+    from claudechic.sessions import is_valid_uuid
+
+    assert is_valid_uuid("0a1b2c3d-4e5f-6789-abcd-ef0123456789")
+    assert is_valid_uuid("0A1B2C3D-4E5F-6789-ABCD-EF0123456789")
+    assert not is_valid_uuid("agent-0a1b2c3d")
+    assert not is_valid_uuid("0a1b2c3d-4e5f-6789-abcd-ef0123456789\n")
+    assert not is_valid_uuid("0a1b2c3d-4e5f-6789-abcd-ef012345678g")
+    assert not is_valid_uuid("0a1b2c3d4e5f-6789-abcd-ef0123456789-")
+    assert not is_valid_uuid("")
+    assert not is_valid_uuid("0a1b2c3d-4e5f-6789-abcd-ef01_3456789")
+    assert not is_valid_uuid("0a1b2c3d-4e5f-6789-abcd-0xf123456789")
+    assert not is_valid_uuid("0a1b2c3d-4e5f-6789-abcd--f0123456789")
+
+
+def _write_jsonl(path: Path, entries: list[dict]) -> None:
+    """Write entries the way Claude Code does (compact JSON, one per line)."""
+    path.write_text(
+        "".join(json.dumps(e, separators=(",", ":")) + "\n" for e in entries)
+    )
+
+
+def test_extract_session_info(tmp_path):
+    """Title falls back to the first real user message; meta entries aren't counted."""
+    from claudechic.sessions import _extract_session_info
+
+    f = tmp_path / "session.jsonl"
+    _write_jsonl(
+        f,
+        [
+            {
+                "type": "user",
+                "isMeta": True,
+                "message": {"content": "caveat"},
+                "timestamp": "2025-01-01T00:00:00.000Z",
+            },
+            {
+                "type": "user",
+                "message": {"content": "<command-name>/clear</command-name>"},
+                "timestamp": "2025-01-01T00:00:01.000Z",
+            },
+            {
+                "type": "user",
+                "message": {"content": [{"type": "text", "text": "fix\nthe bug"}]},
+                "timestamp": "2025-01-01T00:00:02.000Z",
+            },
+            {
+                "type": "assistant",
+                "message": {"content": [{"type": "text", "text": "ok"}]},
+                "timestamp": "2025-01-01T00:00:03.000Z",
+            },
+        ],
+    )
+    title, msg_count, last_ts = _extract_session_info(f)
+    assert title == "fix the bug"
+    assert msg_count == 2
+    assert last_ts == datetime(2025, 1, 1, 0, 0, 3, tzinfo=timezone.utc).timestamp()
+
+    # Progress entries embed sub-agent entries and snapshots nest timestamps;
+    # only top-level fields count, even when the last entry is large
+    _write_jsonl(
+        f,
+        [
+            {
+                "type": "user",
+                "message": {"content": "hello"},
+                "timestamp": "2025-01-01T00:00:00.000Z",
+            },
+            {
+                "type": "progress",
+                "data": {
+                    "message": {
+                        "type": "user",
+                        "message": {"content": "sub-agent prompt"},
+                        "timestamp": "2025-01-02T00:00:00.000Z",
+                    }
+                },
+            },
+            {
+                "type": "progress",
+                "data": {"message": {"type": "user", "message": {"content": "x"}}},
+                "timestamp": "2025-01-01T00:00:05.000Z",
+            },
+            {
+                "type": "file-history-snapshot",
+                "snapshot": {
+                    "timestamp": "2025-01-03T00:00:00.000Z",
+                    "pad": "x" * 40000,
+                },
+            },
+        ],
+    )
+    title, msg_count, last_ts = _extract_session_info(f)
+    assert (title, msg_count) == ("hello", 1)
+    assert last_ts == datetime(2025, 1, 1, 0, 0, 5, tzinfo=timezone.utc).timestamp()
+
+    # A summary entry takes precedence over the first message
+    _write_jsonl(f, [{"type": "summary", "summary": "Bug hunt"}])
+    assert _extract_session_info(f) == ("Bug hunt", 0, 0)
+
+    f.write_bytes(b"")
+    assert _extract_session_info(f) == ("", 0, 0)
+
+
+async def test_get_recent_sessions(tmp_path, monkeypatch):
+    """Lists UUID sessions with messages, newest first; skips empty/agent files."""
+    from claudechic import sessions
+
+    monkeypatch.setattr(sessions, "get_project_sessions_dir", lambda cwd=None: tmp_path)
+
+    old_id = "00000000-0000-0000-0000-000000000001"
+    new_id = "00000000-0000-0000-0000-000000000002"
+    for session_id, ts in ((old_id, "2025-01-01"), (new_id, "2025-02-01")):
+        _write_jsonl(
+            tmp_path / f"{session_id}.jsonl",
+            [
+                {
+                    "type": "user",
+                    "message": {"content": f"hello {ts}"},
+                    "timestamp": f"{ts}T00:00:00.000Z",
+                }
+            ],
+        )
+    (tmp_path / "00000000-0000-0000-0000-000000000003.jsonl").write_bytes(b"")
+    _write_jsonl(tmp_path / "agent-abc.jsonl", [{"type": "user"}])
+
+    result = await sessions.get_recent_sessions()
+    assert [(sid, title, count) for sid, title, _, count in result] == [
+        (new_id, "hello 2025-02-01", 1),
+        (old_id, "hello 2025-01-01", 1),
+    ]
+    assert [s[0] for s in await sessions.get_recent_sessions(search="01-01")] == [
+        old_id
+    ]
+
+
+async def test_load_session_messages(tmp_path, monkeypatch):
+    """Loads user text, assistant text and tool uses; skips slash commands."""
+    from claudechic import sessions
+
+    monkeypatch.setattr(sessions, "get_project_sessions_dir", lambda cwd=None: tmp_path)
+    session_id = "00000000-0000-0000-0000-000000000001"
+    _write_jsonl(
+        tmp_path / f"{session_id}.jsonl",
+        [
+            {"type": "user", "message": {"content": "/clear"}},
+            {"type": "user", "message": {"content": "read it"}},
+            {"type": "progress", "data": {}},
+            {
+                "type": "assistant",
+                "message": {
+                    "content": [
+                        {"type": "text", "text": "Reading"},
+                        {
+                            "type": "tool_use",
+                            "id": "t1",
+                            "name": "Read",
+                            "input": {"file_path": "a.py"},
+                        },
+                    ]
+                },
+            },
+        ],
+    )
+
+    assert await sessions.load_session_messages(session_id) == [
+        {"type": "user", "content": "read it"},
+        {"type": "assistant", "content": "Reading"},
+        {
+            "type": "tool_use",
+            "name": "Read",
+            "input": {"file_path": "a.py"},
+            "id": "t1",
+        },
+    ]
+
+
+async def test_get_context_from_session(tmp_path, monkeypatch):
+    """Context tokens come from the last usage block, ignoring trailing entries."""
+    from claudechic import sessions
+
+    monkeypatch.setattr(sessions, "get_project_sessions_dir", lambda cwd=None: tmp_path)
+    session_id = "00000000-0000-0000-0000-000000000001"
+    usage = {
+        "input_tokens": 5,
+        "cache_creation_input_tokens": 100,
+        "cache_read_input_tokens": 1000,
+        "output_tokens": 7,
+    }
+    _write_jsonl(
+        tmp_path / f"{session_id}.jsonl",
+        [
+            {"type": "assistant", "message": {"usage": {"input_tokens": 1}}},
+            {"type": "assistant", "message": {"usage": usage}},
+            {"type": "user", "message": {"content": 'mentions "usage" in text'}},
+            {"type": "progress", "data": {}},
+        ],
+    )
+
+    assert await sessions.get_context_from_session(session_id) == 1105
+    assert await sessions.get_context_from_session("missing") is None
@@ -20,7 +20,7 @@ def test_chic_light_theme_is_light():
 
 def test_load_custom_themes_empty_config():
     """No themes defined returns empty list."""
-    with patch("claudechic.theme.CONFIG", {}):
+    with patch("claudechic.config.CONFIG", {}):
         themes = load_custom_themes()
         assert themes == []
 
@@ -42,7 +42,7 @@ def test_load_custom_themes_from_config():
             }
         }
     }
-    with patch("claudechic.theme.CONFIG", config):
+    with patch("claudechic.config.CONFIG", config):
         themes = load_custom_themes()
         assert len(themes) == 1
         assert themes[0].name == "moonfly"
@@ -59,7 +59,7 @@ def test_load_custom_themes_uses_defaults():
             }
         }
     }
-    with patch("claudechic.theme.CONFIG", config):
+    with patch("claudechic.config.CONFIG", config):
         themes = load_custom_themes()
         assert len(themes) == 1
         assert themes[0].name == "minimal"
@@ -75,7 +75,7 @@ def test_load_custom_themes_skips_invalid():
             "invalid": "not a dict",
         }
     }
-    with patch("claudechic.theme.CONFIG", config):
+    with patch("claudechic.config.CONFIG", config):
         themes = load_custom_themes()
         assert len(themes) == 1
         assert themes[0].name == "valid"
@@ -35,6 +35,7 @@ def text_area():
         0, (cursor_pos[0][0], 0)
     )
     ta.document.end = (10, 0)
+    ta.document.line_count = 3
     ta.document.get_line.return_value = "hello world"
     ta.text = "hello world\nline two\nline three"
     ta.selected_text = "text"
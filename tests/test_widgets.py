@@ -18,6 +18,7 @@ from claudechic.widgets import (
     ModelPrompt,
     StatusFooter,
     ContextBar,
+    CPUBar,
 )
 from claudechic.widgets.content.todo import TodoItem
 from claudechic.widgets.layout.processes import ProcessItem
@@ -364,6 +365,50 @@ async def test_context_bar_rendering():
         assert "90%" in rendered.plain  # type: ignore[union-attr]
 
 
+@pytest.mark.asyncio
+async def test_context_bar_repaints_only_on_visible_change():
+    """Token updates that don't change the bar don't repaint it."""
+    app = WidgetTestApp(lambda: ContextBar(id="ctx"))
+    async with app.run_test() as pilot:
+        bar = app.query_one(ContextBar)
+        refreshes = 0
+        original_refresh = bar.refresh
+
+        def counting_refresh(*args, **kwargs):
+            nonlocal refreshes
+            refreshes += 1
+            return original_refresh(*args, **kwargs)
+
+        bar.refresh = counting_refresh  # type: ignore[method-assign]
+        bar.max_tokens = 200000
+        bar.tokens = 100
+        bar.tokens = 200
+        await pilot.pause()
+        assert refreshes == 0
+
+        bar.tokens = 30000
+        await pilot.pause()
+        assert refreshes == 1
+        assert bar._bucket == (1, 0, "15%")
+
+
+@pytest.mark.asyncio
+async def test_cpu_bar_pauses_when_hidden():
+    """CPUBar stops polling while hidden and resumes when shown."""
+    app = WidgetTestApp(lambda: CPUBar(id="cpu"))
+    async with app.run_test() as pilot:
+        bar = app.query_one(CPUBar)
+        assert bar._timer._active.is_set()
+
+        bar.display = False
+        await pilot.pause()
+        assert not bar._timer._active.is_set()
+
+        bar.display = True
+        await pilot.pause()
+        assert bar._timer._active.is_set()
+
+
 @pytest.mark.asyncio
 async def test_todo_panel_updates():
     """TodoPanel displays and updates todos."""
@@ -751,3 +796,52 @@ async def test_tool_use_widget_edit_lazy_diff():
         # DiffWidget should now exist
         diffs = widget.query(DiffWidget)
         assert len(diffs) == 1
+
+
+@pytest.mark.asyncio
+async def test_tool_use_widget_history_lazy_body():
+    """Collapsed, completed (history) tools defer input/output until expanded."""
+    from claude_agent_sdk import ToolUseBlock
+
+    from claudechic.widgets.content.tools import ToolUseWidget
+    from claudechic.widgets.primitives.collapsible import QuietCollapsible
+
+    block = ToolUseBlock(id="test-bash", name="Bash", input={"command": "ls -la"})
+
+    class TestApp(App):
+        def compose(self):
+            yield ToolUseWidget(block, collapsed=True, completed=True)
+
+    app = TestApp()
+    async with app.run_test() as pilot:
+        widget = app.query_one(ToolUseWidget)
+        assert len(widget.query("#tool-input")) == 0
+
+        widget.query_one(QuietCollapsible).collapsed = False
+        await pilot.pause()
+
+        tool_input = widget.query_one("#tool-input", Static)
+        assert str(tool_input.render()) == "$ ls -la"
+
+
+def test_read_head_branch(tmp_path):
+    """Footer branch is read from HEAD, including linked worktrees."""
+    from claudechic.widgets.layout.footer import _read_head_branch
+
+    repo = tmp_path / "repo"
+    (repo / ".git").mkdir(parents=True)
+    (repo / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+    (repo / "src").mkdir()
+    assert _read_head_branch(str(repo / "src")) == "main"
+
+    # Linked worktree: .git is a file pointing at the worktree's git dir
+    wt_git = repo / ".git" / "worktrees" / "feature"
+    wt_git.mkdir(parents=True)
+    (wt_git / "HEAD").write_text("ref: refs/heads/feature\n")
+    worktree = tmp_path / "worktree"
+    worktree.mkdir()
+    (worktree / ".git").write_text(f"gitdir: {wt_git}\n")
+    assert _read_head_branch(str(worktree)) == "feature"
+
+    (repo / ".git" / "HEAD").write_text("0123456789abcdef0123456789abcdef01234567\n")
+    assert _read_head_branch(str(repo)) == "detached"